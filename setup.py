@@ -47,6 +47,8 @@ CONSOLE_SCRIPTS = [
     "veros-copy-setup = veros.cli.veros_copy_setup:cli",
     "veros-resubmit = veros.cli.veros_resubmit:cli",
     "veros-create-mask = veros.cli.veros_create_mask:cli",
+    "veros-warmup = veros.cli.veros_warmup:cli",
+    "veros-plan-decomposition = veros.cli.veros_plan_decomposition:cli",
 ]
 
 PACKAGE_DATA = ["setups/*/assets.json", "setups/*/*.npy", "setups/*/*.png"]
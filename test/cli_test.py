@@ -74,3 +74,32 @@ def test_import_isolation(tmpdir):
 
     # make sure using the CLI does not initialize MPI
     assert "mpi4py" not in imported_modules
+
+
+def test_veros_warmup(runner, tmpdir):
+    from veros import runtime_settings
+
+    if runtime_settings.backend != "jax":
+        pytest.skip("compilation cache requires JAX")
+
+    setup_dir = os.path.join(tmpdir, "acc")
+    cache_dir = os.path.join(tmpdir, "cache")
+
+    result = runner.invoke(veros.cli.veros_copy_setup.cli, ["acc", "--to", setup_dir])
+    assert result.exit_code == 0
+
+    # runtime settings are locked after import, so this needs a fresh process
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import veros.cli; veros.cli.veros.cli()",
+            "warmup",
+            os.path.join(setup_dir, "acc.py"),
+            "--cache-dir",
+            cache_dir,
+        ],
+        check=True,
+    )
+
+    assert os.listdir(os.path.join(cache_dir, "jax"))
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+
+def test_plan_decomposition():
+    from veros.decomposition import (
+        plan_decomposition,
+        get_uniform_decomposition,
+        get_block_loads,
+        get_wet_cell_counts,
+        get_imbalance,
+    )
+
+    nx, ny, nz = 60, 40, 10
+    kbot = np.zeros((nx, ny), dtype="int")
+    # basin in one corner with a deep trench
+    kbot[5:40, 3:30] = 4
+    kbot[10:15, 3:30] = 1
+
+    weights = get_wet_cell_counts(kbot, nz)
+    uniform = get_uniform_decomposition(nx, ny, (3, 2))
+    planned = plan_decomposition(kbot, nz, (3, 2))
+
+    planned.validate(nx, ny, (3, 2))
+
+    planned_loads = get_block_loads(weights, planned)
+    assert planned_loads.sum() == weights.sum()
+    assert get_imbalance(planned_loads) < get_imbalance(get_block_loads(weights, uniform))
+    assert get_imbalance(planned_loads) < 1.2
+
+
+def test_invalid_decomposition():
+    from veros.decomposition import Decomposition
+
+    with pytest.raises(ValueError):
+        Decomposition(30, 42, (2, 2), (0, 1, 30), (0, 21, 42)).validate(30, 42, (2, 2))
+
+    with pytest.raises(ValueError):
+        Decomposition(30, 42, (2, 2), (0, 15, 30), (0, 21, 42)).validate(30, 42, (3, 2))
@@ -0,0 +1,26 @@
+import numpy as np
+
+
+def test_fused_gsw_state():
+    from veros.core.density import gsw
+
+    rng = np.random.default_rng(17)
+    shape = (8, 9, 10)
+    sa = rng.uniform(0, 42, shape)
+    ct = rng.uniform(-20, 32, shape)
+    p = np.linspace(5, 5500, shape[-1])
+
+    rho, prho, rho_shifted, Hd, dHdT, dHdS = gsw.gsw_state(sa, ct, p, True)
+
+    np.testing.assert_allclose(rho, gsw.gsw_rho(sa, ct, p), rtol=1e-14)
+    np.testing.assert_allclose(prho, gsw.gsw_rho(sa, ct, 0.0), rtol=1e-14)
+    np.testing.assert_allclose(rho_shifted, gsw.gsw_rho(sa[..., 1:], ct[..., 1:], p[:-1]), rtol=1e-14)
+
+    for res, reference in (
+        (Hd, gsw.gsw_dyn_enthalpy(sa, ct, p)),
+        (dHdT, gsw.gsw_dHdT(sa, ct, p)),
+        (dHdS, gsw.gsw_dHdS(sa, ct, p)),
+    ):
+        np.testing.assert_allclose(res, reference, rtol=0, atol=1e-9 * np.abs(reference).max())
+
+    assert gsw.gsw_state(sa, ct, p, False)[3:] == (None, None, None)
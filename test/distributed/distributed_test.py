@@ -22,11 +22,41 @@ def test_scatter():
     run_dist_kernel("scatter_kernel.py")
 
 
+def test_exchange():
+    run_dist_kernel("exchange_kernel.py")
+
+
+def test_batched_reductions():
+    run_dist_kernel("reductions_kernel.py")
+
+
 def test_acc():
     run_dist_kernel("acc_kernel.py")
 
 
-@pytest.mark.parametrize("solver", ["scipy", "scipy_jax", "petsc"])
+def test_acc_local_comm():
+    # processes are started by Veros, so no MPI is needed
+    here = os.path.dirname(__file__)
+    subprocess.check_call(
+        [sys.executable, os.path.join(here, "local_comm_kernel.py")], stderr=subprocess.STDOUT, timeout=300
+    )
+
+
+def test_acc_planned_decomposition(tmp_path):
+    from veros.decomposition import Decomposition, save_decomposition
+
+    decomposition_file = str(tmp_path / "decomposition.json")
+    save_decomposition(decomposition_file, Decomposition(30, 42, (2, 2), (0, 11, 30), (0, 25, 42)))
+
+    here = os.path.dirname(__file__)
+    subprocess.check_call(
+        [sys.executable, os.path.join(here, "local_comm_kernel.py"), decomposition_file],
+        stderr=subprocess.STDOUT,
+        timeout=300,
+    )
+
+
+@pytest.mark.parametrize("solver", ["scipy", "scipy_jax", "petsc", "distributed"])
 @pytest.mark.parametrize("streamfunction", [True, False])
 def test_linear_solver(solver, streamfunction):
     from veros import runtime_settings
@@ -0,0 +1,85 @@
+import numpy as np
+from mpi4py import MPI
+
+from veros import runtime_settings as rs, runtime_state as rst
+from veros.distributed import exchange_overlap, exchange_overlap_many, start_exchange_overlap
+
+if rst.proc_num == 1:
+    import sys
+
+    comm = MPI.COMM_SELF.Spawn(sys.executable, args=["-m", "mpi4py", sys.argv[-1]], maxprocs=4)
+
+    res = np.empty(1)
+    comm.Recv(res, 0)
+    assert res[0] == 1
+
+else:
+    rs.num_proc = (2, 2)
+    assert rst.proc_num == 4
+
+    from veros.core.operators import numpy as npx
+
+    nx, ny = 8, 4
+    px, py = rst.proc_idx
+    nxl, nyl = nx // rs.num_proc[0], ny // rs.num_proc[1]
+
+    # same global arrays on all processes
+    rng = np.random.default_rng(42)
+    global_arrs = (
+        rng.random((nx + 4, ny + 4)),
+        rng.random((nx + 4, ny + 4, 3)),
+        rng.integers(0, 100, size=(nx + 4, ny + 4, 2, 3)),
+    )
+
+    success = True
+    for cyclic in (True, False):
+        arrs, expected, originals = [], [], []
+
+        for global_arr in global_arrs:
+            global_arr = global_arr.copy()
+
+            if cyclic:
+                global_arr[:2] = global_arr[-4:-2]
+                global_arr[-2:] = global_arr[2:4]
+
+            local_arr = global_arr[px * nxl : px * nxl + nxl + 4, py * nyl : py * nyl + nyl + 4].copy()
+            expected.append(local_arr.copy())
+
+            # invalidate all overlap that is received from other processes
+            if px > 0 or cyclic:
+                local_arr[:2] = -1
+            if px < rs.num_proc[0] - 1 or cyclic:
+                local_arr[-2:] = -1
+            if py > 0:
+                local_arr[:, :2] = -1
+            if py < rs.num_proc[1] - 1:
+                local_arr[:, -2:] = -1
+
+            arrs.append(npx.asarray(local_arr))
+            originals.append(local_arr)
+
+        for arr, res in zip(expected, [exchange_overlap(arr, ["xt", "yt"], cyclic=cyclic) for arr in arrs]):
+            success = success and np.array_equal(arr, res)
+
+        exchange = start_exchange_overlap(arrs, ["xt", "yt"], cyclic=cyclic)
+        for arr, res in zip(expected, exchange.wait()):
+            success = success and np.array_equal(arr, res)
+
+        # repeated exchanges reuse the same communication buffers
+        for _ in range(2):
+            grids = [["xt", "yt"], ["xu", "yt", "zt"], ["xt", "yu", "zt", "tensor1"]]
+            for arr, res in zip(expected, exchange_overlap_many(arrs, grids, cyclic=cyclic)):
+                success = success and np.array_equal(arr, res)
+
+        # inputs are left untouched unless they are handed over
+        for arr, orig in zip(arrs, originals):
+            success = success and np.array_equal(arr, orig)
+
+        handed_over = [npx.array(arr) for arr in arrs]
+        for arr, res in zip(expected, exchange_overlap_many(handed_over, ["xt", "yt"], cyclic=cyclic, inplace=True)):
+            success = success and np.array_equal(arr, res)
+
+    success = rs.mpi_comm.allreduce(success, op=MPI.LAND)
+
+    if rst.proc_rank == 0:
+        rs.mpi_comm.Get_parent().Send(np.array([float(success)]), 0)
@@ -0,0 +1,50 @@
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+
+def run_acc(comm=None, outfile=None, decomposition_file=None):
+    from veros import runtime_settings as rs, runtime_state as rst
+
+    if comm is not None:
+        rs.mpi_comm = comm
+        rs.num_proc = (2, 2)
+        rs.decomposition_file = decomposition_file
+        assert rst.proc_num == 4
+
+    rs.linear_solver = "scipy"
+    rs.diskless_mode = True
+
+    from veros.distributed import gather
+    from veros.setups.acc import ACCSetup
+
+    sim = ACCSetup(
+        override=dict(
+            runlen=86400 * 10,
+        )
+    )
+    sim.setup()
+    sim.run()
+
+    psi_global = gather(sim.state.variables.psi, sim.state.dimensions, ("xt", "yt"))
+
+    if rst.proc_rank == 0:
+        if outfile is None:
+            return np.array(psi_global)
+
+        np.save(outfile, np.array(psi_global))
+
+
+if __name__ == "__main__":
+    from veros.local_comm import launch
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        outfile = os.path.join(tmpdir, "psi.npy")
+        decomposition_file = sys.argv[1] if len(sys.argv) > 1 else None
+        launch(4, run_acc, outfile=outfile, decomposition_file=decomposition_file)
+        other_psi = np.load(outfile)
+
+    psi = run_acc()
+    np.testing.assert_allclose(psi, other_psi)
@@ -0,0 +1,42 @@
+import numpy as np
+from mpi4py import MPI
+
+from veros import runtime_settings as rs, runtime_state as rst
+from veros.distributed import batched_reductions, global_sum, global_max, global_min
+
+if rst.proc_num == 1:
+    import sys
+
+    comm = MPI.COMM_SELF.Spawn(sys.executable, args=["-m", "mpi4py", sys.argv[-1]], maxprocs=4)
+
+    res = np.empty(1)
+    comm.Recv(res, 0)
+    assert res[0] == 1
+
+else:
+    rs.num_proc = (2, 2)
+    assert rst.proc_num == 4
+
+    from veros.core.operators import numpy as npx
+
+    rng = np.random.default_rng(rst.proc_rank)
+
+    arrs = (
+        npx.asarray(rng.random()),
+        npx.asarray(rng.random(3)),
+        npx.asarray(rng.random((2, 3))),
+        npx.asarray(rng.integers(0, 100, size=4)),
+    )
+
+    with batched_reductions() as batch:
+        results = [(batch.sum(arr), batch.max(arr), batch.min(arr)) for arr in arrs]
+
+    success = True
+    for arr, (res_sum, res_max, res_min) in zip(arrs, results):
+        for res, expected in ((res_sum, global_sum(arr)), (res_max, global_max(arr)), (res_min, global_min(arr))):
+            success = success and res.value.shape == arr.shape and np.allclose(res.value, expected, rtol=1e-14)
+
+    success = rs.mpi_comm.allreduce(success, op=MPI.LAND)
+
+    if rst.proc_rank == 0:
+        rs.mpi_comm.Get_parent().Send(np.array([float(success)]), 0)
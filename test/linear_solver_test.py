@@ -75,7 +75,7 @@ def assert_solution(state, rhs, sol, boundary_val=None, tol=1e-8):
 
 
 @pytest.mark.parametrize("cyclic", [True, False])
-@pytest.mark.parametrize("solver", ["scipy", "scipy_jax", "petsc"])
+@pytest.mark.parametrize("solver", ["scipy", "scipy_jax", "petsc", "multigrid", "distributed", "direct"])
 @pytest.mark.parametrize("problem", ["streamfunction", "pressure"])
 def test_solver(solver, solver_state, cyclic, problem):
     from veros import runtime_settings
@@ -95,6 +95,18 @@ def test_solver(solver, solver_state, cyclic, problem):
     elif solver == "petsc":
         petsc_mod = pytest.importorskip("veros.core.external.solvers.petsc_")
         solver_class = petsc_mod.PETScSolver
+    elif solver == "multigrid":
+        from veros.core.external.solvers.multigrid import MultigridSolver
+
+        solver_class = MultigridSolver
+    elif solver == "distributed":
+        from veros.core.external.solvers.distributed_bicgstab import DistributedBiCGSTABSolver
+
+        solver_class = DistributedBiCGSTABSolver
+    elif solver == "direct":
+        from veros.core.external.solvers.direct import DirectSolver
+
+        solver_class = DirectSolver
     else:
         raise ValueError("unknown solver")
 
@@ -108,3 +120,133 @@ def test_solver(solver, solver_state, cyclic, problem):
 
     sol = solver_class(solver_state).solve(solver_state, rhs, x0, boundary_val=10)
     assert_solution(solver_state, rhs, sol, tol=1e-8, boundary_val=10)
+
+
+@pytest.mark.parametrize("cyclic", [True, False])
+@pytest.mark.parametrize("solver", ["multigrid", "distributed"])
+@pytest.mark.parametrize("problem", ["streamfunction", "pressure"])
+def test_solver_inplace_updates(solver, solver_state, cyclic, problem):
+    from veros import runtime_settings
+
+    if runtime_settings.backend != "numpy":
+        pytest.skip("in-place updates are only supported with NumPy")
+
+    object.__setattr__(runtime_settings, "inplace_updates", True)
+    try:
+        test_solver(solver, solver_state, cyclic, problem)
+    finally:
+        object.__setattr__(runtime_settings, "inplace_updates", False)
+
+
+@pytest.mark.parametrize("cyclic", [True, False])
+@pytest.mark.parametrize("problem", ["streamfunction", "pressure"])
+def test_scipy_solver_cache(solver_state, cyclic, problem, tmp_path):
+    from veros import runtime_settings
+    from veros.core.operators import numpy as npx
+    from veros.core.external.solvers import cache as solver_cache
+    from veros.core.external.solvers.scipy import SciPySolver
+
+    settings = solver_state.settings
+
+    rhs = npx.ones((settings.nx + 4, settings.ny + 4))
+    x0 = npx.asarray(np.random.rand(settings.nx + 4, settings.ny + 4))
+
+    object.__setattr__(runtime_settings, "cache_dir", str(tmp_path))
+    try:
+        cache_key = SciPySolver._get_cache_key(solver_state)
+        assert solver_cache.load("scipy", cache_key) is None
+
+        reference_sol = SciPySolver(solver_state).solve(solver_state, rhs, x0)
+        assert solver_cache.load("scipy", cache_key) is not None
+
+        cached_sol = SciPySolver(solver_state).solve(solver_state, rhs, x0)
+    finally:
+        object.__setattr__(runtime_settings, "cache_dir", None)
+
+    assert_solution(solver_state, rhs, cached_sol, tol=1e-8)
+    np.testing.assert_allclose(cached_sol, reference_sol, rtol=1e-10)
+
+
+@pytest.mark.parametrize("cyclic", [True, False])
+@pytest.mark.parametrize("problem", ["streamfunction", "pressure"])
+def test_direct_solver_cache(solver_state, cyclic, problem, tmp_path):
+    from veros import runtime_settings
+    from veros.core.operators import numpy as npx
+    from veros.core.external.solvers import cache as solver_cache
+    from veros.core.external.solvers.direct import DirectSolver
+
+    settings = solver_state.settings
+
+    rhs = npx.ones((settings.nx + 4, settings.ny + 4))
+    x0 = npx.asarray(np.random.rand(settings.nx + 4, settings.ny + 4))
+
+    object.__setattr__(runtime_settings, "cache_dir", str(tmp_path))
+    try:
+        cache_key = DirectSolver._get_cache_key(solver_state)
+        assert solver_cache.load("direct", cache_key) is None
+
+        reference_sol = DirectSolver(solver_state).solve(solver_state, rhs, x0)
+        assert solver_cache.load("direct", cache_key) is not None
+
+        cached_sol = DirectSolver(solver_state).solve(solver_state, rhs, x0)
+    finally:
+        object.__setattr__(runtime_settings, "cache_dir", None)
+
+    assert_solution(solver_state, rhs, cached_sol, tol=1e-8)
+    np.testing.assert_allclose(cached_sol, reference_sol, rtol=1e-10)
+
+
+@pytest.mark.parametrize("cyclic", [False])
+@pytest.mark.parametrize("problem", ["streamfunction"])
+def test_direct_solver_fallback(solver_state):
+    from veros import runtime_settings
+    from veros.core.operators import numpy as npx
+    from veros.core.external.solvers.direct import DirectSolver
+
+    settings = solver_state.settings
+
+    rhs = npx.ones((settings.nx + 4, settings.ny + 4))
+    x0 = npx.zeros((settings.nx + 4, settings.ny + 4))
+
+    object.__setattr__(runtime_settings, "direct_solver_max_memory", 0)
+    try:
+        solver = DirectSolver(solver_state)
+    finally:
+        object.__setattr__(runtime_settings, "direct_solver_max_memory", 2048)
+
+    assert solver._lu is None
+    assert_solution(solver_state, rhs, solver.solve(solver_state, rhs, x0), tol=1e-8)
+
+
+@pytest.mark.parametrize("cyclic", [True, False])
+@pytest.mark.parametrize("problem", ["streamfunction", "pressure"])
+def test_projected_guess_solver(solver_state, cyclic, problem):
+    from veros.core.operators import numpy as npx
+    from veros.core.external.solvers.scipy import SciPySolver
+    from veros.core.external.solvers.projection import ProjectedGuessSolver
+
+    class RecordingSolver(SciPySolver):
+        def solve(self, state, rhs, x0, boundary_val=None):
+            self.last_guess = x0
+            return super().solve(state, rhs, x0, boundary_val=boundary_val)
+
+    settings = solver_state.settings
+
+    inner_solver = RecordingSolver(solver_state)
+    solver = ProjectedGuessSolver(solver_state, inner_solver, 4)
+
+    x0 = npx.zeros((settings.nx + 4, settings.ny + 4))
+    rhs_list = [
+        npx.ones((settings.nx + 4, settings.ny + 4)),
+        npx.asarray(np.outer(np.linspace(1, 2, settings.nx + 4), np.linspace(1, 3, settings.ny + 4))),
+    ]
+
+    for rhs in rhs_list:
+        sol = solver.solve(solver_state, rhs, x0)
+        assert_solution(solver_state, rhs, sol, tol=1e-8)
+
+    # right hand side in the span of previous ones is solved by the projection alone
+    rhs = 0.3 * rhs_list[0] - 2 * rhs_list[1]
+    sol = solver.solve(solver_state, rhs, x0)
+    assert_solution(solver_state, rhs, sol, tol=1e-8)
+    assert_solution(solver_state, rhs, inner_solver.last_guess, tol=1e-6)
@@ -0,0 +1,145 @@
+import weakref
+
+import pytest
+
+import numpy as np
+
+
+@pytest.fixture
+def inplace_updates():
+    from veros import runtime_settings
+
+    object.__setattr__(runtime_settings, "inplace_updates", True)
+    try:
+        yield
+    finally:
+        object.__setattr__(runtime_settings, "inplace_updates", False)
+
+
+def test_inplace_update_owned(inplace_updates):
+    from veros.core.operators import update_numpy, update_add_numpy, at
+
+    arr = np.zeros(10)
+    arr_ref = weakref.ref(arr)
+
+    arr = update_numpy(arr, at[2:4], 1.0, inplace=True)
+    arr = update_add_numpy(arr, at[3:5], 1.0, inplace=True)
+
+    assert arr_ref() is arr
+    np.testing.assert_array_equal(arr, [0, 0, 1, 2, 1, 0, 0, 0, 0, 0])
+
+
+def test_inplace_update_not_requested(inplace_updates):
+    from veros.core.operators import update_numpy, update_add_numpy, at
+
+    rhs = np.zeros(10)
+    x = update_numpy(rhs, at[2:4], 1.0)
+
+    # the input is still used after the update
+    residual = update_add_numpy(x, at[...], -rhs)
+
+    np.testing.assert_array_equal(rhs, 0)
+    np.testing.assert_array_equal(x, [0, 0, 1, 1, 0, 0, 0, 0, 0, 0])
+    np.testing.assert_array_equal(residual, x)
+
+
+def test_inplace_update_disabled():
+    from veros.core.operators import update_numpy, at
+
+    arr = np.zeros(10)
+    res = update_numpy(arr, at[2:4], 1.0, inplace=True)
+
+    assert res is not arr
+    np.testing.assert_array_equal(arr, 0)
+
+
+def test_inplace_update_view(inplace_updates):
+    from veros.core.operators import update_multiply_numpy, at
+
+    base = np.ones(10)
+    res = update_multiply_numpy(base[2:], at[:2], 2.0, inplace=True)
+
+    np.testing.assert_array_equal(base, 1)
+    np.testing.assert_array_equal(res, [2, 2, 1, 1, 1, 1, 1, 1])
+
+
+def test_inplace_update_contiguous_timesteps(inplace_updates):
+    from veros.core.operators import update_numpy, at
+    from veros.variables import to_contiguous_timesteps
+
+    arr = to_contiguous_timesteps(np.zeros((4, 5, 3)))
+    res = update_numpy(arr, at[..., 1], 1.0, inplace=True)
+
+    assert res is arr
+    np.testing.assert_array_equal(arr.sum(axis=(0, 1)), [0, 20, 0])
+
+
+def test_inplace_update_readonly(inplace_updates):
+    from veros.core.operators import update_numpy, at
+
+    arr = np.zeros(10)
+    arr.flags.writeable = False
+
+    res = update_numpy(arr, at[2:4], 1.0, inplace=True)
+
+    # arrays stay read-only
+    assert res is arr
+    assert not arr.flags.writeable
+    assert arr.sum() == 2
+
+
+@pytest.mark.parametrize("use_ext", [True, False])
+@pytest.mark.parametrize("num_threads", [1, 3])
+@pytest.mark.parametrize("compact", [False, True])
+def test_solve_tridiagonal_numpy(use_ext, num_threads, compact, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from veros.core.special import tdma_numpy_
+
+    if use_ext and not tdma_numpy_.HAS_CPU_EXT:
+        pytest.skip("Cython extension not available")
+
+    monkeypatch.setattr(tdma_numpy_, "HAS_CPU_EXT", use_ext)
+
+    nx, ny, nz = 7, 5, 10
+    kbot = np.random.randint(0, nz + 1, size=(nx, ny))
+    ks = kbot - 1
+    land_mask = ks >= 0
+    water_mask = np.logical_and(land_mask[..., np.newaxis], np.arange(nz) >= ks[..., np.newaxis])
+    edge_mask = np.logical_and(land_mask[..., np.newaxis], np.arange(nz) == ks[..., np.newaxis])
+
+    a, c = -np.random.rand(2, nx, ny, nz)
+    b = 3 + np.random.rand(nx, ny, nz)
+    d = np.random.rand(nx, ny, nz)
+
+    thread_pool = ThreadPoolExecutor(num_threads) if num_threads > 1 else None
+    out = tdma_numpy_.tdma(
+        a, b, c, d, water_mask, edge_mask, thread_pool=thread_pool, num_threads=num_threads, compact=compact
+    )
+
+    for i in range(nx):
+        for j in range(ny):
+            col = water_mask[i, j]
+            n = col.sum()
+            if not n:
+                np.testing.assert_array_equal(out[i, j], 0)
+                continue
+
+            mat = np.diag(b[i, j, col]) + np.diag(a[i, j, col][1:], -1) + np.diag(c[i, j, col][:-1], 1)
+            np.testing.assert_allclose(out[i, j, col], np.linalg.solve(mat, d[i, j, col]))
+            np.testing.assert_array_equal(out[i, j, ~col], 0)
+
+
+def test_bincount_numpy():
+    from veros.core.operators import bincount_numpy
+
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 5, size=100)
+    weights = rng.normal(size=100)
+
+    res = bincount_numpy(x, weights=weights, length=8)
+
+    expected = np.zeros(8)
+    np.add.at(expected, x, weights)
+    assert res.shape == (8,)
+    np.testing.assert_allclose(res, expected)
+    np.testing.assert_array_equal(bincount_numpy(x), np.bincount(x))
@@ -0,0 +1,41 @@
+import numpy as np
+
+
+def test_transport_above_levels():
+    from veros.diagnostics.overturning import _transport_above_levels
+
+    rng = np.random.default_rng(17)
+    nx, ny, nz, nlevel = 6, 5, 4, 16
+
+    sigma = np.sort(rng.uniform(20, 30, size=nlevel))
+    sig_loc_face = rng.uniform(19, 31, size=(nx, ny, nz))
+    weights = rng.normal(size=(nx, ny, nz))
+
+    sig_class = np.searchsorted(sigma, sig_loc_face, side="left")
+    res = _transport_above_levels(sig_class, weights, nlevel)
+
+    # one sum over all cells denser than each level
+    expected = np.empty((ny, nlevel))
+    for m in range(nlevel):
+        mask = sig_loc_face > sigma[m]
+        expected[:, m] = np.sum(weights * mask, axis=(0, 2))
+
+    np.testing.assert_allclose(res, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_interpolate_depth_coords():
+    from veros.diagnostics.overturning import _interpolate_depth_coords
+
+    rng = np.random.default_rng(42)
+    ny, n, m = 7, 12, 9
+
+    # depth coordinates are negative and decreasing, with some repeated values
+    coords = -np.cumsum(rng.uniform(0, 100, size=(ny, n)), axis=1)
+    coords[:, 3] = coords[:, 2]
+    arr = rng.normal(size=(ny, n))
+    interp_coords = rng.uniform(coords.min() * 1.1, 10.0, size=(ny, m))
+
+    res = _interpolate_depth_coords(coords, arr, interp_coords)
+
+    expected = np.stack([np.interp(-interp_coords[j], -coords[j], arr[j]) for j in range(ny)])
+    np.testing.assert_allclose(res, expected, rtol=1e-12, atol=1e-12)
@@ -1,5 +1,6 @@
 import os
 import numpy as np
+import pytest
 
 from veros import veros_routine
 from veros.setups.acc import ACCSetup
@@ -24,7 +25,18 @@ class RestartSetup(ACCSetup):
             diag.output_frequency = float("inf")
 
 
-def test_restart(tmpdir):
+@pytest.fixture(params=[False, True], ids=["sync", "async"])
+def async_restarts(request):
+    from veros import runtime_settings
+
+    object.__setattr__(runtime_settings, "async_restarts", request.param)
+    try:
+        yield request.param
+    finally:
+        object.__setattr__(runtime_settings, "async_restarts", False)
+
+
+def test_restart(tmpdir, async_restarts):
     os.chdir(tmpdir)
 
     timesteps_1 = 5
@@ -45,6 +57,9 @@ def test_restart(tmpdir):
     acc_no_restart.setup()
     acc_no_restart.run()
 
+    assert os.path.isfile(restart_file)
+    assert not any(f.endswith(".tmp") for f in os.listdir(tmpdir))
+
     acc_restart = RestartSetup(
         override=dict(
             identifier="ACC_restart",
@@ -89,3 +89,124 @@ def test_setup_north_atlantic():
         sim.state.settings.runlen = sim.state.settings.dt_tracer
 
     sim.run()
+
+
+def run_acc_with(runtime_overrides=None, steps=20, settings_overrides=None, steps_per_call=1):
+    """Runs the ACC setup with temporarily changed runtime settings and returns the simulation"""
+    from veros import runtime_settings
+    from veros.setups.acc import ACCSetup
+
+    runtime_overrides = runtime_overrides or {}
+    previous = {key: getattr(runtime_settings, key) for key in runtime_overrides}
+
+    try:
+        for key, val in runtime_overrides.items():
+            object.__setattr__(runtime_settings, key, val)
+
+        sim = ACCSetup(override=settings_overrides)
+        sim.setup()
+
+        with sim.state.settings.unlock():
+            sim.state.settings.runlen = sim.state.settings.dt_tracer * steps
+
+        sim.run(steps_per_call=steps_per_call)
+    finally:
+        for key, val in previous.items():
+            object.__setattr__(runtime_settings, key, val)
+
+    return sim
+
+
+def assert_same_variables(actual, reference, variables, **tolerances):
+    import numpy as np
+
+    for var in variables:
+        np.testing.assert_allclose(getattr(actual, var), getattr(reference, var), **tolerances)
+
+
+def test_setup_acc_fused_step():
+    import numpy as np
+    from veros import runtime_settings
+
+    if runtime_settings.backend != "jax":
+        pytest.skip("fused time steps require JAX")
+
+    reference_sim = run_acc_with(dict(fused_step=False, linear_solver="scipy_jax"), steps=5)
+    fused_sim = run_acc_with(dict(fused_step=True, linear_solver="scipy_jax"), steps=5)
+
+    # tracing failures fall back to regular time steps silently
+    assert fused_sim._fused_step_kernel is not None
+    assert fused_sim._fused_step_kernel is not False
+
+    reference, fused = reference_sim.state.variables, fused_sim.state.variables
+
+    if reference.u.dtype != np.float64:
+        # JAX precision is fixed at first import, so this happens after the float32 tests
+        pytest.skip("comparison of fused time steps requires double precision")
+
+    assert_same_variables(fused, reference, ("u", "v", "temp", "salt", "psi"), rtol=1e-6, atol=1e-10)
+
+
+def test_setup_acc_steps_per_call():
+    reference = run_acc_with(steps_per_call=1).state.variables
+    blocked = run_acc_with(steps_per_call=8).state.variables
+
+    assert blocked.itt == reference.itt
+    assert blocked.time == reference.time
+
+    assert_same_variables(blocked, reference, ("u", "v", "temp", "salt", "psi"), rtol=1e-6, atol=1e-10)
+
+
+def _check_contiguous_timesteps(state):
+    from veros.variables import has_contiguous_timesteps
+
+    assert has_contiguous_timesteps(state.variables.temp)
+
+
+def _check_wet_columns(state):
+    import numpy as np
+
+    assert not np.all(state.variables.kbot > 0)
+    assert state.variables.wet_columns.size == np.count_nonzero(state.variables.kbot > 0)
+
+
+@pytest.mark.parametrize(
+    "runtime_overrides, settings_overrides, extra_variables, tolerances, check",
+    [
+        (dict(contiguous_timesteps=True), {}, (), dict(rtol=1e-10, atol=1e-14), _check_contiguous_timesteps),
+        # skipping land columns must be bit-identical, including unmasked quantities on land
+        (
+            dict(compact_wet_columns=True),
+            dict(eq_of_state_type=3),
+            ("rho", "prho", "Hd", "int_drhodT", "int_drhodS", "tke", "kappaH", "Nsqr"),
+            dict(rtol=0, atol=0),
+            _check_wet_columns,
+        ),
+        # land values of int_drhodT and int_drhodS stay at their initial values, which TEOS-10 computes
+        # with different round-off
+        (
+            dict(compact_wet_columns=True),
+            dict(eq_of_state_type=5),
+            ("rho", "prho", "Hd", "tke", "kappaH", "Nsqr"),
+            dict(rtol=0, atol=0),
+            _check_wet_columns,
+        ),
+        # tiled execution must be bit-identical
+        (dict(tile_size=7, num_threads=3), {}, ("K_11", "K_diss_h"), dict(rtol=0, atol=0), None),
+    ],
+    ids=["contiguous_timesteps", "compact_wet_columns-eos3", "compact_wet_columns-eos5", "tiled"],
+)
+def test_setup_acc_runtime_setting(runtime_overrides, settings_overrides, extra_variables, tolerances, check):
+    from veros import runtime_settings
+
+    if runtime_settings.backend != "numpy":
+        pytest.skip("these runtime settings are only supported with NumPy")
+
+    reference = run_acc_with(settings_overrides=settings_overrides).state
+    modified = run_acc_with(runtime_overrides, settings_overrides=settings_overrides).state
+
+    if check is not None:
+        check(modified)
+
+    variables = ("u", "v", "temp", "salt", "psi", *extra_variables)
+    assert_same_variables(modified.variables, reference.variables, variables, **tolerances)
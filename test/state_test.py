@@ -134,3 +134,172 @@ def test_timers(dummy_state):
 
     timer = dummy_state.timers["foobar"]
     assert isinstance(timer, Timer)
+
+
+def test_settings_hash(dummy_settings):
+    orig_hash = dummy_settings.get_hash()
+    assert dummy_settings.get_hash() == orig_hash
+
+    with dummy_settings.unlock():
+        dummy_settings.dt_tracer = 1
+
+    assert dummy_settings.get_hash() != orig_hash
+
+
+def test_pruned_variables(dummy_variables):
+    from veros.state import PrunedVariables, PrunedVariableAccess
+
+    pruned = PrunedVariables(dummy_variables, ("u", "v"))
+    assert pruned.fields() == ("u", "v")
+    assert pruned.u is dummy_variables.u
+
+    with pytest.raises(PrunedVariableAccess):
+        pruned.w
+
+    with pruned.unlock():
+        pruned.u = 2 * pruned.u
+
+        with pytest.raises(PrunedVariableAccess):
+            pruned.w = pruned.u
+
+
+def test_donate_kernel_outputs(dummy_state):
+    from veros import runtime_settings, veros_kernel, KernelOutput
+
+    if runtime_settings.backend != "jax":
+        pytest.skip("buffer donation requires JAX")
+
+    @veros_kernel(donate_outputs=True)
+    def double_u(state):
+        vs = state.variables
+        vs.u = 2 * vs.u
+        return KernelOutput(u=vs.u), vs.v.sum()
+
+    dummy_state.initialize_variables()
+    vs = dummy_state.variables
+
+    with vs.unlock():
+        vs.u = vs.u + 1
+
+    u_orig = vs.u
+    out, _ = double_u(dummy_state)
+
+    assert double_u.donated_variables[()] == ("u",)
+    assert u_orig.is_deleted()
+    assert not vs.v.is_deleted()
+    assert (out.u == 2).all()
+
+
+def test_pruned_kernel_setting_change(dummy_state):
+    from veros import runtime_settings, veros_kernel
+
+    if runtime_settings.backend != "jax" or not runtime_settings.prune_kernel_inputs:
+        pytest.skip("kernel input pruning requires JAX")
+
+    @veros_kernel
+    def add_v_if_cyclic(state):
+        vs = state.variables
+        if state.settings.enable_cyclic_x:
+            return vs.u.sum() + vs.v.sum()
+        return 2 * vs.u.sum()
+
+    with dummy_state.settings.unlock():
+        dummy_state.settings.enable_cyclic_x = False
+
+    dummy_state.initialize_variables()
+    vs = dummy_state.variables
+
+    with vs.unlock():
+        vs.u = vs.u + 1
+        vs.v = vs.v + 3
+
+    assert add_v_if_cyclic(dummy_state) == 2 * vs.u.size
+    assert add_v_if_cyclic.accessed_variables[()] == ("u",)
+
+    # the stale record is detected when the kernel accesses v, and the kernel is recorded again
+    with dummy_state.settings.unlock():
+        dummy_state.settings.enable_cyclic_x = True
+
+    assert add_v_if_cyclic(dummy_state) == vs.u.size + 3 * vs.v.size
+    assert add_v_if_cyclic.accessed_variables[()] == ("u", "v")
+
+
+def test_pruned_kernel_fallback(dummy_state):
+    import itertools
+    from veros import runtime_settings, veros_kernel
+
+    if runtime_settings.backend != "jax" or not runtime_settings.prune_kernel_inputs:
+        pytest.skip("kernel input pruning requires JAX")
+
+    # every trace accesses a different variable, so recording never helps
+    accessed_names = itertools.cycle(("u", "v", "w", "temp", "salt"))
+
+    @veros_kernel
+    def read_next_variable(state):
+        return getattr(state.variables, next(accessed_names)).sum()
+
+    dummy_state.initialize_variables()
+
+    assert read_next_variable(dummy_state) == 0
+    # after the retry also fails, all variables are passed
+    assert read_next_variable.accessed_variables[()] is None
+    assert read_next_variable(dummy_state) == 0
+
+
+def test_trusted_mode(dummy_variables):
+    from veros.core.operators import numpy as npx
+
+    dummy_variables.enable_trusted_mode()
+
+    with pytest.raises(RuntimeError):
+        dummy_variables.u = dummy_variables.u
+
+    with dummy_variables.unlock():
+        # arrays with the expected dtype are not validated
+        dummy_variables.u = npx.zeros(3)
+        assert dummy_variables.u.shape == (3,)
+
+        # everything else still is
+        with pytest.raises(ValueError):
+            dummy_variables.u = npx.zeros(3, dtype="int32")
+
+        dummy_variables.tau = 1.0
+        assert dummy_variables.tau.dtype == "int32"
+
+
+def test_grid_metric_cache(dummy_state):
+    import numpy as np
+    from veros.core import numerics, utilities
+    from veros.core.operators import numpy as npx
+    from veros.variables import VARIABLES, manifest_metadata
+
+    with dummy_state.settings.unlock():
+        dummy_state.settings.nx = 10
+        dummy_state.settings.ny = 12
+        dummy_state.settings.nz = 5
+
+    dummy_state.initialize_variables()
+    vs = dummy_state.variables
+
+    rng = np.random.default_rng(42)
+    with vs.unlock():
+        for spacing in ("dxt", "dxu", "dyt", "dyu"):
+            setattr(vs, spacing, npx.asarray(rng.uniform(1e3, 2e3, getattr(vs, spacing).shape)))
+        vs.cost = npx.asarray(rng.uniform(0.5, 1, vs.cost.shape))
+        vs.cosu = npx.asarray(rng.uniform(0.5, 1, vs.cosu.shape))
+        vs.maskT = npx.asarray(rng.uniform(size=vs.maskT.shape) > 0.3)
+        vs.update(numerics.calc_grid_metric_cache_kernel(dummy_state))
+
+    assert dummy_state.var_meta["inv_dx_t"].active
+    np.testing.assert_allclose(
+        utilities.grid_metric(dummy_state, "inv_dx_t"),
+        vs.maskT / (vs.cost[np.newaxis, :, np.newaxis] * vs.dxt[:, np.newaxis, np.newaxis]),
+    )
+    np.testing.assert_array_equal(vs.inv_dy_t, utilities.GRID_METRIC_DEFINITIONS["inv_dy_t"](vs))
+
+    # metrics exceeding the memory budget are not cached
+    with dummy_state.settings.unlock():
+        dummy_state.settings.nx = dummy_state.settings.ny = 10_000
+
+    var_meta = manifest_metadata(VARIABLES, dummy_state.settings)
+    assert not any(var_meta[name].active for name in utilities.GRID_METRIC_DEFINITIONS)
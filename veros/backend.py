@@ -1,3 +1,4 @@
+import os
 import warnings
 
 BACKENDS = ("numpy", "jax")
@@ -17,12 +18,18 @@ def init_jax_config():
         VerosState,
         VerosVariables,
         DistSafeVariableWrapper,
+        PrunedVariables,
+        RecordingVariables,
         veros_state_pytree_flatten,
         veros_state_pytree_unflatten,
         veros_variables_pytree_flatten,
         veros_variables_pytree_unflatten,
         dist_safe_wrapper_pytree_flatten,
         dist_safe_wrapper_pytree_unflatten,
+        pruned_variables_pytree_flatten,
+        pruned_variables_pytree_unflatten,
+        recording_variables_pytree_flatten,
+        recording_variables_pytree_unflatten,
     )
 
     if runtime_state.proc_num > 1:
@@ -39,15 +46,47 @@ def init_jax_config():
 
     jax.config.update("jax_platform_name", runtime_settings.device)
 
+    if runtime_settings.cache_dir is not None:
+        _enable_compilation_cache(os.path.join(runtime_settings.cache_dir, "jax"))
+
     jax.tree_util.register_pytree_node(VerosState, veros_state_pytree_flatten, veros_state_pytree_unflatten)
     jax.tree_util.register_pytree_node(VerosVariables, veros_variables_pytree_flatten, veros_variables_pytree_unflatten)
     jax.tree_util.register_pytree_node(
         DistSafeVariableWrapper, dist_safe_wrapper_pytree_flatten, dist_safe_wrapper_pytree_unflatten
     )
+    jax.tree_util.register_pytree_node(
+        PrunedVariables, pruned_variables_pytree_flatten, pruned_variables_pytree_unflatten
+    )
+    jax.tree_util.register_pytree_node(
+        RecordingVariables, recording_variables_pytree_flatten, recording_variables_pytree_unflatten
+    )
 
     _init_done.add("jax")
 
 
+def _enable_compilation_cache(cache_dir):
+    """Stores compiled kernels on disk, so they can be re-used by other processes.
+
+    Entries are keyed by JAX on the lowered kernel (which reflects kernel name, settings,
+    shapes, and dtypes), the device, and the versions of JAX and XLA.
+    """
+    import jax
+    from veros import logger
+
+    try:
+        jax.config.update("jax_compilation_cache_dir", cache_dir)
+    except AttributeError:
+        # older versions of JAX
+        from jax.experimental.compilation_cache import compilation_cache
+
+        compilation_cache.initialize_cache(cache_dir)
+    else:
+        # cache all kernels, no matter how quickly they compile
+        jax.config.update("jax_persistent_cache_min_compile_time_secs", 0)
+
+    logger.debug(f"Using JAX compilation cache in {cache_dir}")
+
+
 def get_backend_module(backend_name):
     if backend_name not in BACKENDS:
         raise ValueError(f"unrecognized backend {backend_name} (must be either of: {list(BACKENDS.keys())!r})")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+import functools
+
+import click
+
+from veros.cli.veros_run import VerosSetting, load_setup_class
+
+
+def plan_decomposition(setup_file, num_proc, outfile, override, loglevel):
+    """Plans a domain decomposition that balances the number of wet cells between processes.
+
+    The setup is initialized on a single process (without output) to obtain its topography.
+    Pass the resulting file to runs with the same number of processes through the
+    VEROS_DECOMPOSITION_FILE environment variable.
+    """
+    from veros import runtime_settings, logger
+    from veros.decomposition import (
+        plan_decomposition,
+        get_uniform_decomposition,
+        summarize_decomposition,
+        save_decomposition,
+    )
+
+    runtime_settings.update(loglevel=loglevel, diskless_mode=True)
+
+    SetupClass = load_setup_class(setup_file)
+
+    sim = SetupClass(override=dict(override))
+    sim.setup()
+
+    settings = sim.state.settings
+    kbot = sim.state.variables.kbot[2:-2, 2:-2]
+
+    uniform_summary = summarize_decomposition(
+        kbot, settings.nz, get_uniform_decomposition(settings.nx, settings.ny, num_proc)
+    )
+    decomposition = plan_decomposition(kbot, settings.nz, num_proc)
+    summary = summarize_decomposition(kbot, settings.nz, decomposition)
+
+    logger.info(f"Predicted load imbalance (max / mean wet cells per process): {summary['imbalance']:.2f}")
+    logger.info(f" (uniform decomposition: {uniform_summary['imbalance']:.2f})")
+    logger.info(f"Subdomain boundaries in x-direction: {decomposition.x_bounds}")
+    logger.info(f"Subdomain boundaries in y-direction: {decomposition.y_bounds}")
+
+    if summary["land_blocks"]:
+        logger.warning(
+            f"{summary['land_blocks']} subdomains contain no wet cells, consider using fewer processes "
+            "or a different process grid"
+        )
+
+    save_decomposition(outfile, decomposition, **summary)
+    logger.info(f"Decomposition written to {outfile}")
+
+
+@click.command("veros-plan-decomposition")
+@click.argument("SETUP_FILE", type=click.Path(readable=True, dir_okay=False, resolve_path=True, exists=True))
+@click.option(
+    "-n", "--num-proc", nargs=2, required=True, type=click.INT, help="Number of processes in x and y dimension"
+)
+@click.option(
+    "-o",
+    "--outfile",
+    default="decomposition.json",
+    type=click.Path(dir_okay=False, writable=True),
+    help="File to write the decomposition to",
+    show_default=True,
+)
+@click.option(
+    "-s",
+    "--override",
+    nargs=2,
+    multiple=True,
+    metavar="SETTING VALUE",
+    type=VerosSetting(),
+    default=tuple(),
+    help="Override model setting, may be specified multiple times",
+)
+@click.option(
+    "-v",
+    "--loglevel",
+    default="info",
+    type=click.Choice(["trace", "debug", "info", "warning", "error"]),
+    help="Log level used for output",
+    show_default=True,
+)
+@functools.wraps(plan_decomposition)
+def cli(setup_file, *args, **kwargs):
+    if not setup_file.endswith(".py"):
+        raise click.UsageError(f"The given setup file {setup_file} does not appear to be a Python file.")
+
+    return plan_decomposition(setup_file, *args, **kwargs)
@@ -43,7 +43,14 @@ def _import_from_file(path):
 
 def run(setup_file, *args, **kwargs):
     """Runs a Veros setup from given file"""
-    from veros import runtime_settings, VerosSetup, __version__ as veros_version
+    from veros import runtime_settings
+
+    if _use_local_processes(kwargs["num_proc"]):
+        from veros.local_comm import launch
+
+        num_processes = kwargs["num_proc"][0] * kwargs["num_proc"][1]
+        launch(num_processes, _run_local_process, setup_file, *args, **kwargs)
+        return
 
     kwargs["override"] = dict(kwargs["override"])
 
@@ -56,10 +63,42 @@ def run(setup_file, *args, **kwargs):
         "float_type",
         "diskless_mode",
         "force_overwrite",
+        "cache_dir",
     )
     for setting in runtime_setting_kwargs:
         setattr(runtime_settings, setting, kwargs.pop(setting))
 
+    steps_per_call = kwargs.pop("steps_per_call", 1)
+
+    SetupClass = load_setup_class(setup_file)
+
+    sim = SetupClass(*args, **kwargs)
+    sim.setup()
+    sim.run(steps_per_call=steps_per_call)
+
+
+def _use_local_processes(num_proc):
+    """Whether processes need to be started by Veros, because there is no MPI job to run in"""
+    from veros import runtime_settings
+
+    if num_proc[0] * num_proc[1] == 1:
+        return False
+
+    comm = runtime_settings.mpi_comm
+    return comm is None or comm.Get_size() == 1
+
+
+def _run_local_process(comm, setup_file, *args, **kwargs):
+    from veros import runtime_settings
+
+    runtime_settings.mpi_comm = comm
+    run(setup_file, *args, **kwargs)
+
+
+def load_setup_class(setup_file):
+    """Imports the VerosSetup subclass defined in the given file"""
+    from veros import VerosSetup, __version__ as veros_version
+
     # determine setup class from given Python file
     setup_module = _import_from_file(setup_file)
 
@@ -80,9 +119,7 @@ def run(setup_file, *args, **kwargs):
             "Consider switching to this version of Veros or updating your setup file.\n"
         )
 
-    sim = SetupClass(*args, **kwargs)
-    sim.setup()
-    sim.run()
+    return SetupClass
 
 
 @click.command("veros-run")
@@ -140,7 +177,26 @@ def run(setup_file, *args, **kwargs):
     show_default=True,
 )
 @click.option(
-    "-n", "--num-proc", nargs=2, default=[1, 1], type=click.INT, help="Number of processes in x and y dimension"
+    "--cache-dir",
+    default=None,
+    type=click.Path(file_okay=False),
+    envvar="VEROS_CACHE_DIR",
+    help="Directory to cache compiled kernels and solver setup data in",
+)
+@click.option(
+    "-n",
+    "--num-proc",
+    nargs=2,
+    default=[1, 1],
+    type=click.INT,
+    help="Number of processes in x and y dimension (started on this node if not run through MPI)",
+)
+@click.option(
+    "--steps-per-call",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Maximum number of time steps to advance between host synchronizations",
+    show_default=True,
 )
 @functools.wraps(run)
 def cli(setup_file, *args, **kwargs):
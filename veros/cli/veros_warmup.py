@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+import functools
+
+import click
+
+from veros.cli.veros_run import VerosSetting, load_setup_class
+
+
+def warmup(setup_file, cache_dir, num_steps, steps_per_call, override, device, float_type, num_proc, loglevel):
+    """Pre-populates the compilation cache for a Veros setup by running a few time steps without output.
+
+    Later runs (e.g. through veros-resubmit) with the same setup and the same cache directory
+    (passed as --cache-dir or through the VEROS_CACHE_DIR environment variable) then skip
+    the compilation of all kernels.
+    """
+    from veros import runtime_settings
+
+    runtime_settings.update(
+        backend="jax",
+        cache_dir=cache_dir,
+        device=device,
+        float_type=float_type,
+        num_proc=num_proc,
+        loglevel=loglevel,
+        diskless_mode=True,
+    )
+
+    SetupClass = load_setup_class(setup_file)
+
+    sim = SetupClass(override=dict(override))
+    sim.setup()
+
+    with sim.state.settings.unlock():
+        sim.state.settings.runlen = num_steps * sim.state.settings.dt_tracer
+
+    sim.run(show_progress_bar=False, steps_per_call=steps_per_call)
+
+
+@click.command("veros-warmup")
+@click.argument("SETUP_FILE", type=click.Path(readable=True, dir_okay=False, resolve_path=True, exists=True))
+@click.option(
+    "--cache-dir",
+    required=True,
+    type=click.Path(file_okay=False),
+    envvar="VEROS_CACHE_DIR",
+    help="Directory to store compiled kernels in",
+)
+@click.option(
+    "--num-steps",
+    default=2,
+    type=click.IntRange(min=1),
+    help="Number of time steps to run",
+    show_default=True,
+)
+@click.option(
+    "--steps-per-call",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Maximum number of time steps to advance between host synchronizations (must match the actual run)",
+    show_default=True,
+)
+@click.option(
+    "-s",
+    "--override",
+    nargs=2,
+    multiple=True,
+    metavar="SETTING VALUE",
+    type=VerosSetting(),
+    default=tuple(),
+    help="Override model setting, may be specified multiple times",
+)
+@click.option(
+    "--device",
+    default="cpu",
+    type=click.Choice(["cpu", "gpu"]),
+    help="Hardware device to use",
+    show_default=True,
+)
+@click.option(
+    "--float-type",
+    default="float64",
+    type=click.Choice(["float64", "float32"]),
+    help="Floating point precision to use",
+    show_default=True,
+)
+@click.option(
+    "-n", "--num-proc", nargs=2, default=[1, 1], type=click.INT, help="Number of processes in x and y dimension"
+)
+@click.option(
+    "-v",
+    "--loglevel",
+    default="info",
+    type=click.Choice(["trace", "debug", "info", "warning", "error"]),
+    help="Log level used for output",
+    show_default=True,
+)
+@functools.wraps(warmup)
+def cli(setup_file, *args, **kwargs):
+    if not setup_file.endswith(".py"):
+        raise click.UsageError(f"The given setup file {setup_file} does not appear to be a Python file.")
+
+    return warmup(setup_file, *args, **kwargs)
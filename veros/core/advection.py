@@ -63,6 +63,7 @@ def adv_flux_2nd(state, var):
         adv_fe,
         at[1:-2, 2:-2, :],
         0.5 * (var[1:-2, 2:-2, :] + var[2:-1, 2:-2, :]) * vs.u[1:-2, 2:-2, :, vs.tau] * vs.maskU[1:-2, 2:-2, :],
+        inplace=True,
     )
     adv_fn = update(
         adv_fn,
@@ -72,13 +73,15 @@ def adv_flux_2nd(state, var):
         * (var[2:-2, 1:-2, :] + var[2:-2, 2:-1, :])
         * vs.v[2:-2, 1:-2, :, vs.tau]
         * vs.maskV[2:-2, 1:-2, :],
+        inplace=True,
     )
     adv_ft = update(
         adv_ft,
         at[2:-2, 2:-2, :-1],
         0.5 * (var[2:-2, 2:-2, :-1] + var[2:-2, 2:-2, 1:]) * vs.w[2:-2, 2:-2, :-1, vs.tau] * vs.maskW[2:-2, 2:-2, :-1],
+        inplace=True,
     )
-    adv_ft = update(adv_ft, at[:, :, -1], 0.0)
+    adv_ft = update(adv_ft, at[:, :, -1], 0.0, inplace=True)
 
     return adv_fe, adv_fn, adv_ft
 
@@ -144,6 +147,7 @@ def calculate_velocity_on_wgrid_kernel(state):
         * 0.5
         * vs.dzt[npx.newaxis, npx.newaxis, :-1]
         / vs.dzw[npx.newaxis, npx.newaxis, :-1],
+        inplace=True,
     )
     vs.v_wgrid = update(
         vs.v_wgrid,
@@ -158,12 +162,19 @@ def calculate_velocity_on_wgrid_kernel(state):
         * 0.5
         * vs.dzt[npx.newaxis, npx.newaxis, :-1]
         / vs.dzw[npx.newaxis, npx.newaxis, :-1],
+        inplace=True,
     )
     vs.u_wgrid = update(
-        vs.u_wgrid, at[:, :, -1], vs.u[:, :, -1, vs.tau] * vs.maskU[:, :, -1] * 0.5 * vs.dzt[-1:] / vs.dzw[-1:]
+        vs.u_wgrid,
+        at[:, :, -1],
+        vs.u[:, :, -1, vs.tau] * vs.maskU[:, :, -1] * 0.5 * vs.dzt[-1:] / vs.dzw[-1:],
+        inplace=True,
     )
     vs.v_wgrid = update(
-        vs.v_wgrid, at[:, :, -1], vs.v[:, :, -1, vs.tau] * vs.maskV[:, :, -1] * 0.5 * vs.dzt[-1:] / vs.dzw[-1:]
+        vs.v_wgrid,
+        at[:, :, -1],
+        vs.v[:, :, -1, vs.tau] * vs.maskV[:, :, -1] * 0.5 * vs.dzt[-1:] / vs.dzw[-1:],
+        inplace=True,
     )
 
     # redirect velocity at bottom and at topography
@@ -171,11 +182,13 @@ def calculate_velocity_on_wgrid_kernel(state):
         vs.u_wgrid,
         at[:, :, 0],
         vs.u_wgrid[:, :, 0] + vs.u[:, :, 0, vs.tau] * vs.maskU[:, :, 0] * 0.5 * vs.dzt[0] / vs.dzw[0],
+        inplace=True,
     )
     vs.v_wgrid = update(
         vs.v_wgrid,
         at[:, :, 0],
         vs.v_wgrid[:, :, 0] + vs.v[:, :, 0, vs.tau] * vs.maskV[:, :, 0] * 0.5 * vs.dzt[0] / vs.dzw[0],
+        inplace=True,
     )
     mask = vs.maskW[:-1, :, :-1] * vs.maskW[1:, :, :-1]
     vs.u_wgrid = update_add(
@@ -183,19 +196,21 @@ def calculate_velocity_on_wgrid_kernel(state):
         at[:-1, :, 1:],
         (vs.u_wgrid[:-1, :, :-1] * vs.dzw[npx.newaxis, npx.newaxis, :-1] / vs.dzw[npx.newaxis, npx.newaxis, 1:])
         * (1.0 - mask),
+        inplace=True,
     )
-    vs.u_wgrid = update_multiply(vs.u_wgrid, at[:-1, :, :-1], mask)
+    vs.u_wgrid = update_multiply(vs.u_wgrid, at[:-1, :, :-1], mask, inplace=True)
     mask = vs.maskW[:, :-1, :-1] * vs.maskW[:, 1:, :-1]
     vs.v_wgrid = update_add(
         vs.v_wgrid,
         at[:, :-1, 1:],
         (vs.v_wgrid[:, :-1, :-1] * vs.dzw[npx.newaxis, npx.newaxis, :-1] / vs.dzw[npx.newaxis, npx.newaxis, 1:])
         * (1.0 - mask),
+        inplace=True,
     )
-    vs.v_wgrid = update_multiply(vs.v_wgrid, at[:, :-1, :-1], mask)
+    vs.v_wgrid = update_multiply(vs.v_wgrid, at[:, :-1, :-1], mask, inplace=True)
 
     # vertical advection velocity on W grid from continuity
-    vs.w_wgrid = update(vs.w_wgrid, at[:, :, 0], 0.0)
+    vs.w_wgrid = update(vs.w_wgrid, at[:, :, 0], 0.0, inplace=True)
     vs.w_wgrid = update(
         vs.w_wgrid,
         at[1:, 1:, :],
@@ -212,6 +227,7 @@ def calculate_velocity_on_wgrid_kernel(state):
             ),
             axis=2,
         ),
+        inplace=True,
     )
 
     return KernelOutput(u_wgrid=vs.u_wgrid, v_wgrid=vs.v_wgrid, w_wgrid=vs.w_wgrid)
@@ -229,17 +245,23 @@ def adv_flux_superbee_wgrid(state, var):
     adv_ft = allocate(state.dimensions, ("xt", "yt", "zt"))
 
     maskUtr = allocate(state.dimensions, ("xt", "yt", "zw"))
-    maskUtr = update(maskUtr, at[:-1, :, :], vs.maskW[1:, :, :] * vs.maskW[:-1, :, :])
-    adv_fe = update(adv_fe, at[1:-2, 2:-2, :], _adv_superbee(state, vs.u_wgrid, var, maskUtr, vs.dxt, axis=0))
+    maskUtr = update(maskUtr, at[:-1, :, :], vs.maskW[1:, :, :] * vs.maskW[:-1, :, :], inplace=True)
+    adv_fe = update(
+        adv_fe, at[1:-2, 2:-2, :], _adv_superbee(state, vs.u_wgrid, var, maskUtr, vs.dxt, axis=0), inplace=True
+    )
 
     maskVtr = allocate(state.dimensions, ("xt", "yt", "zw"))
-    maskVtr = update(maskVtr, at[:, :-1, :], vs.maskW[:, 1:, :] * vs.maskW[:, :-1, :])
-    adv_fn = update(adv_fn, at[2:-2, 1:-2, :], _adv_superbee(state, vs.v_wgrid, var, maskVtr, vs.dyt, axis=1))
+    maskVtr = update(maskVtr, at[:, :-1, :], vs.maskW[:, 1:, :] * vs.maskW[:, :-1, :], inplace=True)
+    adv_fn = update(
+        adv_fn, at[2:-2, 1:-2, :], _adv_superbee(state, vs.v_wgrid, var, maskVtr, vs.dyt, axis=1), inplace=True
+    )
 
     maskWtr = allocate(state.dimensions, ("xt", "yt", "zw"))
-    maskWtr = update(maskWtr, at[:, :, :-1], vs.maskW[:, :, 1:] * vs.maskW[:, :, :-1])
-    adv_ft = update(adv_ft, at[2:-2, 2:-2, :-1], _adv_superbee(state, vs.w_wgrid, var, maskWtr, vs.dzw, axis=2))
-    adv_ft = update(adv_ft, at[..., -1], 0.0)
+    maskWtr = update(maskWtr, at[:, :, :-1], vs.maskW[:, :, 1:] * vs.maskW[:, :, :-1], inplace=True)
+    adv_ft = update(
+        adv_ft, at[2:-2, 2:-2, :-1], _adv_superbee(state, vs.w_wgrid, var, maskWtr, vs.dzw, axis=2), inplace=True
+    )
+    adv_ft = update(adv_ft, at[..., -1], 0.0, inplace=True)
 
     return adv_fe, adv_fn, adv_ft
 
@@ -691,3 +691,300 @@ def gsw_dHdS(sa_in, ct_in, p):
         / t207
     )
     return t260
+
+
+def _gsw_coefficients(sa, ct):
+    """
+    Coefficients of the 48-term expression as polynomials in pressure p:
+    rho + rho0 = (b0 + p * (2 * b1 + b2 * p)) / (a0 + p * (a1 + p * (a2 + a3 * p)))
+    """
+    sqrtsa = npx.sqrt(sa)
+    a0 = (
+        v21
+        + ct * (v22 + ct * (v23 + ct * (v24 + v25 * ct)))
+        + sa
+        * (
+            v26
+            + ct * (v27 + ct * (v28 + ct * (v29 + v30 * ct)))
+            + v36 * sa
+            + sqrtsa * (v31 + ct * (v32 + ct * (v33 + ct * (v34 + v35 * ct))))
+        )
+    )
+    a1 = v37 + ct * (v38 + ct * (v39 + v40 * ct)) + sa * (v41 + v42 * ct)
+    a2 = v43 + ct * (v44 + v45 * ct + v46 * sa)
+    a3 = v47 + v48 * ct
+    b0 = (
+        v01
+        + ct * (v02 + ct * (v03 + v04 * ct))
+        + sa * (v05 + ct * (v06 + v07 * ct) + sqrtsa * (v08 + ct * (v09 + ct * (v10 + v11 * ct))))
+    )
+    b1 = 0.5 * (v12 + ct * (v13 + v14 * ct) + sa * (v15 + v16 * ct))
+    b2 = v17 + ct * (v18 + v19 * ct) + v20 * sa
+    return sqrtsa, (a0, a1, a2, a3, b0, b1, b2)
+
+
+def _gsw_rho_from_coefficients(coefficients, p):
+    a0, a1, a2, a3, b0, b1, b2 = coefficients
+    return (b0 + p * (2 * b1 + p * b2)) / (a0 + p * (a1 + p * (a2 + p * a3))) - rho0
+
+
+@veros_kernel(static_args=("compute_enthalpy",))
+def gsw_state(sa, ct, p, compute_enthalpy):
+    """
+     Fused evaluation of density, potential density, density of the level below
+     and (optionally) dynamic enthalpy and its derivatives, sharing all terms
+     that only depend on SA and CT.
+
+     sa     : Absolute Salinity                               [g/kg]
+     ct     : Conservative Temperature                        [deg C]
+     p      : sea pressure of each level (last axis)          [dbar]
+
+     returns rho, prho, rho_shifted, Hd, dHdT, dHdS, where rho_shifted
+     is the density of levels 1: at the pressure of levels :-1 and the
+     enthalpy terms are None if compute_enthalpy is False
+    ==========================================================================
+    """
+    p = npx.asarray(p)  # convert scalar value if necessary
+
+    _, coefficients = _gsw_coefficients(sa, ct)
+    rho = _gsw_rho_from_coefficients(coefficients, p)
+    rho_shifted = _gsw_rho_from_coefficients([c[..., 1:] for c in coefficients], p[..., :-1])
+
+    # potential density (p = 0)
+    a0, b0 = coefficients[0], coefficients[4]
+    prho = b0 / a0 - rho0
+
+    if not compute_enthalpy:
+        return rho, prho, rho_shifted, None, None, None
+
+    sa = npx.maximum(1e-1, sa)  # prevent division by zero
+    ct = npx.maximum(-12.0, ct)  # prevent blowing up for values smaller than -15 degC
+
+    sqrtsa, (a0, a1, a2, a3, b0, b1, b2) = _gsw_coefficients(sa, ct)
+
+    # terms shared between enthalpy and its derivatives
+    db2pa = 1e4  # factor to convert from dbar to Pa
+    rec_b0 = 1.0 / b0
+    rec_b2 = 1.0 / b2
+    b1sq = b1 * b1
+    b2p = b2 * p
+    disc = b1sq - b0 * b2
+    sqrt_disc = npx.sqrt(disc)
+    rec_sqrt_disc = 1.0 / sqrt_disc
+    ca = b1 - sqrt_disc
+    cb_p = b1 + sqrt_disc + b2p
+    p_term = p * (2.0 * b1 + b2p)
+    log_arg1 = 1.0 + p_term * rec_b0
+    log1 = npx.log(log_arg1)
+    log_arg2 = 1.0 + 2.0 * b2p * sqrt_disc / (ca * cb_p)
+    log2 = npx.log(log_arg2)
+    c1 = 4.0 * a3 * b1sq * rec_b2 - a3 * b0 - 2.0 * a2 * b1
+    cm = a1 + c1 * rec_b2
+    c2 = 2.0 * a3 * b0 * b1 * rec_b2 - a2 * b0
+    cn = a0 + c2 * rec_b2
+    c3 = cn * b2 - cm * b1
+
+    """
+    dynamic enthalpy
+    """
+    if runtime_settings.pyom_compatibility_mode:
+        Hd = gsw_dyn_enthalpy(sa, ct, p)
+    else:
+        Hd = (
+            db2pa
+            * (
+                p * (a2 - 2.0 * a3 * b1 * rec_b2 + 0.5 * a3 * p) * rec_b2
+                + (cm * 0.5 * rec_b2) * log1
+                + 0.5 * c3 * rec_b2 * rec_sqrt_disc * log2
+            )
+            - p * db2pa / rho0
+        )
+
+    """
+    d/dT of dynamic enthalpy (see gsw_dHdT)
+    """
+    t1 = v45 * ct
+    t2 = 0.2e1 * t1
+    t3 = v46 * sa
+    t5 = v14 * ct
+    t15 = v19 * ct
+    t25 = 0.5 * v13
+    t26 = 1.0 * t5
+    t27 = sa * v16
+    t28 = 0.5 * t27
+    t29 = t25 + t26 + t28
+    t33 = a3 * b1
+    t35 = rec_b2 * rec_b2
+    t37 = v18 + 2.0 * t15
+    t38 = t35 * t37
+    t57 = v40 * ct
+    t59 = ct * (v39 + t57)
+    t68 = rec_b2 * t29
+    t71 = a3 * b1sq
+    t74 = v04 * ct
+    t76 = ct * (v03 + t74)
+    t79 = v07 * ct
+    t83 = v11 * ct
+    t85 = ct * (v10 + t83)
+    t93 = v48 * b0
+    t105 = v02 + t76 + ct * (v03 + 2.0 * t74) + sa * (v06 + 2.0 * t79 + sqrtsa * (v09 + t85 + ct * (v10 + 2.0 * t83)))
+    t106 = a3 * t105
+    t107 = v44 + t2 + t3
+    t117 = a3 * b0
+    t123 = (
+        v38
+        + t59
+        + ct * (v39 + 2.0 * t57)
+        + sa * v42
+        + (
+            4.0 * v48 * b1sq * rec_b2
+            + 8.0 * t33 * t68
+            - 4.0 * t71 * t38
+            - t93
+            - t106
+            - 2.0 * t107 * b1
+            - 2.0 * a2 * t29
+        )
+        * rec_b2
+        - c1 * t35 * t37
+    )
+    t152 = t37 * p
+    t165 = v25 * ct
+    t167 = ct * (v24 + t165)
+    t169 = ct * (v23 + t167)
+    t175 = v30 * ct
+    t177 = ct * (v29 + t175)
+    t179 = ct * (v28 + t177)
+    t185 = v35 * ct
+    t187 = ct * (v34 + t185)
+    t189 = ct * (v33 + t187)
+    t199 = b1 * rec_b2
+    t245 = 1.0 / ca
+    t248 = 1.0 / cb_p
+    t249 = sqrt_disc * t245 * t248
+    t254 = rec_sqrt_disc * log2
+    t264 = c3 * rec_b2
+    t272 = 2.0 * b1 * t29 - t105 * b2 - b0 * t37
+    t282 = b2p * sqrt_disc
+    t287 = rec_sqrt_disc * t272 / 2.0
+
+    dHdT = (
+        0.1e5
+        * p
+        * (v44 + t2 + t3 - 2.0 * v48 * b1 * rec_b2 - 2.0 * a3 * t29 * rec_b2 + 2.0 * t33 * t38 + 0.5 * v48 * p)
+        * rec_b2
+        - 0.1e5 * p * (v43 + ct * (v44 + t1 + t3) - 2.0 * t33 * rec_b2 + 0.5 * a3 * p) * t38
+        + 0.5e4 * t123 * rec_b2 * log1
+        - 0.5e4 * cm * t35 * log1 * t37
+        + 0.5e4
+        * cm
+        * rec_b2
+        * (p * (1.0 * v13 + 2.0 * t5 + 1.0 * t27 + t152) * rec_b0 - p_term * rec_b0**2 * t105)
+        / log_arg1
+        + 0.5e4
+        * (
+            (
+                v22
+                + t169
+                + ct * (v23 + t167 + ct * (v24 + 2.0 * t165))
+                + sa
+                * (
+                    v27
+                    + t179
+                    + ct * (v28 + t177 + ct * (v29 + 2.0 * t175))
+                    + sqrtsa * (v32 + t189 + ct * (v33 + t187 + ct * (v34 + 2.0 * t185)))
+                )
+                + (
+                    2.0 * t93 * t199
+                    + 2.0 * t106 * t199
+                    + 2.0 * t117 * t68
+                    - 2.0 * t117 * b1 * t35 * t37
+                    - t107 * b0
+                    - a2 * t105
+                )
+                * rec_b2
+                - c2 * t35 * t37
+            )
+            * b2
+            + cn * t37
+            - t123 * b1
+            - cm * t29
+        )
+        * rec_b2
+        * t254
+        - 0.5e4 * c3 * t35 * t254 * t37
+        - 0.25e4 * t264 * rec_sqrt_disc / disc * log2 * t272
+        + 0.5e4
+        * t264
+        * rec_sqrt_disc
+        * (
+            2.0 * t152 * t249
+            + b2p * rec_sqrt_disc * t245 * t248 * t272
+            - 2.0 * t282 * t245**2 * t248 * (t25 + t26 + t28 - t287)
+            - 2.0 * t282 * t245 * t248**2 * (t25 + t26 + t28 + t287 + t152)
+        )
+        / log_arg2
+    )
+
+    """
+    d/dS of dynamic enthalpy (see gsw_dHdS)
+    """
+    s1 = ct * v46
+    s4 = 0.5 * v15
+    s5 = v16 * ct
+    s6 = 0.5 * s5
+    s7 = s4 + s6
+    s29 = t35 * v20
+    s48 = v42 * ct
+    s49 = rec_b2 * s7
+    s66 = sqrtsa * (v08 + ct * (v09 + ct * (v10 + v11 * ct)))
+    s68 = v05 + ct * (v06 + v07 * ct) + 3.0 / 2.0 * s66
+    s69 = a3 * s68
+    s93 = v41 + s48 + (8.0 * t33 * s49 - 4.0 * t71 * s29 - s69 - 2.0 * s1 * b1 - 2.0 * a2 * s7) * rec_b2 - c1 * s29
+    s123 = v20 * p
+    s142 = ct * (v27 + ct * (v28 + ct * (v29 + v30 * ct)))
+    s143 = v36 * sa
+    s151 = v31 + ct * (v32 + ct * (v33 + ct * (v34 + v35 * ct)))
+    s152 = sqrtsa * s151
+    s227 = 2.0 * b1 * s7 - s68 * b2 - b0 * v20
+    s242 = rec_sqrt_disc * s227 / 2.0
+
+    dHdS = (
+        0.1e5 * p * (s1 - 2.0 * a3 * s7 * rec_b2 + 2.0 * t33 * s29) * rec_b2
+        - 0.1e5 * p * (a2 - 2.0 * t33 * rec_b2 + 0.5 * a3 * p) * s29
+        + 0.5e4 * s93 * rec_b2 * log1
+        - 0.5e4 * cm * t35 * log1 * v20
+        + 0.5e4 * cm * rec_b2 * (p * (1.0 * v15 + 1.0 * s5 + s123) * rec_b0 - p_term * rec_b0**2 * s68) / log_arg1
+        + 0.5e4
+        * (
+            (
+                v26
+                + s142
+                + s143
+                + s152
+                + sa * (v36 + 1.0 / sqrtsa * s151 / 2.0)
+                + (2.0 * s69 * t199 + 2.0 * t117 * s49 - 2.0 * t117 * b1 * t35 * v20 - s1 * b0 - a2 * s68) * rec_b2
+                - c2 * t35 * v20
+            )
+            * b2
+            + cn * v20
+            - s93 * b1
+            - cm * s7
+        )
+        * rec_b2
+        * t254
+        - 0.5e4 * c3 * t35 * t254 * v20
+        - 0.25e4 * t264 * rec_sqrt_disc / disc * log2 * s227
+        + 0.5e4
+        * t264
+        * rec_sqrt_disc
+        * (
+            2.0 * s123 * t249
+            + b2p * rec_sqrt_disc * t245 * t248 * s227
+            - 2.0 * t282 * t245**2 * t248 * (s4 + s6 - s242)
+            - 2.0 * t282 * t245 * t248**2 * (s4 + s6 + s242 + s123)
+        )
+        / log_arg2
+    )
+
+    return rho, prho, rho_shifted, Hd, dHdT, dHdS
@@ -2,6 +2,7 @@ from veros.core.operators import numpy as npx
 
 from veros import veros_kernel, KernelOutput
 from veros.variables import allocate
+from veros.tiling import tiled
 from veros.core import utilities
 from veros.core.operators import update, update_add, update_multiply, at
 
@@ -31,6 +32,7 @@ def compute_dissipation(state, int_drhodX, flux_east, flux_north):
             + (int_drhodX[1:-1, 1:-1, :] - int_drhodX[1:-1, :-2, :]) * flux_north[1:-1, :-2, :]
         )
         / (vs.dyt[npx.newaxis, 1:-1, npx.newaxis] * vs.cost[npx.newaxis, 1:-1, npx.newaxis]),
+        inplace=True,
     )
 
     return diss
@@ -56,8 +58,9 @@ def dissipation_on_wgrid(state, diss, ks):
         )
         * edge_mask[:, :, :-1]
         + 0.5 * (diss[:, :, :-1] + diss[:, :, 1:]) * water_mask[:, :, :-1],
+        inplace=True,
     )
-    diss_w = update(diss_w, at[:, :, -1], diss[:, :, -1] * land_mask)
+    diss_w = update(diss_w, at[:, :, -1], diss[:, :, -1] * land_mask, inplace=True)
 
     return diss_w
 
@@ -96,6 +99,7 @@ def tempsalt_biharmonic(state):
     )
 
 
+@tiled
 @veros_kernel
 def tempsalt_diffusion(state):
     """
@@ -167,6 +171,10 @@ def biharmonic_diffusion(state, tr, diffusivity):
     vs = state.variables
     settings = state.settings
 
+    inv_dx_t = utilities.grid_metric(state, "inv_dx_t")
+    inv_dy_t = utilities.grid_metric(state, "inv_dy_t")
+    inv_dx_u = utilities.grid_metric(state, "inv_dx_u")
+
     del2 = allocate(state.dimensions, ("xt", "yt", "zt"))
     dtr = allocate(state.dimensions, ("xt", "yt", "zt"))
 
@@ -176,10 +184,7 @@ def biharmonic_diffusion(state, tr, diffusivity):
     flux_east = update(
         flux_east,
         at[:-1, :, :],
-        -diffusivity
-        * (tr[1:, :, :] - tr[:-1, :, :])
-        / (vs.cost[npx.newaxis, :, npx.newaxis] * vs.dxu[:-1, npx.newaxis, npx.newaxis])
-        * vs.maskU[:-1, :, :],
+        -diffusivity * (tr[1:, :, :] - tr[:-1, :, :]) * inv_dx_u[:-1, :, :],
     )
 
     flux_north = update(
@@ -195,9 +200,7 @@ def biharmonic_diffusion(state, tr, diffusivity):
     del2 = update(
         del2,
         at[1:, 1:, :],
-        vs.maskT[1:, 1:, :]
-        * (flux_east[1:, 1:, :] - flux_east[:-1, 1:, :])
-        / (vs.cost[npx.newaxis, 1:, npx.newaxis] * vs.dxt[1:, npx.newaxis, npx.newaxis])
+        (flux_east[1:, 1:, :] - flux_east[:-1, 1:, :]) * inv_dx_t[1:, 1:, :]
         + (flux_north[1:, 1:, :] - flux_north[1:, :-1, :])
         / (vs.cost[npx.newaxis, 1:, npx.newaxis] * vs.dyt[npx.newaxis, 1:, npx.newaxis]),
     )
@@ -207,10 +210,7 @@ def biharmonic_diffusion(state, tr, diffusivity):
     flux_east = update(
         flux_east,
         at[:-1, :, :],
-        diffusivity
-        * (del2[1:, :, :] - del2[:-1, :, :])
-        / (vs.cost[npx.newaxis, :, npx.newaxis] * vs.dxu[:-1, npx.newaxis, npx.newaxis])
-        * vs.maskU[:-1, :, :],
+        diffusivity * (del2[1:, :, :] - del2[:-1, :, :]) * inv_dx_u[:-1, :, :],
     )
     flux_north = update(
         flux_north,
@@ -228,14 +228,10 @@ def biharmonic_diffusion(state, tr, diffusivity):
     dtr = update(
         dtr,
         at[1:, 1:, :],
-        (flux_east[1:, 1:, :] - flux_east[:-1, 1:, :])
-        / (vs.cost[npx.newaxis, 1:, npx.newaxis] * vs.dxt[1:, npx.newaxis, npx.newaxis])
-        + (flux_north[1:, 1:, :] - flux_north[1:, :-1, :])
-        / (vs.cost[npx.newaxis, 1:, npx.newaxis] * vs.dyt[npx.newaxis, 1:, npx.newaxis]),
+        (flux_east[1:, 1:, :] - flux_east[:-1, 1:, :]) * inv_dx_t[1:, 1:, :]
+        + (flux_north[1:, 1:, :] - flux_north[1:, :-1, :]) * inv_dy_t[1:, 1:, :],
     )
 
-    dtr = dtr * vs.maskT
-
     return dtr, flux_east, flux_north
 
 
@@ -247,6 +243,10 @@ def horizontal_diffusion(state, tr, diffusivity):
     vs = state.variables
     settings = state.settings
 
+    inv_dx_t = utilities.grid_metric(state, "inv_dx_t")
+    inv_dy_t = utilities.grid_metric(state, "inv_dy_t")
+    inv_dx_u = utilities.grid_metric(state, "inv_dx_u")
+
     dtr_hmix = allocate(state.dimensions, ("xt", "yt", "zt"))
 
     flux_east = allocate(state.dimensions, ("xt", "yt", "zt"))
@@ -256,10 +256,7 @@ def horizontal_diffusion(state, tr, diffusivity):
     flux_east = update(
         flux_east,
         at[:-1, :, :],
-        diffusivity
-        * (tr[1:, :, :] - tr[:-1, :, :])
-        / (vs.cost[npx.newaxis, :, npx.newaxis] * vs.dxu[:-1, npx.newaxis, npx.newaxis])
-        * vs.maskU[:-1, :, :],
+        diffusivity * (tr[1:, :, :] - tr[:-1, :, :]) * inv_dx_u[:-1, :, :],
     )
     flux_east = update(flux_east, at[-1, :, :], 0.0)
 
@@ -285,13 +282,8 @@ def horizontal_diffusion(state, tr, diffusivity):
     dtr_hmix = update(
         dtr_hmix,
         at[1:, 1:, :],
-        (
-            (flux_east[1:, 1:, :] - flux_east[:-1, 1:, :])
-            / (vs.cost[npx.newaxis, 1:, npx.newaxis] * vs.dxt[1:, npx.newaxis, npx.newaxis])
-            + (flux_north[1:, 1:, :] - flux_north[1:, :-1, :])
-            / (vs.cost[npx.newaxis, 1:, npx.newaxis] * vs.dyt[npx.newaxis, 1:, npx.newaxis])
-        )
-        * vs.maskT[1:, 1:, :],
+        (flux_east[1:, 1:, :] - flux_east[:-1, 1:, :]) * inv_dx_t[1:, 1:, :]
+        + (flux_north[1:, 1:, :] - flux_north[1:, :-1, :]) * inv_dy_t[1:, 1:, :],
     )
 
     return dtr_hmix, flux_east, flux_north
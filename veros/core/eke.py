@@ -72,7 +72,7 @@ def set_eke_diffusivities_kernel(state):
         vs.K_gm = update(vs.K_gm, at[...], settings.K_gm_0)
 
     if settings.enable_eke and settings.enable_eke_isopycnal_diffusion:
-        vs.K_iso = update(vs.K_iso, at[...], vs.K_gm)
+        vs.K_iso = update(vs.K_iso, at[...], vs.K_gm, inplace=True)
     else:
         vs.K_iso = update(vs.K_iso, at[...], settings.K_iso_0)  # always constant
 
@@ -98,6 +98,9 @@ def integrate_eke_kernel(state):
     vs = state.variables
     settings = state.settings
 
+    inv_dx_w = utilities.grid_metric(state, "inv_dx_w")
+    inv_dy_w = utilities.grid_metric(state, "inv_dy_w")
+
     c_int = allocate(state.dimensions, ("xt", "yt", "zt"))
 
     flux_east = allocate(state.dimensions, ("xt", "yt", "zt"))
@@ -141,27 +144,41 @@ def integrate_eke_kernel(state):
         * settings.alpha_eke,
     )
     a_tri = update(a_tri, at[:, :, 1:-1], -delta[:, :, :-2] / vs.dzw[1:-1])
-    a_tri = update(a_tri, at[:, :, -1], -delta[:, :, -2] / (0.5 * vs.dzw[-1]))
+    a_tri = update(a_tri, at[:, :, -1], -delta[:, :, -2] / (0.5 * vs.dzw[-1]), inplace=True)
     b_tri = update(
         b_tri,
         at[:, :, 1:-1],
         1 + (delta[:, :, 1:-1] + delta[:, :, :-2]) / vs.dzw[1:-1] + settings.dt_tracer * c_int[2:-2, 2:-2, 1:-1],
     )
     b_tri = update(
-        b_tri, at[:, :, -1], 1 + delta[:, :, -2] / (0.5 * vs.dzw[-1]) + settings.dt_tracer * c_int[2:-2, 2:-2, -1]
+        b_tri,
+        at[:, :, -1],
+        1 + delta[:, :, -2] / (0.5 * vs.dzw[-1]) + settings.dt_tracer * c_int[2:-2, 2:-2, -1],
+        inplace=True,
     )
     b_tri_edge = 1 + delta / vs.dzw[npx.newaxis, npx.newaxis, :] + settings.dt_tracer * c_int[2:-2, 2:-2, :]
     c_tri = update(c_tri, at[:, :, :-1], -delta[:, :, :-1] / vs.dzw[npx.newaxis, npx.newaxis, :-1])
     d_tri = update(d_tri, at[:, :, :], vs.eke[2:-2, 2:-2, :, vs.tau] + settings.dt_tracer * forc[2:-2, 2:-2, :])
 
-    sol = utilities.solve_implicit(a_tri, b_tri, c_tri, d_tri, water_mask, b_edge=b_tri_edge, edge_mask=edge_mask)
-    vs.eke = update(vs.eke, at[2:-2, 2:-2, :, vs.taup1], npx.where(water_mask, sol, vs.eke[2:-2, 2:-2, :, vs.taup1]))
+    sol = utilities.solve_implicit(
+        a_tri,
+        b_tri,
+        c_tri,
+        d_tri,
+        water_mask,
+        b_edge=b_tri_edge,
+        edge_mask=edge_mask,
+        wet_columns=utilities.get_wet_columns(state, interior=True),
+    )
+    vs.eke = update(
+        vs.eke, at[2:-2, 2:-2, :, vs.taup1], npx.where(water_mask, sol, vs.eke[2:-2, 2:-2, :, vs.taup1]), inplace=True
+    )
 
     """
     store eke dissipation
     """
     vs.eke_diss_iw = c_int * vs.eke[:, :, :, vs.taup1]
-    vs.eke_diss_tke = update(vs.eke_diss_tke, at[...], 0.0)
+    vs.eke_diss_tke = update(vs.eke_diss_tke, at[...], 0.0, inplace=True)
 
     """
     add tendency due to lateral diffusion
@@ -174,8 +191,9 @@ def integrate_eke_kernel(state):
         * (vs.eke[1:, :, :, vs.tau] - vs.eke[:-1, :, :, vs.tau])
         / (vs.cost[npx.newaxis, :, npx.newaxis] * vs.dxu[:-1, npx.newaxis, npx.newaxis])
         * vs.maskU[:-1, :, :],
+        inplace=True,
     )
-    flux_east = update(flux_east, at[-1, :, :], 0.0)
+    flux_east = update(flux_east, at[-1, :, :], 0.0, inplace=True)
     flux_north = update(
         flux_north,
         at[:, :-1, :],
@@ -185,19 +203,18 @@ def integrate_eke_kernel(state):
         / vs.dyu[npx.newaxis, :-1, npx.newaxis]
         * vs.maskV[:, :-1, :]
         * vs.cosu[npx.newaxis, :-1, npx.newaxis],
+        inplace=True,
     )
-    flux_north = update(flux_north, at[:, -1, :], 0.0)
+    flux_north = update(flux_north, at[:, -1, :], 0.0, inplace=True)
     vs.eke = update_add(
         vs.eke,
         at[2:-2, 2:-2, :, vs.taup1],
         settings.dt_tracer
-        * vs.maskW[2:-2, 2:-2, :]
         * (
-            (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :])
-            / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
-            + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :])
-            / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dyt[npx.newaxis, 2:-2, npx.newaxis])
+            (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :]) * inv_dx_w[2:-2, 2:-2, :]
+            + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :]) * inv_dy_w[2:-2, 2:-2, :]
         ),
+        inplace=True,
     )
 
     """
@@ -213,22 +230,19 @@ def integrate_eke_kernel(state):
         vs.deke = update(
             vs.deke,
             at[2:-2, 2:-2, :, vs.tau],
-            vs.maskW[2:-2, 2:-2, :]
-            * (
-                -(flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
-                - (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dyt[npx.newaxis, 2:-2, npx.newaxis])
-            ),
+            -(flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :]) * inv_dx_w[2:-2, 2:-2, :]
+            - (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :]) * inv_dy_w[2:-2, 2:-2, :],
+            inplace=True,
         )
-        vs.deke = update_add(vs.deke, at[:, :, 0, vs.tau], -flux_top[:, :, 0] / vs.dzw[0])
+        vs.deke = update_add(vs.deke, at[:, :, 0, vs.tau], -flux_top[:, :, 0] / vs.dzw[0], inplace=True)
         vs.deke = update_add(
             vs.deke,
             at[:, :, 1:-1, vs.tau],
             -(flux_top[:, :, 1:-1] - flux_top[:, :, :-2]) / vs.dzw[npx.newaxis, npx.newaxis, 1:-1],
+            inplace=True,
         )
         vs.deke = update_add(
-            vs.deke, at[:, :, -1, vs.tau], -(flux_top[:, :, -1] - flux_top[:, :, -2]) / (0.5 * vs.dzw[-1])
+            vs.deke, at[:, :, -1, vs.tau], -(flux_top[:, :, -1] - flux_top[:, :, -2]) / (0.5 * vs.dzw[-1]), inplace=True
         )
         """
         Adam Bashforth time stepping
@@ -241,6 +255,7 @@ def integrate_eke_kernel(state):
                 (1.5 + settings.AB_eps) * vs.deke[:, :, :, vs.tau]
                 - (0.5 + settings.AB_eps) * vs.deke[:, :, :, vs.taum1]
             ),
+            inplace=True,
         )
 
         conditional_outputs.update(deke=vs.deke)
@@ -35,7 +35,7 @@ def solve_pressure(state):
     vs.update(barotropic_velocity_update(state))
 
 
-@veros_kernel
+@veros_kernel(donate_outputs=True)
 def prepare_forcing(state):
     vs = state.variables
     settings = state.settings
@@ -67,12 +67,11 @@ def prepare_forcing(state):
     vs.p_hydro = for_loop(1, settings.nz, compute_p_hydro, vs.p_hydro)
 
     # add hydrostatic pressure gradient
+    inv_dx_u = mainutils.grid_metric(state, "inv_dx_u")
     vs.du = update_add(
         vs.du,
         at[2:-2, 2:-2, :, vs.tau],
-        -(vs.p_hydro[3:-1, 2:-2, :] - vs.p_hydro[2:-2, 2:-2, :])
-        / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxu[2:-2, npx.newaxis, npx.newaxis])
-        * vs.maskU[2:-2, 2:-2, :],
+        -(vs.p_hydro[3:-1, 2:-2, :] - vs.p_hydro[2:-2, 2:-2, :]) * inv_dx_u[2:-2, 2:-2, :],
     )
     vs.dv = update_add(
         vs.dv,
@@ -29,7 +29,7 @@ def solve_streamfunction(state):
     vs.update(barotropic_velocity_update(state, uloc=uloc, vloc=vloc))
 
 
-@veros_kernel
+@veros_kernel(donate_outputs=True)
 def prepare_forcing(state):
     vs = state.variables
     settings = state.settings
@@ -39,6 +39,7 @@ def prepare_forcing(state):
         vs.p_hydro,
         at[:, :, -1],
         0.5 * vs.rho[:, :, -1, vs.tau] * settings.grav / settings.rho_0 * vs.dzw[-1] * vs.maskT[:, :, -1],
+        inplace=True,
     )
 
     def compute_p_hydro(k_inv, p_hydro):
@@ -67,6 +68,7 @@ def prepare_forcing(state):
         -(vs.p_hydro[3:-1, 2:-2, :] - vs.p_hydro[2:-2, 2:-2, :])
         / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxu[2:-2, npx.newaxis, npx.newaxis])
         * vs.maskU[2:-2, 2:-2, :],
+        inplace=True,
     )
     vs.dv = update_add(
         vs.dv,
@@ -74,6 +76,7 @@ def prepare_forcing(state):
         -(vs.p_hydro[2:-2, 3:-1, :] - vs.p_hydro[2:-2, 2:-2, :])
         / vs.dyu[npx.newaxis, 2:-2, npx.newaxis]
         * vs.maskV[2:-2, 2:-2, :],
+        inplace=True,
     )
 
     # forcing for barotropic streamfunction
@@ -89,10 +92,11 @@ def prepare_forcing(state):
         at[2:-2, 2:-2],
         (vloc[3:-1, 2:-2] - vloc[2:-2, 2:-2]) / (vs.cosu[2:-2] * vs.dxu[2:-2, npx.newaxis])
         - (vs.cost[3:-1] * uloc[2:-2, 3:-1] - vs.cost[2:-2] * uloc[2:-2, 2:-2]) / (vs.cosu[2:-2] * vs.dyu[2:-2]),
+        inplace=True,
     )
 
     # solve for interior streamfunction
-    vs.dpsi = update(vs.dpsi, at[:, :, vs.taup1], 2 * vs.dpsi[:, :, vs.tau] - vs.dpsi[:, :, vs.taum1])
+    vs.dpsi = update(vs.dpsi, at[:, :, vs.taup1], 2 * vs.dpsi[:, :, vs.tau] - vs.dpsi[:, :, vs.taum1], inplace=True)
 
     return KernelOutput(du=vs.du, dv=vs.dv, dpsi=vs.dpsi, p_hydro=vs.p_hydro), (forc, uloc, vloc)
 
@@ -106,7 +110,10 @@ def barotropic_velocity_update(state, uloc, vloc):
     settings = state.settings
 
     vs.dpsi = update(
-        vs.dpsi, at[:, :, vs.taup1], mainutils.enforce_boundaries(vs.dpsi[:, :, vs.taup1], settings.enable_cyclic_x)
+        vs.dpsi,
+        at[:, :, vs.taup1],
+        mainutils.enforce_boundaries(vs.dpsi[:, :, vs.taup1], settings.enable_cyclic_x),
+        inplace=True,
     )
 
     line_forc = allocate(state.dimensions, ("isle",))
@@ -119,6 +126,7 @@ def barotropic_velocity_update(state, uloc, vloc):
             line_integrals.line_integrals(state, uloc=uloc[..., npx.newaxis], vloc=vloc[..., npx.newaxis], kind="same")[
                 1:
             ],
+            inplace=True,
         )
 
         # calculate island integrals of interior streamfunction
@@ -132,6 +140,7 @@ def barotropic_velocity_update(state, uloc, vloc):
             * (vs.dpsi[1:, 1:, vs.taup1] - vs.dpsi[1:, :-1, vs.taup1])
             / vs.dyt[npx.newaxis, 1:]
             * vs.hur[1:, 1:],
+            inplace=True,
         )
         vloc = update(
             vloc,
@@ -140,6 +149,7 @@ def barotropic_velocity_update(state, uloc, vloc):
             * (vs.dpsi[1:, 1:, vs.taup1] - vs.dpsi[:-1, 1:, vs.taup1])
             / (vs.cosu[npx.newaxis, 1:] * vs.dxt[1:, npx.newaxis])
             * vs.hvr[1:, 1:],
+            inplace=True,
         )
         line_forc = update_add(
             line_forc,
@@ -147,10 +157,11 @@ def barotropic_velocity_update(state, uloc, vloc):
             -line_integrals.line_integrals(
                 state, uloc=uloc[..., npx.newaxis], vloc=vloc[..., npx.newaxis], kind="same"
             )[1:],
+            inplace=True,
         )
 
         # solve for time dependent boundary values
-        vs.dpsin = update(vs.dpsin, at[1:, vs.tau], npx.linalg.solve(vs.line_psin[1:, 1:], line_forc[1:]))
+        vs.dpsin = update(vs.dpsin, at[1:, vs.tau], npx.linalg.solve(vs.line_psin[1:, 1:], line_forc[1:]), inplace=True)
 
     # integrate barotropic and baroclinic velocity forward in time
     vs.psi = update(
@@ -159,6 +170,7 @@ def barotropic_velocity_update(state, uloc, vloc):
         vs.psi[:, :, vs.tau]
         + settings.dt_mom
         * ((1.5 + settings.AB_eps) * vs.dpsi[:, :, vs.taup1] - (0.5 + settings.AB_eps) * vs.dpsi[:, :, vs.tau]),
+        inplace=True,
     )
     vs.psi = update_add(
         vs.psi,
@@ -169,6 +181,7 @@ def barotropic_velocity_update(state, uloc, vloc):
             * vs.psin[:, :, 1:],
             axis=2,
         ),
+        inplace=True,
     )
     vs.u = update(
         vs.u,
@@ -181,6 +194,7 @@ def barotropic_velocity_update(state, uloc, vloc):
             - (0.5 + settings.AB_eps) * vs.du[:, :, :, vs.taum1]
         )
         * vs.maskU,
+        inplace=True,
     )
     vs.v = update(
         vs.v,
@@ -193,13 +207,18 @@ def barotropic_velocity_update(state, uloc, vloc):
             - (0.5 + settings.AB_eps) * vs.dv[:, :, :, vs.taum1]
         )
         * vs.maskV,
+        inplace=True,
     )
 
     # subtract incorrect vertical mean from baroclinic velocity
     uloc = npx.sum(vs.u[:, :, :, vs.taup1] * vs.maskU * vs.dzt, axis=2)
     vloc = npx.sum(vs.v[:, :, :, vs.taup1] * vs.maskV * vs.dzt, axis=2)
-    vs.u = update_add(vs.u, at[:, :, :, vs.taup1], -uloc[:, :, npx.newaxis] * vs.maskU * vs.hur[:, :, npx.newaxis])
-    vs.v = update_add(vs.v, at[:, :, :, vs.taup1], -vloc[:, :, npx.newaxis] * vs.maskV * vs.hvr[:, :, npx.newaxis])
+    vs.u = update_add(
+        vs.u, at[:, :, :, vs.taup1], -uloc[:, :, npx.newaxis] * vs.maskU * vs.hur[:, :, npx.newaxis], inplace=True
+    )
+    vs.v = update_add(
+        vs.v, at[:, :, :, vs.taup1], -vloc[:, :, npx.newaxis] * vs.maskV * vs.hvr[:, :, npx.newaxis], inplace=True
+    )
 
     # add barotropic mode to baroclinic velocity
     vs.u = update_add(
@@ -210,6 +229,7 @@ def barotropic_velocity_update(state, uloc, vloc):
         * (vs.psi[2:-2, 2:-2, vs.taup1, npx.newaxis] - vs.psi[2:-2, 1:-3, vs.taup1, npx.newaxis])
         / vs.dyt[npx.newaxis, 2:-2, npx.newaxis]
         * vs.hur[2:-2, 2:-2, npx.newaxis],
+        inplace=True,
     )
     vs.v = update_add(
         vs.v,
@@ -218,6 +238,7 @@ def barotropic_velocity_update(state, uloc, vloc):
         * (vs.psi[2:-2, 2:-2, vs.taup1, npx.newaxis] - vs.psi[1:-3, 2:-2, vs.taup1, npx.newaxis])
         / (vs.cosu[2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
         * vs.hvr[2:-2, 2:-2][:, :, npx.newaxis],
+        inplace=True,
     )
 
     return KernelOutput(u=vs.u, v=vs.v, psi=vs.psi, dpsi=vs.dpsi, dpsin=vs.dpsin)
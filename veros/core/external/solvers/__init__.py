@@ -21,10 +21,22 @@ def _get_solver_class():
 
     def _get_best_solver():
         if rst.proc_num > 1:
+            from veros.distributed import is_local_comm
+
+            if is_local_comm(rs.mpi_comm):
+                # PETSc requires an MPI communicator
+                from veros.core.external.solvers.distributed_bicgstab import DistributedBiCGSTABSolver
+
+                return DistributedBiCGSTABSolver
+
             try:
                 from veros.core.external.solvers.petsc_ import PETScSolver
             except ImportError:
-                logger.warning("PETSc linear solver not available, falling back to SciPy")
+                logger.warning("PETSc linear solver not available, falling back to distributed BiCGSTAB")
+
+                from veros.core.external.solvers.distributed_bicgstab import DistributedBiCGSTABSolver
+
+                return DistributedBiCGSTABSolver
             else:
                 return PETScSolver
 
@@ -51,6 +63,18 @@ def _get_solver_class():
         from veros.core.external.solvers.scipy_jax import JAXSciPySolver
 
         return JAXSciPySolver
+    elif ls == "distributed":
+        from veros.core.external.solvers.distributed_bicgstab import DistributedBiCGSTABSolver
+
+        return DistributedBiCGSTABSolver
+    elif ls == "direct":
+        from veros.core.external.solvers.direct import DirectSolver
+
+        return DirectSolver
+    elif ls == "multigrid":
+        from veros.core.external.solvers.multigrid import MultigridSolver
+
+        return MultigridSolver
 
     raise ValueError(f"unrecognized linear solver {ls}")
 
@@ -59,4 +83,11 @@ def _get_solver_class():
 def get_linear_solver(state):
     logger.debug("Initializing linear solver")
     SolverClass = _get_solver_class()
-    return SolverClass(state)
+    solver = SolverClass(state)
+
+    if rs.projection_vectors > 0:
+        from veros.core.external.solvers.projection import ProjectedGuessSolver
+
+        solver = ProjectedGuessSolver(state, solver, rs.projection_vectors)
+
+    return solver
@@ -0,0 +1,83 @@
+"""On-disk cache for expensive solver setup data.
+
+Entries are stored as ``.npz`` files in the directory given by the ``cache_dir`` runtime setting,
+and are addressed by a hash of all inputs that went into computing them.
+"""
+
+import os
+import hashlib
+import tempfile
+import zipfile
+
+import numpy as onp
+
+from veros import logger, runtime_settings as rs
+
+# bump this to invalidate all existing cache entries
+CACHE_VERSION = 1
+
+
+def get_cache_key(arrays, metadata):
+    """Compute a content hash from a dict of arrays and a dict of (hashable, repr-able) metadata."""
+    hasher = hashlib.sha256()
+    hasher.update(repr((CACHE_VERSION, sorted(metadata.items()))).encode())
+
+    for name in sorted(arrays.keys()):
+        arr = onp.ascontiguousarray(arrays[name])
+        hasher.update(repr((name, arr.dtype.str, arr.shape)).encode())
+        hasher.update(arr.tobytes())
+
+    return hasher.hexdigest()
+
+
+def _get_cache_path(namespace, key):
+    return os.path.join(rs.cache_dir, namespace, f"{key}.npz")
+
+
+def load(namespace, key):
+    """Return the cache entry for the given key as a dict of arrays (or None if it does not exist)."""
+    if rs.cache_dir is None:
+        return None
+
+    path = _get_cache_path(namespace, key)
+
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        with onp.load(path, allow_pickle=False) as infile:
+            return {name: infile[name] for name in infile.files}
+    except (OSError, ValueError, zipfile.BadZipFile) as exc:
+        logger.warning(f"Ignoring unreadable cache file {path} ({exc!s})")
+        return None
+
+
+def store(namespace, key, data):
+    """Write a dict of arrays to the cache.
+
+    Writes to a temporary file first, so concurrent runs never see partially written entries.
+    """
+    if rs.cache_dir is None:
+        return
+
+    path = _get_cache_path(namespace, key)
+    cache_dir = os.path.dirname(path)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as outfile:
+                onp.savez(outfile, **data)
+
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    except OSError as exc:
+        logger.warning(f"Could not write cache file {path} ({exc!s})")
+        return
+
+    logger.debug(f"Wrote cache file {path}")
@@ -0,0 +1,181 @@
+import numpy as onp
+import scipy.sparse
+import scipy.sparse.csgraph
+import scipy.sparse.linalg as spalg
+
+from veros import logger, veros_routine, runtime_settings as rs, runtime_state as rst
+from veros.core.operators import numpy as npx
+from veros.core.external.solvers import cache as solver_cache
+from veros.core.external.solvers.scipy import (
+    SciPySolver,
+    RestoredILU,
+    MATRIX_VARIABLES,
+    gather_variables,
+    scatter_variables,
+)
+
+# fill-reducing column ordering used by SuperLU
+PERMC_SPEC = "COLAMD"
+
+# memory per stored matrix entry (float64 value + int32 index)
+BYTES_PER_ENTRY = 12
+
+# entries of the LU factors per n * log2(n) unknowns (nested dissection estimate for 2D grids,
+# COLAMD ordering gives 4-7 for Poisson matrices of typical ocean grids)
+FILL_CONSTANT = 8
+
+
+def predict_factor_memory(matrix):
+    """Estimated memory of the LU factors of matrix in bytes.
+
+    This is the smaller of the nested dissection estimate for 2D grids and a strict upper bound
+    from the bandwidth after reverse Cuthill-McKee ordering (fill of a banded LU factorization with
+    partial pivoting stays within the band).
+    """
+    matrix = matrix.tocsr()
+    num_unknowns = matrix.shape[0]
+
+    perm = scipy.sparse.csgraph.reverse_cuthill_mckee(matrix, symmetric_mode=False)
+    reordered = matrix[perm][:, perm].tocoo()
+    bandwidth = int(onp.max(onp.abs(reordered.row - reordered.col), initial=0))
+    # L has the lower band, U the upper band (which may double through row pivoting)
+    band_entries = num_unknowns * (3 * bandwidth + 1)
+
+    nested_dissection_entries = FILL_CONSTANT * num_unknowns * onp.log2(max(num_unknowns, 2))
+
+    return min(band_entries, nested_dissection_entries) * BYTES_PER_ENTRY
+
+
+class DirectSolver(SciPySolver):
+    """Solves the (time-invariant) Poisson equation with a sparse LU factorization.
+
+    The matrix is factorized once at startup (and cached to disk if the ``cache_dir`` runtime setting is
+    given), so every solve only consists of a forward / backward substitution.
+
+    Falls back to the iterative SciPy solver if the factors exceed the ``direct_solver_max_memory``
+    runtime setting (in MB).
+    """
+
+    @veros_routine(
+        local_variables=MATRIX_VARIABLES,
+        dist_safe=False,
+    )
+    def __init__(self, state):
+        self._lu = None
+
+        cache_key = None
+        cached_data = None
+
+        if rs.cache_dir is not None:
+            cache_key = self._get_cache_key(state)
+            cached_data = solver_cache.load("direct", cache_key)
+
+        if cached_data is not None:
+            logger.info("Using cached LU factorization")
+            self._boundary_mask = npx.asarray(cached_data["boundary_mask"])
+            self._rhs_scale = cached_data["rhs_scale"]
+            self._lu = RestoredILU(
+                self._restore_factor(cached_data, "L"),
+                self._restore_factor(cached_data, "U"),
+                cached_data["perm_r"],
+                cached_data["perm_c"],
+            )
+            return
+
+        matrix, boundary_mask = self._assemble_poisson_matrix(state)
+
+        predicted_memory = predict_factor_memory(matrix) / 1024**2
+        if predicted_memory > rs.direct_solver_max_memory:
+            logger.warning(
+                f"Predicted memory of LU factorization ({predicted_memory:.0f}MB) exceeds "
+                f"direct_solver_max_memory ({rs.direct_solver_max_memory:.0f}MB), "
+                "falling back to iterative solver"
+            )
+            super().__init__(state)
+            return
+
+        self._boundary_mask = boundary_mask
+
+        jacobi_precon = self._jacobi_preconditioner(state, matrix)
+        matrix = jacobi_precon * matrix
+        self._rhs_scale = jacobi_precon.diagonal()
+
+        logger.info("Computing LU factorization...")
+        lu = spalg.splu(matrix.tocsc(), permc_spec=PERMC_SPEC)
+
+        factor_memory = (lu.L.nnz + lu.U.nnz) * BYTES_PER_ENTRY / 1024**2
+        logger.debug(f" LU factors use {factor_memory:.0f}MB (predicted: {predicted_memory:.0f}MB)")
+
+        if factor_memory > rs.direct_solver_max_memory:
+            logger.warning(
+                f"LU factorization ({factor_memory:.0f}MB) exceeds direct_solver_max_memory "
+                f"({rs.direct_solver_max_memory:.0f}MB), falling back to iterative solver"
+            )
+            del lu
+            super().__init__(state)
+            return
+
+        self._lu = lu
+
+        if cache_key is not None:
+            self._write_cache(cache_key, self._lu)
+
+    @staticmethod
+    def _restore_factor(cached_data, name):
+        return scipy.sparse.csc_matrix(
+            (cached_data[f"{name}_data"], cached_data[f"{name}_indices"], cached_data[f"{name}_indptr"]),
+            shape=tuple(cached_data["matrix_shape"]),
+        )
+
+    def _write_cache(self, cache_key, lu):
+        L, U = lu.L.tocsc(), lu.U.tocsc()
+        solver_cache.store(
+            "direct",
+            cache_key,
+            dict(
+                matrix_shape=onp.array(L.shape),
+                boundary_mask=onp.asarray(self._boundary_mask),
+                rhs_scale=self._rhs_scale,
+                L_data=L.data,
+                L_indices=L.indices,
+                L_indptr=L.indptr,
+                U_data=U.data,
+                U_indices=U.indices,
+                U_indptr=U.indptr,
+                perm_r=lu.perm_r,
+                perm_c=lu.perm_c,
+            ),
+        )
+
+    def _direct_solver(self, state, rhs, boundary_val):
+        orig_shape = rhs.shape
+        orig_dtype = rhs.dtype
+
+        rhs = npx.where(self._boundary_mask, rhs, boundary_val)  # set right hand side on boundaries
+        rhs = onp.asarray(rhs.reshape(-1) * self._rhs_scale, dtype="float64")
+
+        linear_solution = self._lu.solve(rhs)
+
+        return npx.asarray(linear_solution, dtype=orig_dtype).reshape(orig_shape)
+
+    def solve(self, state, rhs, x0, boundary_val=None):
+        """
+        Solves a 2D Poisson equation through forward / backward substitution with the LU factors.
+
+        Arguments:
+            rhs: Right-hand side vector
+            x0: Initial guess (only used for boundary values)
+            boundary_val: Array containing values to set on boundary elements. Defaults to `x0`.
+
+        """
+        if self._lu is None:
+            return super().solve(state, rhs, x0, boundary_val=boundary_val)
+
+        rhs_global, _, boundary_val = gather_variables(state, rhs, x0, boundary_val)
+
+        if rst.proc_rank == 0:
+            linear_solution = self._direct_solver(state, rhs_global, boundary_val=boundary_val)
+        else:
+            linear_solution = npx.empty_like(rhs)
+
+        return scatter_variables(state, linear_solution)
@@ -0,0 +1,338 @@
+import numpy as onp
+import scipy.sparse
+import scipy.sparse.linalg as spalg
+
+from veros import logger, veros_routine, runtime_state as rst
+from veros.core.operators import numpy as npx
+from veros.core.external.solvers.base import LinearSolver
+from veros.core.external.solvers.scipy import MATRIX_VARIABLES, gather_variables, scatter_variables
+from veros.core.external.poisson_matrix import assemble_poisson_matrix
+
+# stop coarsening once the grid is smaller than this in any direction
+MIN_COARSE_SIZE = 4
+
+# solve directly on levels with fewer unknowns than this
+MAX_DIRECT_SIZE = 2000
+
+NUM_SMOOTHING_SWEEPS = 2
+
+# piecewise constant interpolation underestimates smooth errors, so coarse grid
+# corrections are scaled up
+OVER_CORRECTION = 1.8
+
+# SciPy 1.12 renamed the relative tolerance of iterative solvers from tol to rtol
+if tuple(int(v) for v in scipy.__version__.split(".")[:2]) >= (1, 12):
+    BICGSTAB_RTOL_ARG = "rtol"
+else:
+    BICGSTAB_RTOL_ARG = "tol"
+
+
+def _shift(arr, direction, cyclic):
+    """Value of the neighbor in the given direction ("east", "west", "north", "south") of every grid point.
+
+    Points without a neighbor get 0.
+    """
+    out = onp.zeros_like(arr)
+
+    if direction == "east":
+        out[:-1] = arr[1:]
+        if cyclic:
+            out[-1] = arr[0]
+    elif direction == "west":
+        out[1:] = arr[:-1]
+        if cyclic:
+            out[0] = arr[-1]
+    elif direction == "north":
+        out[:, :-1] = arr[:, 1:]
+    elif direction == "south":
+        out[:, 1:] = arr[:, :-1]
+    else:
+        raise ValueError(f"unknown direction {direction}")
+
+    return out
+
+
+class StencilLevel:
+    """A 5-point stencil operator on one grid level, scaled to unit diagonal.
+
+    Rows of points that are not unknowns are identity rows that are decoupled from the rest of the system.
+    """
+
+    def __init__(self, coeffs, unknown_mask, cyclic):
+        self.unknown_mask = unknown_mask
+        self.cyclic = cyclic
+
+        main_diag = onp.where(unknown_mask, coeffs["main"], 1.0)
+        self.row_scale = 1.0 / main_diag
+        self.coeffs = {key: onp.where(unknown_mask, val / main_diag, 0.0) for key, val in coeffs.items()}
+        self.coeffs["main"] = onp.ones_like(main_diag)
+
+        # points are stored in red-black order, so each color is a contiguous block
+        nx, ny = unknown_mask.shape
+        colors = ((onp.arange(nx)[:, onp.newaxis] + onp.arange(ny)[onp.newaxis, :]) % 2).ravel()
+        self.permutation = onp.argsort(colors, kind="stable")
+        self.num_red = onp.count_nonzero(colors == 0)
+
+        self.matrix = self.permute(self.to_sparse().tocsr())
+        red, black = slice(None, self.num_red), slice(self.num_red, None)
+        self._color_couplings = (self.matrix[red, black], self.matrix[black, red])
+
+    @property
+    def shape(self):
+        return self.unknown_mask.shape
+
+    @property
+    def size(self):
+        return self.unknown_mask.size
+
+    def permute(self, matrix, other=None):
+        """Reorder rows (and columns, taken from level `other` if given) of a sparse matrix"""
+        if other is None:
+            other = self
+        return matrix[self.permutation][:, other.permutation]
+
+    def matvec(self, x):
+        return self.matrix @ x
+
+    def smooth(self, x, rhs, reverse=False):
+        """Red-black Gauss-Seidel sweeps (main diagonal is 1)"""
+        red, black = slice(None, self.num_red), slice(self.num_red, None)
+        red_black_couplings, black_red_couplings = self._color_couplings
+
+        for _ in range(NUM_SMOOTHING_SWEEPS):
+            if reverse:
+                x[black] = rhs[black] - black_red_couplings @ x[red]
+                x[red] = rhs[red] - red_black_couplings @ x[black]
+            else:
+                x[red] = rhs[red] - red_black_couplings @ x[black]
+                x[black] = rhs[black] - black_red_couplings @ x[red]
+
+        return x
+
+    def to_sparse(self):
+        nx, ny = self.shape
+        idx = onp.arange(nx * ny).reshape(nx, ny)
+
+        rows, cols, vals = [idx.ravel()], [idx.ravel()], [self.coeffs["main"].ravel()]
+        for direction in ("east", "west", "north", "south"):
+            neighbor_idx = _shift(idx, direction, self.cyclic)
+            coupled = self.coeffs[direction] != 0
+            rows.append(idx[coupled])
+            cols.append(neighbor_idx[coupled])
+            vals.append(self.coeffs[direction][coupled])
+
+        return scipy.sparse.csc_matrix(
+            (onp.concatenate(vals), (onp.concatenate(rows), onp.concatenate(cols))), shape=(nx * ny, nx * ny)
+        )
+
+
+def _aggregate(n):
+    return onp.arange(n) // 2, (n + 1) // 2
+
+
+def coarsen(level):
+    """Galerkin coarsening with piecewise constant interpolation on 2x2 aggregates.
+
+    This preserves the 5-point structure of the stencil.
+    """
+    nx, ny = level.shape
+    agg_x, ncx = _aggregate(nx)
+    agg_y, ncy = _aggregate(ny)
+
+    fine_i, fine_j = onp.meshgrid(onp.arange(nx), onp.arange(ny), indexing="ij")
+    coarse_i, coarse_j = agg_x[fine_i], agg_y[fine_j]
+
+    # undo row scaling, so coarse operator is R A P of the original operator
+    coeffs = {key: val / level.row_scale for key, val in level.coeffs.items()}
+    coeffs["main"] = onp.where(level.unknown_mask, coeffs["main"], 0.0)
+
+    coarse_coeffs = {key: onp.zeros((ncx, ncy)) for key in ("main", "east", "west", "north", "south")}
+    onp.add.at(coarse_coeffs["main"], (coarse_i, coarse_j), coeffs["main"])
+
+    for direction in ("east", "west", "north", "south"):
+        coarse_neighbor_i = _shift(coarse_i, direction, level.cyclic) if direction in ("east", "west") else coarse_i
+        coarse_neighbor_j = _shift(coarse_j, direction, False) if direction in ("north", "south") else coarse_j
+        is_internal = onp.logical_and(coarse_neighbor_i == coarse_i, coarse_neighbor_j == coarse_j)
+        onp.add.at(
+            coarse_coeffs["main"],
+            (coarse_i[is_internal], coarse_j[is_internal]),
+            coeffs[direction][is_internal],
+        )
+        onp.add.at(
+            coarse_coeffs[direction],
+            (coarse_i[~is_internal], coarse_j[~is_internal]),
+            coeffs[direction][~is_internal],
+        )
+
+    coarse_unknown_mask = onp.zeros((ncx, ncy), dtype="bool")
+    coarse_unknown_mask[coarse_i[level.unknown_mask], coarse_j[level.unknown_mask]] = True
+    coarse_level = StencilLevel(coarse_coeffs, coarse_unknown_mask, cyclic=level.cyclic)
+
+    # interpolation only acts on unknowns
+    fine_idx = onp.flatnonzero(level.unknown_mask)
+    coarse_idx = (coarse_i * ncy + coarse_j).ravel()[fine_idx]
+    interpolation = scipy.sparse.csr_matrix(
+        (onp.ones(len(fine_idx)), (fine_idx, coarse_idx)), shape=(level.size, coarse_level.size)
+    )
+
+    # residuals are restricted in terms of the unscaled operator
+    restriction = (
+        scipy.sparse.diags(coarse_level.row_scale.ravel())
+        @ interpolation.T
+        @ scipy.sparse.diags(1.0 / level.row_scale.ravel())
+    ).tocsr()
+
+    restriction = coarse_level.permute(restriction, other=level)
+    interpolation = level.permute(interpolation, other=coarse_level)
+    return coarse_level, (restriction, OVER_CORRECTION * interpolation)
+
+
+class MultigridSolver(LinearSolver):
+    """Geometric multigrid solver for the 5-point Poisson problems of the streamfunction and
+    surface pressure methods.
+
+    Points with fixed values (land, island boundaries, overlap) are eliminated from the system.
+    The remaining problem is solved with BiCGSTAB, preconditioned by a multigrid V-cycle with
+    red-black Gauss-Seidel smoothing and a direct solve on the coarsest level.
+    """
+
+    @veros_routine(
+        local_variables=MATRIX_VARIABLES,
+        dist_safe=False,
+    )
+    def __init__(self, state):
+        settings = state.settings
+
+        diags, _, boundary_mask = assemble_poisson_matrix(state)
+        diags = [onp.asarray(diag, dtype="float64") for diag in diags]
+
+        self._cyclic = settings.enable_cyclic_x
+        self._boundary_mask = onp.asarray(boundary_mask, dtype="bool")
+        self._main_diag = diags[0]
+
+        # fine grid operator, including couplings to points with fixed values
+        self._full_coeffs = {
+            key: diag[2:-2, 2:-2] for key, diag in zip(("main", "east", "west", "north", "south"), diags)
+        }
+
+        unknown_mask = self._boundary_mask[2:-2, 2:-2]
+        fine_coeffs = dict(self._full_coeffs)
+        for direction in ("east", "west", "north", "south"):
+            neighbor_unknown = _shift(unknown_mask, direction, self._cyclic)
+            fine_coeffs[direction] = onp.where(neighbor_unknown, fine_coeffs[direction], 0.0)
+
+        self._levels = [StencilLevel(fine_coeffs, unknown_mask, cyclic=self._cyclic)]
+        self._transfer_operators = []
+
+        while (
+            min(self._levels[-1].shape) > MIN_COARSE_SIZE
+            and onp.count_nonzero(self._levels[-1].unknown_mask) > MAX_DIRECT_SIZE
+        ):
+            coarse_level, transfer_operators = coarsen(self._levels[-1])
+            self._levels.append(coarse_level)
+            self._transfer_operators.append(transfer_operators)
+
+        self._coarse_solver = spalg.splu(self._levels[-1].matrix.tocsc())
+
+        logger.debug(
+            "Multigrid hierarchy: {}",
+            " -> ".join(f"{nx}x{ny}" for nx, ny in (level.shape for level in self._levels)),
+        )
+
+    def _vcycle(self, rhs, level_idx=0):
+        level = self._levels[level_idx]
+
+        if level_idx == len(self._levels) - 1:
+            return self._coarse_solver.solve(rhs)
+
+        x = level.smooth(onp.zeros_like(rhs), rhs)
+
+        restriction, interpolation = self._transfer_operators[level_idx]
+        coarse_rhs = restriction @ (rhs - level.matvec(x))
+        x += interpolation @ self._vcycle(coarse_rhs, level_idx + 1)
+
+        return level.smooth(x, rhs, reverse=True)
+
+    def _get_coupled_values(self, fixed_values):
+        # values seen by the stencil of unknown points, with unknowns set to 0
+        coupled_values = fixed_values.copy()
+        coupled_values[2:-2, 2:-2] = onp.where(self._boundary_mask[2:-2, 2:-2], 0.0, fixed_values[2:-2, 2:-2])
+
+        if self._cyclic:
+            coupled_values[:2] = coupled_values[-4:-2]
+            coupled_values[-2:] = coupled_values[2:4]
+
+        return coupled_values
+
+    def _multigrid_solver(self, rhs, x0, boundary_val):
+        orig_shape = x0.shape
+        orig_dtype = x0.dtype
+
+        rhs = onp.asarray(rhs, dtype="float64")
+        x0 = onp.asarray(x0, dtype="float64")
+        boundary_val = onp.broadcast_to(onp.asarray(boundary_val, dtype="float64"), orig_shape)
+
+        fine_level = self._levels[0]
+        unknown_mask = fine_level.unknown_mask
+
+        # rows of fixed points are identity rows
+        fixed_values = onp.where(self._boundary_mask, rhs, boundary_val) / self._main_diag
+        coupled_values = self._get_coupled_values(fixed_values)
+
+        # move couplings to fixed points to right-hand side
+        c = self._full_coeffs
+        fixed_contribution = (
+            c["east"] * coupled_values[3:-1, 2:-2]
+            + c["west"] * coupled_values[1:-3, 2:-2]
+            + c["north"] * coupled_values[2:-2, 3:-1]
+            + c["south"] * coupled_values[2:-2, 1:-3]
+        )
+        reduced_rhs = onp.where(unknown_mask, rhs[2:-2, 2:-2] - fixed_contribution, 0.0) * fine_level.row_scale
+
+        size = fine_level.size
+        preconditioner = spalg.LinearOperator((size, size), matvec=self._vcycle, dtype="float64")
+
+        initial_guess = onp.where(unknown_mask, x0[2:-2, 2:-2], 0.0)
+        permutation = fine_level.permutation
+
+        linear_solution, info = spalg.bicgstab(
+            fine_level.matrix,
+            reduced_rhs.ravel()[permutation],
+            x0=initial_guess.ravel()[permutation],
+            atol=1e-8,
+            # further iterations cannot improve the solution beyond round-off
+            **{BICGSTAB_RTOL_ARG: 1e-12},
+            maxiter=1000,
+            M=preconditioner,
+        )
+
+        if info > 0:
+            logger.warning("Multigrid solver did not converge after {} iterations", info)
+
+        unpermuted_solution = onp.empty_like(linear_solution)
+        unpermuted_solution[permutation] = linear_solution
+
+        solution = fixed_values
+        solution[2:-2, 2:-2] = onp.where(
+            unknown_mask, unpermuted_solution.reshape(fine_level.shape), solution[2:-2, 2:-2]
+        )
+        return npx.asarray(solution, dtype=orig_dtype)
+
+    def solve(self, state, rhs, x0, boundary_val=None):
+        """
+        Solves a 2D Poisson equation via multigrid-preconditioned BiCGSTAB.
+
+        Arguments:
+            rhs: Right-hand side vector
+            x0: Initial guess
+            boundary_val: Array containing values to set on boundary elements. Defaults to `x0`.
+
+        """
+        rhs_global, x0_global, boundary_val = gather_variables(state, rhs, x0, boundary_val)
+
+        if rst.proc_rank == 0:
+            linear_solution = self._multigrid_solver(rhs_global, x0_global, boundary_val=boundary_val)
+        else:
+            linear_solution = npx.empty_like(rhs)
+
+        return scatter_variables(state, linear_solution)
@@ -8,6 +8,7 @@ from veros.core import utilities
 from veros.core.external.solvers.base import LinearSolver
 from veros.core.operators import numpy as npx, update, update_add, at, flush
 from veros.core.external.poisson_matrix import assemble_poisson_matrix
+from veros.distributed import get_proc_bounds
 
 STREAM_OPTIONS = {
     "solver_type": "bcgs",
@@ -69,8 +70,8 @@ class PETScSolver(LinearSolver):
             proc_sizes=rs.num_proc,
             boundary_type=boundary_type,
             ownership_ranges=[
-                (settings.nx // rs.num_proc[0],) * rs.num_proc[0],
-                (settings.ny // rs.num_proc[1],) * rs.num_proc[1],
+                tuple(int(n) for n in onp.diff(get_proc_bounds(settings.nx, 0))),
+                tuple(int(n) for n in onp.diff(get_proc_bounds(settings.ny, 1))),
             ],
         )
 
@@ -158,7 +159,7 @@ class PETScSolver(LinearSolver):
 
         for j in range(j0, j1):
             for i in range(i0, i1):
-                iloc, jloc = i % (state.settings.nx // rs.num_proc[0]), j % (state.settings.ny // rs.num_proc[1])
+                iloc, jloc = i - i0, j - j0
                 row.index = (i, j)
                 for diag, offset in zip(diags, offsets):
                     io, jo = (i + offset[0], j + offset[1])
@@ -0,0 +1,116 @@
+from veros import logger, veros_kernel, veros_routine, runtime_state as rst
+from veros.core.operators import numpy as npx
+from veros.core.external.solvers.base import LinearSolver
+from veros.core.external.solvers.scipy import MATRIX_VARIABLES
+from veros.core.external.solvers.distributed_bicgstab import apply_operator, global_dots
+from veros.core.external.poisson_matrix import assemble_poisson_matrix
+
+# solutions that are (almost) linearly dependent on the stored ones do not extend the basis
+MIN_RELATIVE_NORM = 1e-10
+
+
+@veros_kernel(static_args=("enable_cyclic_x",))
+def masked_residual(rhs, x, boundary_mask, diags, enable_cyclic_x):
+    return npx.where(boundary_mask, rhs - apply_operator(x, diags, enable_cyclic_x), 0.0)
+
+
+class ProjectedGuessSolver(LinearSolver):
+    """Improves the initial guess of another linear solver with previous solutions.
+
+    Since the Poisson matrix does not change during a run, the solution of every new system is
+    usually close to the span of the last few solutions. This keeps the last ``num_vectors``
+    solutions and corrects the given initial guess ``x0`` by the combination of them that minimizes
+    the residual. The corrected guess is never worse than ``x0``.
+
+    To keep the projection accurate, the solutions are orthonormalized such that their images
+    under the matrix are orthonormal (and re-orthonormalized whenever the oldest one is dropped).
+    """
+
+    @veros_routine(local_variables=MATRIX_VARIABLES)
+    def __init__(self, state, solver, num_vectors):
+        diags, _, boundary_mask = assemble_poisson_matrix(state)
+
+        self._solver = solver
+        self._num_vectors = num_vectors
+        self._diags = diags
+        self._boundary_mask = boundary_mask
+        self._cyclic = state.settings.enable_cyclic_x
+
+        # pairs of (x_i, A x_i) of the last solutions
+        self._solutions = []
+        # pairs of (d_i, A d_i) spanning the same space, with orthonormal A d_i
+        self._basis = []
+
+    def _project(self, residual):
+        """Returns the corrections of solution and residual that minimize the new residual"""
+        coefficients = global_dots(tuple((image, residual) for _, image in self._basis))
+        correction = sum(float(c) * direction for c, (direction, _) in zip(coefficients, self._basis))
+        image_correction = sum(float(c) * image for c, (_, image) in zip(coefficients, self._basis))
+        return correction, image_correction
+
+    def _extend_basis(self, direction, image):
+        image_norm = float(npx.sqrt(global_dots(((image, image),))[0]))
+
+        if self._basis:
+            # classical Gram-Schmidt, applied twice for numerical stability
+            for _ in range(2):
+                direction_correction, image_correction = self._project(image)
+                direction = direction - direction_correction
+                image = image - image_correction
+
+        new_norm = float(npx.sqrt(global_dots(((image, image),))[0]))
+
+        if new_norm == 0 or new_norm <= MIN_RELATIVE_NORM * image_norm:
+            return
+
+        self._basis.append((direction / new_norm, image / new_norm))
+
+    def _add_solution(self, x):
+        direction = npx.where(self._boundary_mask, x, 0.0)
+        image = npx.where(self._boundary_mask, apply_operator(direction, self._diags, self._cyclic), 0.0)
+        self._solutions.append((direction, image))
+
+        if len(self._solutions) <= self._num_vectors:
+            self._extend_basis(direction, image)
+            return
+
+        self._solutions.pop(0)
+        self._basis = []
+        for direction, image in self._solutions:
+            self._extend_basis(direction, image)
+
+    def solve(self, state, rhs, x0, boundary_val=None):
+        """
+        Solves a 2D Poisson equation with the wrapped solver, starting from the projected initial guess.
+
+        Arguments:
+            rhs: Right-hand side vector
+            x0: Initial guess
+            boundary_val: Array containing values to set on boundary elements. Defaults to `x0`.
+
+        """
+        if self._basis:
+            if boundary_val is None:
+                masked_rhs = npx.where(self._boundary_mask, rhs, x0)
+            else:
+                masked_rhs = npx.where(self._boundary_mask, rhs, boundary_val)
+                x0 = npx.where(self._boundary_mask, x0, boundary_val)
+
+            residual = masked_residual(masked_rhs, x0, self._boundary_mask, self._diags, self._cyclic)
+            correction, image_correction = self._project(residual)
+            projected_residual = residual - image_correction
+
+            norms = npx.sqrt(global_dots(((residual, residual), (projected_residual, projected_residual))))
+            residual_norm, projected_norm = (float(val) for val in norms)
+
+            if rst.proc_rank == 0 and projected_norm > 0:
+                logger.trace(
+                    f"Projection of initial guess on {len(self._basis)} previous solutions reduced residual "
+                    f"by a factor of {residual_norm / projected_norm:.1e}"
+                )
+
+            x0 = x0 + correction
+
+        linear_sol = self._solver.solve(state, rhs, x0, boundary_val=boundary_val)
+        self._add_solution(linear_sol)
+        return linear_sol
@@ -2,43 +2,115 @@ import numpy as onp
 import scipy.sparse
 import scipy.sparse.linalg as spalg
 
-from veros import logger, veros_kernel, veros_routine, distributed, runtime_state as rst
+from veros import logger, veros_kernel, veros_routine, distributed, runtime_settings as rs, runtime_state as rst
 from veros.variables import allocate
 from veros.core.operators import update, at, numpy as npx
+from veros.core.external.solvers import cache as solver_cache
 from veros.core.external.solvers.base import LinearSolver
 from veros.core.external.poisson_matrix import assemble_poisson_matrix
 
+MATRIX_VARIABLES = (
+    "hu",
+    "hv",
+    "hvr",
+    "hur",
+    "dxu",
+    "dxt",
+    "dyu",
+    "dyt",
+    "cosu",
+    "cost",
+    "isle_boundary_mask",
+    "maskT",
+)
+
+MATRIX_SETTINGS = ("nx", "ny", "enable_cyclic_x", "enable_streamfunction", "grav", "dt_mom", "dt_tracer")
+
+ILU_OPTIONS = dict(drop_tol=1e-6, fill_factor=100)
+
 
 class SciPySolver(LinearSolver):
     @veros_routine(
-        local_variables=(
-            "hu",
-            "hv",
-            "hvr",
-            "hur",
-            "dxu",
-            "dxt",
-            "dyu",
-            "dyt",
-            "cosu",
-            "cost",
-            "isle_boundary_mask",
-            "maskT",
-        ),
+        local_variables=MATRIX_VARIABLES,
         dist_safe=False,
     )
     def __init__(self, state):
-        self._matrix, self._boundary_mask = self._assemble_poisson_matrix(state)
+        cache_key = None
+        cached_data = None
+
+        if rs.cache_dir is not None:
+            cache_key = self._get_cache_key(state)
+            cached_data = solver_cache.load("scipy", cache_key)
+
+        if cached_data is not None:
+            logger.info("Using cached ILU preconditioner")
+            self._matrix = scipy.sparse.csr_matrix(
+                (cached_data["matrix_data"], cached_data["matrix_indices"], cached_data["matrix_indptr"]),
+                shape=tuple(cached_data["matrix_shape"]),
+            )
+            self._boundary_mask = npx.asarray(cached_data["boundary_mask"])
+            self._rhs_scale = cached_data["rhs_scale"]
+            ilu_preconditioner = RestoredILU(
+                scipy.sparse.csc_matrix(
+                    (cached_data["L_data"], cached_data["L_indices"], cached_data["L_indptr"]),
+                    shape=self._matrix.shape,
+                ),
+                scipy.sparse.csc_matrix(
+                    (cached_data["U_data"], cached_data["U_indices"], cached_data["U_indptr"]),
+                    shape=self._matrix.shape,
+                ),
+                cached_data["perm_r"],
+                cached_data["perm_c"],
+            )
+        else:
+            self._matrix, self._boundary_mask = self._assemble_poisson_matrix(state)
 
-        jacobi_precon = self._jacobi_preconditioner(state, self._matrix)
-        self._matrix = jacobi_precon * self._matrix
-        self._rhs_scale = jacobi_precon.diagonal()
-        self._extra_args = {}
+            jacobi_precon = self._jacobi_preconditioner(state, self._matrix)
+            self._matrix = jacobi_precon * self._matrix
+            self._rhs_scale = jacobi_precon.diagonal()
 
-        logger.info("Computing ILU preconditioner...")
-        ilu_preconditioner = spalg.spilu(self._matrix.tocsc(), drop_tol=1e-6, fill_factor=100)
+            logger.info("Computing ILU preconditioner...")
+            ilu_preconditioner = spalg.spilu(self._matrix.tocsc(), **ILU_OPTIONS)
+
+            if cache_key is not None:
+                self._write_cache(cache_key, ilu_preconditioner)
+
+        self._extra_args = {}
         self._extra_args["M"] = spalg.LinearOperator(self._matrix.shape, ilu_preconditioner.solve)
 
+    @staticmethod
+    def _get_cache_key(state):
+        vs = state.variables
+        settings = state.settings
+
+        arrays = {var: onp.asarray(getattr(vs, var)) for var in MATRIX_VARIABLES if state.var_meta[var].active}
+        metadata = {setting: getattr(settings, setting) for setting in MATRIX_SETTINGS}
+        metadata.update(ILU_OPTIONS, scipy_version=scipy.__version__)
+        return solver_cache.get_cache_key(arrays, metadata)
+
+    def _write_cache(self, cache_key, ilu_preconditioner):
+        L, U = ilu_preconditioner.L.tocsc(), ilu_preconditioner.U.tocsc()
+        solver_cache.store(
+            "scipy",
+            cache_key,
+            dict(
+                matrix_data=self._matrix.data,
+                matrix_indices=self._matrix.indices,
+                matrix_indptr=self._matrix.indptr,
+                matrix_shape=onp.array(self._matrix.shape),
+                boundary_mask=onp.asarray(self._boundary_mask),
+                rhs_scale=self._rhs_scale,
+                L_data=L.data,
+                L_indices=L.indices,
+                L_indptr=L.indptr,
+                U_data=U.data,
+                U_indices=U.indices,
+                U_indptr=U.indptr,
+                perm_r=ilu_preconditioner.perm_r,
+                perm_c=ilu_preconditioner.perm_c,
+            ),
+        )
+
     def _scipy_solver(self, state, rhs, x0, boundary_val):
         orig_shape = x0.shape
         orig_dtype = x0.dtype
@@ -129,6 +201,26 @@ class SciPySolver(LinearSolver):
         return matrix, boundary_mask
 
 
+class RestoredILU:
+    """Applies an incomplete LU factorization given by its factors (as computed by spilu).
+
+    spilu results cannot be serialized, so we factorize the triangular factors again (which is
+    trivial and exact with natural ordering and no pivoting) to get fast triangular solves.
+    """
+
+    def __init__(self, L, U, perm_r, perm_c):
+        factorize_triangular = dict(permc_spec="NATURAL", diag_pivot_thresh=0, options=dict(SymmetricMode=True))
+        self._L = spalg.splu(L, **factorize_triangular)
+        self._U = spalg.splu(U, **factorize_triangular)
+        self._perm_r = perm_r
+        self._perm_c = perm_c
+
+    def solve(self, rhs):
+        permuted_rhs = onp.empty_like(rhs)
+        permuted_rhs[self._perm_r] = rhs
+        return self._U.solve(self._L.solve(permuted_rhs))[self._perm_c]
+
+
 @veros_kernel
 def gather_variables(state, rhs, x0, boundary_val):
     rhs_global = distributed.gather(rhs, state.dimensions, ("xt", "yt"))
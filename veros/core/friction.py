@@ -2,6 +2,7 @@ from veros.core.operators import numpy as npx
 
 from veros import veros_routine, veros_kernel, KernelOutput
 from veros.variables import allocate
+from veros.tiling import tiled
 from veros.core import numerics, utilities, isoneutral
 from veros.core.operators import update, update_add, at
 
@@ -117,15 +118,20 @@ def implicit_vert_friction(state):
     )
     a_tri = update(a_tri, at[:, :, 1:], -delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:])
     b_tri = update(b_tri, at[:, :, 1:], 1 + delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:])
-    b_tri = update_add(b_tri, at[:, :, 1:-1], delta[:, :, 1:-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:-1])
+    b_tri = update_add(b_tri, at[:, :, 1:-1], delta[:, :, 1:-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:-1], inplace=True)
     b_tri_edge = 1 + delta / vs.dzt[npx.newaxis, npx.newaxis, :]
     c_tri = update(c_tri, at[...], -delta / vs.dzt[npx.newaxis, npx.newaxis, :])
     d_tri = update(d_tri, at[...], vs.u[1:-2, 1:-2, :, vs.tau])
 
     res = utilities.solve_implicit(a_tri, b_tri, c_tri, d_tri, water_mask, b_edge=b_tri_edge, edge_mask=edge_mask)
-    vs.u = update(vs.u, at[1:-2, 1:-2, :, vs.taup1], npx.where(water_mask, res, vs.u[1:-2, 1:-2, :, vs.taup1]))
+    vs.u = update(
+        vs.u, at[1:-2, 1:-2, :, vs.taup1], npx.where(water_mask, res, vs.u[1:-2, 1:-2, :, vs.taup1]), inplace=True
+    )
     vs.du_mix = update(
-        vs.du_mix, at[1:-2, 1:-2], (vs.u[1:-2, 1:-2, :, vs.taup1] - vs.u[1:-2, 1:-2, :, vs.tau]) / settings.dt_mom
+        vs.du_mix,
+        at[1:-2, 1:-2],
+        (vs.u[1:-2, 1:-2, :, vs.taup1] - vs.u[1:-2, 1:-2, :, vs.tau]) / settings.dt_mom,
+        inplace=True,
     )
 
     """
@@ -140,13 +146,15 @@ def implicit_vert_friction(state):
         / vs.dzw[:-1]
         * vs.maskU[1:-2, 1:-2, 1:]
         * vs.maskU[1:-2, 1:-2, :-1],
+        inplace=True,
     )
     diss = update(
         diss,
         at[1:-2, 1:-2, :-1],
         (vs.u[1:-2, 1:-2, 1:, vs.tau] - vs.u[1:-2, 1:-2, :-1, vs.tau]) * flux_top[1:-2, 1:-2, :-1] / vs.dzw[:-1],
+        inplace=True,
     )
-    diss = update(diss, at[:, :, -1], 0.0)
+    diss = update(diss, at[:, :, -1], 0.0, inplace=True)
     diss = numerics.ugrid_to_tgrid(state, diss)
     vs.K_diss_v = vs.K_diss_v + diss
 
@@ -165,19 +173,25 @@ def implicit_vert_friction(state):
         * fxa
         * vs.maskV[1:-2, 1:-2, 1:]
         * vs.maskV[1:-2, 1:-2, :-1],
+        inplace=True,
     )
-    a_tri = update(a_tri, at[:, :, 1:], -delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:])
-    b_tri = update(b_tri, at[:, :, 1:], 1 + delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:])
-    b_tri = update_add(b_tri, at[:, :, 1:-1], delta[:, :, 1:-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:-1])
+    a_tri = update(a_tri, at[:, :, 1:], -delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:], inplace=True)
+    b_tri = update(b_tri, at[:, :, 1:], 1 + delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:], inplace=True)
+    b_tri = update_add(b_tri, at[:, :, 1:-1], delta[:, :, 1:-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:-1], inplace=True)
     b_tri_edge = 1 + delta / vs.dzt[npx.newaxis, npx.newaxis, :]
-    c_tri = update(c_tri, at[:, :, :-1], -delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, :-1])
-    c_tri = update(c_tri, at[:, :, -1], 0.0)
-    d_tri = update(d_tri, at[...], vs.v[1:-2, 1:-2, :, vs.tau])
+    c_tri = update(c_tri, at[:, :, :-1], -delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, :-1], inplace=True)
+    c_tri = update(c_tri, at[:, :, -1], 0.0, inplace=True)
+    d_tri = update(d_tri, at[...], vs.v[1:-2, 1:-2, :, vs.tau], inplace=True)
 
     res = utilities.solve_implicit(a_tri, b_tri, c_tri, d_tri, water_mask, b_edge=b_tri_edge, edge_mask=edge_mask)
-    vs.v = update(vs.v, at[1:-2, 1:-2, :, vs.taup1], npx.where(water_mask, res, vs.v[1:-2, 1:-2, :, vs.taup1]))
+    vs.v = update(
+        vs.v, at[1:-2, 1:-2, :, vs.taup1], npx.where(water_mask, res, vs.v[1:-2, 1:-2, :, vs.taup1]), inplace=True
+    )
     vs.dv_mix = update(
-        vs.dv_mix, at[1:-2, 1:-2], (vs.v[1:-2, 1:-2, :, vs.taup1] - vs.v[1:-2, 1:-2, :, vs.tau]) / settings.dt_mom
+        vs.dv_mix,
+        at[1:-2, 1:-2],
+        (vs.v[1:-2, 1:-2, :, vs.taup1] - vs.v[1:-2, 1:-2, :, vs.tau]) / settings.dt_mom,
+        inplace=True,
     )
 
     """
@@ -192,13 +206,15 @@ def implicit_vert_friction(state):
         / vs.dzw[:-1]
         * vs.maskV[1:-2, 1:-2, 1:]
         * vs.maskV[1:-2, 1:-2, :-1],
+        inplace=True,
     )
     diss = update(
         diss,
         at[1:-2, 1:-2, :-1],
         (vs.v[1:-2, 1:-2, 1:, vs.tau] - vs.v[1:-2, 1:-2, :-1, vs.tau]) * flux_top[1:-2, 1:-2, :-1] / vs.dzw[:-1],
+        inplace=True,
     )
-    diss = update(diss, at[:, :, -1], 0.0)
+    diss = update(diss, at[:, :, -1], 0.0, inplace=True)
     diss = numerics.vgrid_to_tgrid(state, diss)
     vs.K_diss_v = vs.K_diss_v + diss
 
@@ -285,27 +301,39 @@ def linear_bottom_friction(state):
         mask = npx.arange(settings.nz) == k[:, :, npx.newaxis]
 
         vs.du_mix = update_add(
-            vs.du_mix, at[1:-2, 2:-2], -1 * vs.maskU[1:-2, 2:-2] * settings.r_bot * vs.u[1:-2, 2:-2, :, vs.tau] * mask
+            vs.du_mix,
+            at[1:-2, 2:-2],
+            -1 * vs.maskU[1:-2, 2:-2] * settings.r_bot * vs.u[1:-2, 2:-2, :, vs.tau] * mask,
+            inplace=True,
         )
         if settings.enable_conserve_energy:
             diss = allocate(state.dimensions, ("xt", "yu", "zt"))
             diss = update(
-                diss, at[1:-2, 2:-2], vs.maskU[1:-2, 2:-2] * settings.r_bot * vs.u[1:-2, 2:-2, :, vs.tau] ** 2 * mask
+                diss,
+                at[1:-2, 2:-2],
+                vs.maskU[1:-2, 2:-2] * settings.r_bot * vs.u[1:-2, 2:-2, :, vs.tau] ** 2 * mask,
+                inplace=True,
             )
-            vs.K_diss_bot = update_add(vs.K_diss_bot, at[...], numerics.calc_diss_u(state, diss))
+            vs.K_diss_bot = update_add(vs.K_diss_bot, at[...], numerics.calc_diss_u(state, diss), inplace=True)
 
         k = npx.maximum(vs.kbot[2:-2, 2:-1], vs.kbot[2:-2, 1:-2]) - 1
         mask = npx.arange(settings.nz) == k[:, :, npx.newaxis]
 
         vs.dv_mix = update_add(
-            vs.dv_mix, at[2:-2, 1:-2], -1 * vs.maskV[2:-2, 1:-2] * settings.r_bot * vs.v[2:-2, 1:-2, :, vs.tau] * mask
+            vs.dv_mix,
+            at[2:-2, 1:-2],
+            -1 * vs.maskV[2:-2, 1:-2] * settings.r_bot * vs.v[2:-2, 1:-2, :, vs.tau] * mask,
+            inplace=True,
         )
         if settings.enable_conserve_energy:
             diss = allocate(state.dimensions, ("xt", "yu", "zt"))
             diss = update(
-                diss, at[2:-2, 1:-2], vs.maskV[2:-2, 1:-2] * settings.r_bot * vs.v[2:-2, 1:-2, :, vs.tau] ** 2 * mask
+                diss,
+                at[2:-2, 1:-2],
+                vs.maskV[2:-2, 1:-2] * settings.r_bot * vs.v[2:-2, 1:-2, :, vs.tau] ** 2 * mask,
+                inplace=True,
             )
-            vs.K_diss_bot = update_add(vs.K_diss_bot, at[...], numerics.calc_diss_v(state, diss))
+            vs.K_diss_bot = update_add(vs.K_diss_bot, at[...], numerics.calc_diss_v(state, diss), inplace=True)
 
     return KernelOutput(du_mix=vs.du_mix, dv_mix=vs.dv_mix, K_diss_bot=vs.K_diss_bot)
 
@@ -371,6 +399,7 @@ def quadratic_bottom_friction(state):
     return KernelOutput(du_mix=vs.du_mix, dv_mix=vs.dv_mix, K_diss_bot=vs.K_diss_bot)
 
 
+@tiled
 @veros_kernel
 def harmonic_friction(state):
     """
@@ -380,6 +409,11 @@ def harmonic_friction(state):
     vs = state.variables
     settings = state.settings
 
+    inv_dx_u = utilities.grid_metric(state, "inv_dx_u")
+    inv_dy_u = utilities.grid_metric(state, "inv_dy_u")
+    inv_dx_v = utilities.grid_metric(state, "inv_dx_v")
+    inv_dy_v = utilities.grid_metric(state, "inv_dy_v")
+
     diss = allocate(state.dimensions, ("xt", "yt", "zt"))
     flux_east = allocate(state.dimensions, ("xu", "yt", "zt"))
     flux_north = allocate(state.dimensions, ("xt", "yu", "zt"))
@@ -398,6 +432,7 @@ def harmonic_friction(state):
             / (vs.cost * vs.dxt[1:, npx.newaxis])[:, :, npx.newaxis]
             * vs.maskU[1:]
             * vs.maskU[:-1],
+            inplace=True,
         )
         fxa = vs.cosu**settings.hor_friction_cosPower
         flux_north = update(
@@ -410,6 +445,7 @@ def harmonic_friction(state):
             * vs.maskU[:, 1:]
             * vs.maskU[:, :-1]
             * vs.cosu[npx.newaxis, :-1, npx.newaxis],
+            inplace=True,
         )
         if settings.enable_noslip_lateral:
             flux_north = update_add(
@@ -472,8 +508,8 @@ def harmonic_friction(state):
                 * vs.cosu[npx.newaxis, :-1, npx.newaxis],
             )
 
-    flux_east = update(flux_east, at[-1, :, :], 0.0)
-    flux_north = update(flux_north, at[:, -1, :], 0.0)
+    flux_east = update(flux_east, at[-1, :, :], 0.0, inplace=True)
+    flux_north = update(flux_north, at[:, -1, :], 0.0, inplace=True)
 
     """
     update tendency
@@ -481,13 +517,9 @@ def harmonic_friction(state):
     vs.du_mix = update_add(
         vs.du_mix,
         at[2:-2, 2:-2, :],
-        vs.maskU[2:-2, 2:-2]
-        * (
-            (flux_east[2:-2, 2:-2] - flux_east[1:-3, 2:-2])
-            / (vs.cost[2:-2] * vs.dxu[2:-2, npx.newaxis])[:, :, npx.newaxis]
-            + (flux_north[2:-2, 2:-2] - flux_north[2:-2, 1:-3])
-            / (vs.cost[2:-2] * vs.dyt[2:-2])[npx.newaxis, :, npx.newaxis]
-        ),
+        (flux_east[2:-2, 2:-2] - flux_east[1:-3, 2:-2]) * inv_dx_u[2:-2, 2:-2]
+        + (flux_north[2:-2, 2:-2] - flux_north[2:-2, 1:-3]) * inv_dy_u[2:-2, 2:-2],
+        inplace=True,
     )
 
     if settings.enable_conserve_energy:
@@ -509,6 +541,7 @@ def harmonic_friction(state):
                 + (vs.u[1:-2, 2:-2, :, vs.tau] - vs.u[1:-2, 1:-3, :, vs.tau]) * flux_north[1:-2, 1:-3]
             )
             / (vs.cost[2:-2] * vs.dyt[2:-2])[npx.newaxis, :, npx.newaxis],
+            inplace=True,
         )
         vs.K_diss_h = numerics.calc_diss_u(state, diss)
 
@@ -525,6 +558,7 @@ def harmonic_friction(state):
             / (vs.cosu * vs.dxu[:-1, npx.newaxis])[:, :, npx.newaxis]
             * vs.maskV[1:]
             * vs.maskV[:-1],
+            inplace=True,
         )
 
         if settings.enable_noslip_lateral:
@@ -557,6 +591,7 @@ def harmonic_friction(state):
             * vs.cost[npx.newaxis, 1:, npx.newaxis]
             * vs.maskV[:, :-1]
             * vs.maskV[:, 1:],
+            inplace=True,
         )
     else:
         flux_east = update(
@@ -598,8 +633,8 @@ def harmonic_friction(state):
             * vs.maskV[:, 1:],
         )
 
-    flux_east = update(flux_east, at[-1, :, :], 0.0)
-    flux_north = update(flux_north, at[:, -1, :], 0.0)
+    flux_east = update(flux_east, at[-1, :, :], 0.0, inplace=True)
+    flux_north = update(flux_north, at[:, -1, :], 0.0, inplace=True)
 
     """
     update tendency
@@ -607,13 +642,9 @@ def harmonic_friction(state):
     vs.dv_mix = update_add(
         vs.dv_mix,
         at[2:-2, 2:-2],
-        vs.maskV[2:-2, 2:-2]
-        * (
-            (flux_east[2:-2, 2:-2] - flux_east[1:-3, 2:-2])
-            / (vs.cosu[2:-2] * vs.dxt[2:-2, npx.newaxis])[:, :, npx.newaxis]
-            + (flux_north[2:-2, 2:-2] - flux_north[2:-2, 1:-3])
-            / (vs.dyu[2:-2] * vs.cosu[2:-2])[npx.newaxis, :, npx.newaxis]
-        ),
+        (flux_east[2:-2, 2:-2] - flux_east[1:-3, 2:-2]) * inv_dx_v[2:-2, 2:-2]
+        + (flux_north[2:-2, 2:-2] - flux_north[2:-2, 1:-3]) * inv_dy_v[2:-2, 2:-2],
+        inplace=True,
     )
 
     if settings.enable_conserve_energy:
@@ -635,8 +666,9 @@ def harmonic_friction(state):
                 + (vs.v[2:-2, 1:-2, :, vs.tau] - vs.v[2:-2, :-3, :, vs.tau]) * flux_north[2:-2, :-3]
             )
             / (vs.cosu[1:-2] * vs.dyu[1:-2])[npx.newaxis, :, npx.newaxis],
+            inplace=True,
         )
-        vs.K_diss_h = update_add(vs.K_diss_h, at[...], numerics.calc_diss_v(state, diss))
+        vs.K_diss_h = update_add(vs.K_diss_h, at[...], numerics.calc_diss_v(state, diss), inplace=True)
 
     return KernelOutput(du_mix=vs.du_mix, dv_mix=vs.dv_mix, K_diss_h=vs.K_diss_h)
 
@@ -650,6 +682,11 @@ def biharmonic_friction(state):
     vs = state.variables
     settings = state.settings
 
+    inv_dx_u = utilities.grid_metric(state, "inv_dx_u")
+    inv_dy_u = utilities.grid_metric(state, "inv_dy_u")
+    inv_dx_v = utilities.grid_metric(state, "inv_dx_v")
+    inv_dy_v = utilities.grid_metric(state, "inv_dy_v")
+
     flux_east = allocate(state.dimensions, ("xu", "yt", "zt"))
     flux_north = allocate(state.dimensions, ("xt", "yu", "zt"))
     visc = npx.sqrt(abs(settings.A_hbi))
@@ -772,12 +809,9 @@ def biharmonic_friction(state):
         vs.du_mix,
         at[2:-2, 2:-2, :],
         -1
-        * vs.maskU[2:-2, 2:-2, :]
         * (
-            (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :])
-            / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxu[2:-2, npx.newaxis, npx.newaxis])
-            + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :])
-            / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dyt[npx.newaxis, 2:-2, npx.newaxis])
+            (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :]) * inv_dx_u[2:-2, 2:-2, :]
+            + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :]) * inv_dy_u[2:-2, 2:-2, :]
         ),
     )
 
@@ -785,8 +819,9 @@ def biharmonic_friction(state):
         """
         diagnose dissipation by lateral friction
         """
-        flux_east = utilities.enforce_boundaries(flux_east, settings.enable_cyclic_x)
-        flux_north = utilities.enforce_boundaries(flux_north, settings.enable_cyclic_x)
+        flux_east, flux_north = utilities.enforce_boundaries_many(
+            (flux_east, flux_north), settings.enable_cyclic_x, inplace=True
+        )
         diss = allocate(state.dimensions, ("xt", "yu", "zt"))
         diss = update(
             diss,
@@ -915,12 +950,9 @@ def biharmonic_friction(state):
         vs.dv_mix,
         at[2:-2, 2:-2, :],
         -1
-        * vs.maskV[2:-2, 2:-2, :]
         * (
-            (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :])
-            / (vs.cosu[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
-            + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :])
-            / (vs.dyu[npx.newaxis, 2:-2, npx.newaxis] * vs.cosu[npx.newaxis, 2:-2, npx.newaxis])
+            (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :]) * inv_dx_v[2:-2, 2:-2, :]
+            + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :]) * inv_dy_v[2:-2, 2:-2, :]
         ),
     )
 
@@ -928,8 +960,9 @@ def biharmonic_friction(state):
         """
         diagnose dissipation by lateral friction
         """
-        flux_east = utilities.enforce_boundaries(flux_east, settings.enable_cyclic_x)
-        flux_north = utilities.enforce_boundaries(flux_north, settings.enable_cyclic_x)
+        flux_east, flux_north = utilities.enforce_boundaries_many(
+            (flux_east, flux_north), settings.enable_cyclic_x, inplace=True
+        )
         diss = update(
             diss,
             at[2:-2, 1:-2, :],
@@ -981,7 +1014,7 @@ def friction(state):
     """
     vertical friction
     """
-    vs.K_diss_v = update(vs.K_diss_v, at[...], 0.0)
+    vs.K_diss_v = update(vs.K_diss_v, at[...], 0.0, inplace=True)
 
     if settings.enable_implicit_vert_friction:
         vs.update(implicit_vert_friction(state))
@@ -1007,7 +1040,7 @@ def friction(state):
     """
     Rayleigh and bottom friction
     """
-    vs.K_diss_bot = update(vs.K_diss_bot, at[...], 0.0)
+    vs.K_diss_bot = update(vs.K_diss_bot, at[...], 0.0, inplace=True)
 
     if settings.enable_ray_friction:
         vs.update(rayleigh_friction(state))
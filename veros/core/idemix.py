@@ -52,7 +52,9 @@ def integrate_idemix_kernel(state):
     vs = state.variables
     settings = state.settings
 
-    a_tri, b_tri, c_tri, d_tri, delta = (allocate(state.dimensions, ("xt", "yt", "zt"))[2:-2, 2:-2] for _ in range(5))
+    inv_dx_w = utilities.grid_metric(state, "inv_dx_w")
+    inv_dy_w = utilities.grid_metric(state, "inv_dy_w")
+
     forc = allocate(state.dimensions, ("xt", "yt", "zt"))
     maxE_iw = allocate(state.dimensions, ("xt", "yt", "zt"))
 
@@ -121,51 +123,63 @@ def integrate_idemix_kernel(state):
     """
     _, water_mask, edge_mask = utilities.create_water_masks(vs.kbot[2:-2, 2:-2], settings.nz)
 
-    delta = update(
-        delta,
-        at[:, :, :-1],
-        settings.dt_tracer
-        * settings.tau_v
-        / vs.dzt[npx.newaxis, npx.newaxis, 1:]
-        * 0.5
-        * (vs.c0[2:-2, 2:-2, :-1] + vs.c0[2:-2, 2:-2, 1:]),
-    )
-    delta = update(delta, at[:, :, -1], 0.0)
-    a_tri = update(
-        a_tri, at[:, :, 1:-1], -delta[:, :, :-2] * vs.c0[2:-2, 2:-2, :-2] / vs.dzw[npx.newaxis, npx.newaxis, 1:-1]
-    )
-    a_tri = update(a_tri, at[:, :, -1], -delta[:, :, -2] / (0.5 * vs.dzw[-1:]) * vs.c0[2:-2, 2:-2, -2])
-    b_tri = update(
-        b_tri,
-        at[:, :, 1:-1],
-        1
-        + delta[:, :, 1:-1] * vs.c0[2:-2, 2:-2, 1:-1] / vs.dzw[npx.newaxis, npx.newaxis, 1:-1]
-        + delta[:, :, :-2] * vs.c0[2:-2, 2:-2, 1:-1] / vs.dzw[npx.newaxis, npx.newaxis, 1:-1]
-        + settings.dt_tracer * vs.alpha_c[2:-2, 2:-2, 1:-1] * maxE_iw[2:-2, 2:-2, 1:-1],
-    )
-    b_tri = update(
-        b_tri,
-        at[:, :, -1],
-        1
-        + delta[:, :, -2] / (0.5 * vs.dzw[-1:]) * vs.c0[2:-2, 2:-2, -1]
-        + settings.dt_tracer * vs.alpha_c[2:-2, 2:-2, -1] * maxE_iw[2:-2, 2:-2, -1],
-    )
-    b_tri_edge = (
-        1
-        + delta / vs.dzw * vs.c0[2:-2, 2:-2, :]
-        + settings.dt_tracer * vs.alpha_c[2:-2, 2:-2, :] * maxE_iw[2:-2, 2:-2, :]
-    )
-    c_tri = update(
-        c_tri, at[:, :, :-1], -delta[:, :, :-1] / vs.dzw[npx.newaxis, npx.newaxis, :-1] * vs.c0[2:-2, 2:-2, 1:]
-    )
-    d_tri = update(d_tri, at[...], vs.E_iw[2:-2, 2:-2, :, vs.tau] + settings.dt_tracer * forc[2:-2, 2:-2, :])
-    d_tri_edge = (
-        d_tri + settings.dt_tracer * vs.forc_iw_bottom[2:-2, 2:-2, npx.newaxis] / vs.dzw[npx.newaxis, npx.newaxis, :]
-    )
-    d_tri = update_add(d_tri, at[:, :, -1], settings.dt_tracer * vs.forc_iw_surface[2:-2, 2:-2] / (0.5 * vs.dzw[-1:]))
+    def integrate_columns(c0, alpha_c, maxE_iw, E_iw, forc, forc_iw_bottom, forc_iw_surface, water_mask, edge_mask):
+        a_tri, b_tri, c_tri, delta = (npx.zeros_like(c0) for _ in range(4))
+
+        delta = update(
+            delta,
+            at[:, :, :-1],
+            settings.dt_tracer
+            * settings.tau_v
+            / vs.dzt[npx.newaxis, npx.newaxis, 1:]
+            * 0.5
+            * (c0[:, :, :-1] + c0[:, :, 1:]),
+        )
+        delta = update(delta, at[:, :, -1], 0.0)
+        a_tri = update(
+            a_tri, at[:, :, 1:-1], -delta[:, :, :-2] * c0[:, :, :-2] / vs.dzw[npx.newaxis, npx.newaxis, 1:-1]
+        )
+        a_tri = update(a_tri, at[:, :, -1], -delta[:, :, -2] / (0.5 * vs.dzw[-1:]) * c0[:, :, -2])
+        b_tri = update(
+            b_tri,
+            at[:, :, 1:-1],
+            1
+            + delta[:, :, 1:-1] * c0[:, :, 1:-1] / vs.dzw[npx.newaxis, npx.newaxis, 1:-1]
+            + delta[:, :, :-2] * c0[:, :, 1:-1] / vs.dzw[npx.newaxis, npx.newaxis, 1:-1]
+            + settings.dt_tracer * alpha_c[:, :, 1:-1] * maxE_iw[:, :, 1:-1],
+        )
+        b_tri = update(
+            b_tri,
+            at[:, :, -1],
+            1
+            + delta[:, :, -2] / (0.5 * vs.dzw[-1:]) * c0[:, :, -1]
+            + settings.dt_tracer * alpha_c[:, :, -1] * maxE_iw[:, :, -1],
+        )
+        b_tri_edge = 1 + delta / vs.dzw * c0 + settings.dt_tracer * alpha_c * maxE_iw
+        c_tri = update(c_tri, at[:, :, :-1], -delta[:, :, :-1] / vs.dzw[npx.newaxis, npx.newaxis, :-1] * c0[:, :, 1:])
+        d_tri = E_iw + settings.dt_tracer * forc
+        d_tri_edge = (
+            d_tri + settings.dt_tracer * forc_iw_bottom[:, :, npx.newaxis] / vs.dzw[npx.newaxis, npx.newaxis, :]
+        )
+        d_tri = update_add(d_tri, at[:, :, -1], settings.dt_tracer * forc_iw_surface / (0.5 * vs.dzw[-1:]))
+
+        return utilities.solve_implicit(
+            a_tri, b_tri, c_tri, d_tri, water_mask, b_edge=b_tri_edge, d_edge=d_tri_edge, edge_mask=edge_mask
+        )
 
-    sol = utilities.solve_implicit(
-        a_tri, b_tri, c_tri, d_tri, water_mask, b_edge=b_tri_edge, d_edge=d_tri_edge, edge_mask=edge_mask
+    # only columns that contain water are integrated if wet-column compaction is enabled
+    sol = utilities.map_wet_columns(
+        integrate_columns,
+        utilities.get_wet_columns(state, interior=True),
+        vs.c0[2:-2, 2:-2],
+        vs.alpha_c[2:-2, 2:-2],
+        maxE_iw[2:-2, 2:-2],
+        vs.E_iw[2:-2, 2:-2, :, vs.tau],
+        forc[2:-2, 2:-2],
+        vs.forc_iw_bottom[2:-2, 2:-2],
+        vs.forc_iw_surface[2:-2, 2:-2],
+        water_mask,
+        edge_mask,
     )
     vs.E_iw = update(vs.E_iw, at[2:-2, 2:-2, :, vs.taup1], npx.where(water_mask, sol, vs.E_iw[2:-2, 2:-2, :, vs.taup1]))
 
@@ -209,12 +223,9 @@ def integrate_idemix_kernel(state):
             vs.E_iw,
             at[2:-2, 2:-2, :, vs.taup1],
             settings.dt_tracer
-            * vs.maskW[2:-2, 2:-2, :]
             * (
-                (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
-                + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dyt[npx.newaxis, 2:-2, npx.newaxis])
+                (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :]) * inv_dx_w[2:-2, 2:-2, :]
+                + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :]) * inv_dy_w[2:-2, 2:-2, :]
             ),
         )
 
@@ -231,13 +242,8 @@ def integrate_idemix_kernel(state):
         vs.dE_iw = update(
             vs.dE_iw,
             at[2:-2, 2:-2, :, vs.tau],
-            vs.maskW[2:-2, 2:-2, :]
-            * (
-                -(flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
-                - (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dyt[npx.newaxis, 2:-2, npx.newaxis])
-            ),
+            -(flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :]) * inv_dx_w[2:-2, 2:-2, :]
+            - (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :]) * inv_dy_w[2:-2, 2:-2, :],
         )
         vs.dE_iw = update_add(vs.dE_iw, at[:, :, 0, vs.tau], -flux_top[:, :, 0] / vs.dzw[0:1])
         vs.dE_iw = update_add(
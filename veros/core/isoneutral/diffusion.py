@@ -28,7 +28,7 @@ def _calc_tracer_fluxes(state, tr, K_iso, K_skew):
         at[:, :, 1:],
         0.25 * (K1[1:-2, 2:-2, 1:] + K1[1:-2, 2:-2, :-1] + K1[2:-1, 2:-2, 1:] + K1[2:-1, 2:-2, :-1]),
     )
-    diffloc = update(diffloc, at[:, :, 0], 0.5 * (K1[1:-2, 2:-2, 0] + K1[2:-1, 2:-2, 0]))
+    diffloc = update(diffloc, at[:, :, 0], 0.5 * (K1[1:-2, 2:-2, 0] + K1[2:-1, 2:-2, 0]), inplace=True)
 
     sumz = 0.0
     for kr in range(2):
@@ -44,6 +44,7 @@ def _calc_tracer_fluxes(state, tr, K_iso, K_skew):
         + (tr[2:-1, 2:-2, :, vs.tau] - tr[1:-2, 2:-2, :, vs.tau])
         / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxu[1:-2, npx.newaxis, npx.newaxis])
         * vs.K_11[1:-2, 2:-2, :],
+        inplace=True,
     )
 
     """
@@ -55,7 +56,7 @@ def _calc_tracer_fluxes(state, tr, K_iso, K_skew):
         at[:, :, 1:],
         0.25 * (K1[2:-2, 1:-2, 1:] + K1[2:-2, 1:-2, :-1] + K1[2:-2, 2:-1, 1:] + K1[2:-2, 2:-1, :-1]),
     )
-    diffloc = update(diffloc, at[:, :, 0], 0.5 * (K1[2:-2, 1:-2, 0] + K1[2:-2, 2:-1, 0]))
+    diffloc = update(diffloc, at[:, :, 0], 0.5 * (K1[2:-2, 1:-2, 0] + K1[2:-2, 2:-1, 0]), inplace=True)
 
     sumz = 0.0
     for kr in range(2):
@@ -74,6 +75,7 @@ def _calc_tracer_fluxes(state, tr, K_iso, K_skew):
             / vs.dyu[npx.newaxis, 1:-2, npx.newaxis]
             * vs.K_22[2:-2, 1:-2, :]
         ),
+        inplace=True,
     )
 
     """
@@ -107,8 +109,9 @@ def _calc_tracer_fluxes(state, tr, K_iso, K_skew):
         at[2:-2, 2:-2, :-1],
         sumx / (4 * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
         + sumy / (4 * vs.dyt[npx.newaxis, 2:-2, npx.newaxis] * vs.cost[npx.newaxis, 2:-2, npx.newaxis]),
+        inplace=True,
     )
-    flux_top = update(flux_top, at[:, :, -1], 0.0)
+    flux_top = update(flux_top, at[:, :, -1], 0.0, inplace=True)
 
     return flux_east, flux_north, flux_top
 
@@ -117,23 +120,25 @@ def _calc_tracer_fluxes(state, tr, K_iso, K_skew):
 def _calc_explicit_part(state, flux_east, flux_north, flux_top):
     vs = state.variables
 
+    inv_dx_t = utilities.grid_metric(state, "inv_dx_t")
+    inv_dy_t = utilities.grid_metric(state, "inv_dy_t")
+
     explicit_part = allocate(state.dimensions, ("xt", "yt", "zt"))
     explicit_part = update(
         explicit_part,
         at[2:-2, 2:-2, :],
-        vs.maskT[2:-2, 2:-2, :]
-        * (
-            (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :])
-            / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
-            + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :])
-            / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dyt[npx.newaxis, 2:-2, npx.newaxis])
-        ),
+        (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :]) * inv_dx_t[2:-2, 2:-2, :]
+        + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :]) * inv_dy_t[2:-2, 2:-2, :],
+        inplace=True,
+    )
+    explicit_part = update_add(
+        explicit_part, at[:, :, 0], vs.maskT[:, :, 0] * flux_top[:, :, 0] / vs.dzt[0], inplace=True
     )
-    explicit_part = update_add(explicit_part, at[:, :, 0], vs.maskT[:, :, 0] * flux_top[:, :, 0] / vs.dzt[0])
     explicit_part = update_add(
         explicit_part,
         at[:, :, 1:],
         vs.maskT[:, :, 1:] * (flux_top[:, :, 1:] - flux_top[:, :, :-1]) / vs.dzt[npx.newaxis, npx.newaxis, 1:],
+        inplace=True,
     )
 
     return explicit_part
@@ -154,16 +159,23 @@ def _calc_implicit_part(state, tr):
     delta = update(
         delta, at[:, :, :-1], settings.dt_tracer / vs.dzw[npx.newaxis, npx.newaxis, :-1] * vs.K_33[2:-2, 2:-2, :-1]
     )
-    delta = update(delta, at[:, :, -1], 0.0)
+    delta = update(delta, at[:, :, -1], 0.0, inplace=True)
     a_tri = update(a_tri, at[:, :, 1:], -delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:])
     b_tri = update(
         b_tri, at[:, :, 1:-1], 1 + (delta[:, :, 1:-1] + delta[:, :, :-2]) / vs.dzt[npx.newaxis, npx.newaxis, 1:-1]
     )
-    b_tri = update(b_tri, at[:, :, -1], 1 + delta[:, :, -2] / vs.dzt[npx.newaxis, npx.newaxis, -1])
+    b_tri = update(b_tri, at[:, :, -1], 1 + delta[:, :, -2] / vs.dzt[npx.newaxis, npx.newaxis, -1], inplace=True)
     b_tri_edge = 1 + (delta[:, :, :] / vs.dzt[npx.newaxis, npx.newaxis, :])
     c_tri = update(c_tri, at[:, :, :-1], -delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, :-1])
     sol = utilities.solve_implicit(
-        a_tri, b_tri, c_tri, tr[2:-2, 2:-2, :, vs.taup1], water_mask, b_edge=b_tri_edge, edge_mask=edge_mask
+        a_tri,
+        b_tri,
+        c_tri,
+        tr[2:-2, 2:-2, :, vs.taup1],
+        water_mask,
+        b_edge=b_tri_edge,
+        edge_mask=edge_mask,
+        wet_columns=utilities.get_wet_columns(state, interior=True),
     )
     implicit_part = npx.where(water_mask, sol, tr[2:-2, 2:-2, :, vs.taup1])
     return implicit_part
@@ -200,9 +212,14 @@ def isoneutral_diffusion_tracer(state, tr, dtracer_iso, iso=True, skew=False):
     add implicit part
     """
     if iso:
-        new_tr = update(tr, at[2:-2, 2:-2, :, vs.taup1], _calc_implicit_part(state, tr))
-        dtracer_iso = dtracer_iso + (new_tr[:, :, :, vs.taup1] - tr[:, :, :, vs.taup1]) / settings.dt_tracer
-        tr = new_tr
+        tr_implicit = _calc_implicit_part(state, tr)
+        dtracer_iso = update_add(
+            dtracer_iso,
+            at[2:-2, 2:-2, :],
+            (tr_implicit - tr[2:-2, 2:-2, :, vs.taup1]) / settings.dt_tracer,
+            inplace=True,
+        )
+        tr = update(tr, at[2:-2, 2:-2, :, vs.taup1], tr_implicit, inplace=True)
 
     return tr, dtracer_iso, flux_east, flux_north, flux_top
 
@@ -258,6 +275,7 @@ def isoneutral_diffusion_kernel(state, tr, istemp, iso=True):
                 vs.P_diss_skew,
                 at[2:-2, 2:-2, :-1],
                 -settings.grav / settings.rho_0 * fxa * flux_top[2:-2, 2:-2, :-1] * vs.maskW[2:-2, 2:-2, :-1],
+                inplace=True,
             )
 
             out["P_diss_skew"] = vs.P_diss_skew
@@ -276,6 +294,7 @@ def isoneutral_diffusion_kernel(state, tr, istemp, iso=True):
                     / vs.dzw[npx.newaxis, npx.newaxis, :-1]
                     * vs.maskW[2:-2, 2:-2, :-1]
                 ),
+                inplace=True,
             )
 
             out["P_diss_iso"] = vs.P_diss_iso
@@ -3,6 +3,7 @@ from veros import logger
 
 from veros import veros_kernel, veros_routine, KernelOutput
 from veros.variables import allocate
+from veros.tiling import tiled
 from veros.core import density, utilities
 from veros.core.operators import update, update_add, at
 
@@ -15,6 +16,7 @@ def dm_taper(sx, iso_slopec, iso_dslope):
     return 0.5 * (1.0 + npx.tanh((-npx.abs(sx) + iso_slopec) / iso_dslope))
 
 
+@tiled
 @veros_kernel
 def isoneutral_diffusion_pre(state):
     """
@@ -49,6 +51,7 @@ def isoneutral_diffusion_pre(state):
         vs.maskW[:, :, :-1]
         * (vs.temp[:, :, 1:, vs.tau] - vs.temp[:, :, :-1, vs.tau])
         / vs.dzw[npx.newaxis, npx.newaxis, :-1],
+        inplace=True,
     )
     dSdz = update(
         dSdz,
@@ -56,6 +59,7 @@ def isoneutral_diffusion_pre(state):
         vs.maskW[:, :, :-1]
         * (vs.salt[:, :, 1:, vs.tau] - vs.salt[:, :, :-1, vs.tau])
         / vs.dzw[npx.newaxis, npx.newaxis, :-1],
+        inplace=True,
     )
 
     """
@@ -67,6 +71,7 @@ def isoneutral_diffusion_pre(state):
         vs.maskU[:-1, :, :]
         * (vs.temp[1:, :, :, vs.tau] - vs.temp[:-1, :, :, vs.tau])
         / (vs.dxu[:-1, npx.newaxis, npx.newaxis] * vs.cost[npx.newaxis, :, npx.newaxis]),
+        inplace=True,
     )
     dSdx = update(
         dSdx,
@@ -74,6 +79,7 @@ def isoneutral_diffusion_pre(state):
         vs.maskU[:-1, :, :]
         * (vs.salt[1:, :, :, vs.tau] - vs.salt[:-1, :, :, vs.tau])
         / (vs.dxu[:-1, npx.newaxis, npx.newaxis] * vs.cost[npx.newaxis, :, npx.newaxis]),
+        inplace=True,
     )
 
     """
@@ -85,6 +91,7 @@ def isoneutral_diffusion_pre(state):
         vs.maskV[:, :-1, :]
         * (vs.temp[:, 1:, :, vs.tau] - vs.temp[:, :-1, :, vs.tau])
         / vs.dyu[npx.newaxis, :-1, npx.newaxis],
+        inplace=True,
     )
     dSdy = update(
         dSdy,
@@ -92,6 +99,7 @@ def isoneutral_diffusion_pre(state):
         vs.maskV[:, :-1, :]
         * (vs.salt[:, 1:, :, vs.tau] - vs.salt[:, :-1, :, vs.tau])
         / vs.dyu[npx.newaxis, :-1, npx.newaxis],
+        inplace=True,
     )
 
     """
@@ -103,8 +111,11 @@ def isoneutral_diffusion_pre(state):
         at[1:-2, 2:-2, 1:],
         0.25
         * (vs.K_iso[1:-2, 2:-2, 1:] + vs.K_iso[1:-2, 2:-2, :-1] + vs.K_iso[2:-1, 2:-2, 1:] + vs.K_iso[2:-1, 2:-2, :-1]),
+        inplace=True,
+    )
+    diffloc = update(
+        diffloc, at[1:-2, 2:-2, 0], 0.5 * (vs.K_iso[1:-2, 2:-2, 0] + vs.K_iso[2:-1, 2:-2, 0]), inplace=True
     )
-    diffloc = update(diffloc, at[1:-2, 2:-2, 0], 0.5 * (vs.K_iso[1:-2, 2:-2, 0] + vs.K_iso[2:-1, 2:-2, 0]))
 
     sumz = allocate(state.dimensions, ("xt", "yt", "zt"))[1:-2, 2:-2]
     for kr in range(2):
@@ -127,21 +138,26 @@ def isoneutral_diffusion_pre(state):
                 * vs.maskU[1:-2, 2:-2, ki:]
                 * npx.maximum(settings.K_iso_steep, diffloc[1:-2, 2:-2, ki:] * taper),
             )
-            vs.Ai_ez = update(vs.Ai_ez, at[1:-2, 2:-2, ki:, ip, kr], taper * sxe * vs.maskU[1:-2, 2:-2, ki:])
+            vs.Ai_ez = update(
+                vs.Ai_ez, at[1:-2, 2:-2, ki:, ip, kr], taper * sxe * vs.maskU[1:-2, 2:-2, ki:], inplace=True
+            )
 
-    vs.K_11 = update(vs.K_11, at[1:-2, 2:-2, :], sumz / (4.0 * vs.dzt[npx.newaxis, npx.newaxis, :]))
+    vs.K_11 = update(vs.K_11, at[1:-2, 2:-2, :], sumz / (4.0 * vs.dzt[npx.newaxis, npx.newaxis, :]), inplace=True)
 
     """
     Compute Ai_nz and K_22 on center of north face of T cell.
     """
-    diffloc = update(diffloc, at[...], 0)
+    diffloc = update(diffloc, at[...], 0, inplace=True)
     diffloc = update(
         diffloc,
         at[2:-2, 1:-2, 1:],
         0.25
         * (vs.K_iso[2:-2, 1:-2, 1:] + vs.K_iso[2:-2, 1:-2, :-1] + vs.K_iso[2:-2, 2:-1, 1:] + vs.K_iso[2:-2, 2:-1, :-1]),
+        inplace=True,
+    )
+    diffloc = update(
+        diffloc, at[2:-2, 1:-2, 0], 0.5 * (vs.K_iso[2:-2, 1:-2, 0] + vs.K_iso[2:-2, 2:-1, 0]), inplace=True
     )
-    diffloc = update(diffloc, at[2:-2, 1:-2, 0], 0.5 * (vs.K_iso[2:-2, 1:-2, 0] + vs.K_iso[2:-2, 2:-1, 0]))
 
     sumz = allocate(state.dimensions, ("xt", "yt", "zt"))[2:-2, 1:-2]
     for kr in range(2):
@@ -164,8 +180,10 @@ def isoneutral_diffusion_pre(state):
                 * vs.maskV[2:-2, 1:-2, ki:]
                 * npx.maximum(settings.K_iso_steep, diffloc[2:-2, 1:-2, ki:] * taper),
             )
-            vs.Ai_nz = update(vs.Ai_nz, at[2:-2, 1:-2, ki:, jp, kr], taper * syn * vs.maskV[2:-2, 1:-2, ki:])
-    vs.K_22 = update(vs.K_22, at[2:-2, 1:-2, :], sumz / (4.0 * vs.dzt[npx.newaxis, npx.newaxis, :]))
+            vs.Ai_nz = update(
+                vs.Ai_nz, at[2:-2, 1:-2, ki:, jp, kr], taper * syn * vs.maskV[2:-2, 1:-2, ki:], inplace=True
+            )
+    vs.K_22 = update(vs.K_22, at[2:-2, 1:-2, :], sumz / (4.0 * vs.dzt[npx.newaxis, npx.newaxis, :]), inplace=True)
 
     """
     compute Ai_bx, Ai_by and K33 on top face of T cell.
@@ -195,7 +213,9 @@ def isoneutral_diffusion_pre(state):
                 * sxb**2
                 * vs.maskW[2:-2, 2:-2, :-1]
             )
-            vs.Ai_bx = update(vs.Ai_bx, at[2:-2, 2:-2, :-1, ip, kr], taper * sxb * vs.maskW[2:-2, 2:-2, :-1])
+            vs.Ai_bx = update(
+                vs.Ai_bx, at[2:-2, 2:-2, :-1, ip, kr], taper * sxb * vs.maskW[2:-2, 2:-2, :-1], inplace=True
+            )
 
         # northward slopes at the top of T cells
         for jp in range(2):
@@ -214,15 +234,18 @@ def isoneutral_diffusion_pre(state):
                 * syb**2
                 * vs.maskW[2:-2, 2:-2, :-1]
             )
-            vs.Ai_by = update(vs.Ai_by, at[2:-2, 2:-2, :-1, jp, kr], taper * syb * vs.maskW[2:-2, 2:-2, :-1])
+            vs.Ai_by = update(
+                vs.Ai_by, at[2:-2, 2:-2, :-1, jp, kr], taper * syb * vs.maskW[2:-2, 2:-2, :-1], inplace=True
+            )
 
     vs.K_33 = update(
         vs.K_33,
         at[2:-2, 2:-2, :-1],
         sumx / (4 * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
         + sumy / (4 * vs.dyt[npx.newaxis, 2:-2, npx.newaxis] * vs.cost[npx.newaxis, 2:-2, npx.newaxis]),
+        inplace=True,
     )
-    vs.K_33 = update(vs.K_33, at[..., -1], 0.0)
+    vs.K_33 = update(vs.K_33, at[..., -1], 0.0, inplace=True)
 
     return KernelOutput(
         Ai_ez=vs.Ai_ez, Ai_nz=vs.Ai_nz, Ai_bx=vs.Ai_bx, Ai_by=vs.Ai_by, K_11=vs.K_11, K_22=vs.K_22, K_33=vs.K_33
@@ -241,7 +264,9 @@ def isoneutral_diag_streamfunction_kernel(state):
     diffloc = 0.25 * (
         K_gm_pad[1:-2, 2:-2, 1:-1] + K_gm_pad[1:-2, 2:-2, :-2] + K_gm_pad[2:-1, 2:-2, 1:-1] + K_gm_pad[2:-1, 2:-2, :-2]
     )
-    vs.B2_gm = update(vs.B2_gm, at[1:-2, 2:-2, :], 0.25 * diffloc * npx.sum(vs.Ai_ez[1:-2, 2:-2, ...], axis=(3, 4)))
+    vs.B2_gm = update(
+        vs.B2_gm, at[1:-2, 2:-2, :], 0.25 * diffloc * npx.sum(vs.Ai_ez[1:-2, 2:-2, ...], axis=(3, 4)), inplace=True
+    )
 
     """
     zonal component at north face of 'T' cells
@@ -249,7 +274,9 @@ def isoneutral_diag_streamfunction_kernel(state):
     diffloc = 0.25 * (
         K_gm_pad[2:-2, 1:-2, 1:-1] + K_gm_pad[2:-2, 1:-2, :-2] + K_gm_pad[2:-2, 2:-1, 1:-1] + K_gm_pad[2:-2, 2:-1, :-2]
     )
-    vs.B1_gm = update(vs.B1_gm, at[2:-2, 1:-2, :], -0.25 * diffloc * npx.sum(vs.Ai_nz[2:-2, 1:-2, ...], axis=(3, 4)))
+    vs.B1_gm = update(
+        vs.B1_gm, at[2:-2, 1:-2, :], -0.25 * diffloc * npx.sum(vs.Ai_nz[2:-2, 1:-2, ...], axis=(3, 4)), inplace=True
+    )
 
     return KernelOutput(B1_gm=vs.B1_gm, B2_gm=vs.B2_gm)
 
@@ -29,6 +29,7 @@ def tend_coriolisf(state):
             * vs.dxt[3:-1, npx.newaxis, npx.newaxis]
             / vs.dxu[2:-2, npx.newaxis, npx.newaxis]
         ),
+        inplace=True,
     )
     vs.dv_cor = update(
         vs.dv_cor,
@@ -47,6 +48,7 @@ def tend_coriolisf(state):
             * vs.cost[npx.newaxis, 3:-1, npx.newaxis]
             / (vs.dyu[npx.newaxis, 2:-2, npx.newaxis] * vs.cosu[npx.newaxis, 2:-2, npx.newaxis])
         ),
+        inplace=True,
     )
 
     """
@@ -69,6 +71,7 @@ def tend_coriolisf(state):
                 * vs.dxt[3:-1, npx.newaxis, npx.newaxis]
                 / vs.dxu[2:-2, npx.newaxis, npx.newaxis]
             ),
+            inplace=True,
         )
         vs.dv_cor = update_add(
             vs.dv_cor,
@@ -88,13 +91,14 @@ def tend_coriolisf(state):
                 * vs.cost[npx.newaxis, 3:-1, npx.newaxis]
                 / (vs.dyu[npx.newaxis, 2:-2, npx.newaxis] * vs.cosu[npx.newaxis, 2:-2, npx.newaxis])
             ),
+            inplace=True,
         )
 
     """
     transfer to time tendencies
     """
-    vs.du = update(vs.du, at[2:-2, 2:-2, :, vs.tau], vs.du_cor[2:-2, 2:-2])
-    vs.dv = update(vs.dv, at[2:-2, 2:-2, :, vs.tau], vs.dv_cor[2:-2, 2:-2])
+    vs.du = update(vs.du, at[2:-2, 2:-2, :, vs.tau], vs.du_cor[2:-2, 2:-2], inplace=True)
+    vs.dv = update(vs.dv, at[2:-2, 2:-2, :, vs.tau], vs.dv_cor[2:-2, 2:-2], inplace=True)
 
     return KernelOutput(du=vs.du, dv=vs.dv, du_cor=vs.du_cor, dv_cor=vs.dv_cor)
 
@@ -120,11 +124,13 @@ def tend_tauxyf(state):
             vs.du,
             at[2:-2, 2:-2, -1, vs.tau],
             vs.maskU[2:-2, 2:-2, -1] * vs.surface_taux[2:-2, 2:-2] / vs.dzt[-1] / settings.rho_0,
+            inplace=True,
         )
         vs.dv = update_add(
             vs.dv,
             at[2:-2, 2:-2, -1, vs.tau],
             vs.maskV[2:-2, 2:-2, -1] * vs.surface_tauy[2:-2, 2:-2] / vs.dzt[-1] / settings.rho_0,
+            inplace=True,
         )
 
     return KernelOutput(du=vs.du, dv=vs.dv)
@@ -162,11 +168,13 @@ def momentum_advection(state):
         flux_east,
         at[1:-2, 2:-2],
         0.25 * (vs.u[1:-2, 2:-2, :, vs.tau] + vs.u[2:-1, 2:-2, :, vs.tau]) * (utr[2:-1, 2:-2] + utr[1:-2, 2:-2]),
+        inplace=True,
     )
     flux_north = update(
         flux_north,
         at[2:-2, 1:-2],
         0.25 * (vs.u[2:-2, 1:-2, :, vs.tau] + vs.u[2:-2, 2:-1, :, vs.tau]) * (vtr[3:-1, 1:-2] + vtr[2:-2, 1:-2]),
+        inplace=True,
     )
     flux_top = update(
         flux_top,
@@ -174,6 +182,7 @@ def momentum_advection(state):
         0.25
         * (vs.u[2:-2, 2:-2, 1:, vs.tau] + vs.u[2:-2, 2:-2, :-1, vs.tau])
         * (wtr[2:-2, 2:-2, :-1] + wtr[3:-1, 2:-2, :-1]),
+        inplace=True,
     )
     vs.du_adv = update(
         vs.du_adv,
@@ -182,25 +191,28 @@ def momentum_advection(state):
         * vs.maskU[2:-2, 2:-2]
         * (flux_east[2:-2, 2:-2] - flux_east[1:-3, 2:-2] + flux_north[2:-2, 2:-2] - flux_north[2:-2, 1:-3])
         / (vs.dzt[npx.newaxis, npx.newaxis, :] * vs.area_u[2:-2, 2:-2, npx.newaxis]),
+        inplace=True,
     )
 
     tmp = vs.maskU / (vs.dzt * vs.area_u[:, :, npx.newaxis])
     vs.du_adv = vs.du_adv - tmp * flux_top
-    vs.du_adv = update_add(vs.du_adv, at[:, :, 1:], tmp[:, :, 1:] * flux_top[:, :, :-1])
+    vs.du_adv = update_add(vs.du_adv, at[:, :, 1:], tmp[:, :, 1:] * flux_top[:, :, :-1], inplace=True)
 
     """
     for meridional momentum
     """
-    flux_top = update(flux_top, at[...], 0.0)
+    flux_top = update(flux_top, at[...], 0.0, inplace=True)
     flux_east = update(
         flux_east,
         at[1:-2, 2:-2],
         0.25 * (vs.v[1:-2, 2:-2, :, vs.tau] + vs.v[2:-1, 2:-2, :, vs.tau]) * (utr[1:-2, 3:-1] + utr[1:-2, 2:-2]),
+        inplace=True,
     )
     flux_north = update(
         flux_north,
         at[2:-2, 1:-2],
         0.25 * (vs.v[2:-2, 1:-2, :, vs.tau] + vs.v[2:-2, 2:-1, :, vs.tau]) * (vtr[2:-2, 2:-1] + vtr[2:-2, 1:-2]),
+        inplace=True,
     )
     flux_top = update(
         flux_top,
@@ -208,6 +220,7 @@ def momentum_advection(state):
         0.25
         * (vs.v[2:-2, 2:-2, 1:, vs.tau] + vs.v[2:-2, 2:-2, :-1, vs.tau])
         * (wtr[2:-2, 2:-2, :-1] + wtr[2:-2, 3:-1, :-1]),
+        inplace=True,
     )
 
     vs.dv_adv = update(
@@ -217,14 +230,15 @@ def momentum_advection(state):
         * vs.maskV[2:-2, 2:-2]
         * (flux_east[2:-2, 2:-2] - flux_east[1:-3, 2:-2] + flux_north[2:-2, 2:-2] - flux_north[2:-2, 1:-3])
         / (vs.dzt * vs.area_v[2:-2, 2:-2, npx.newaxis]),
+        inplace=True,
     )
 
     tmp = vs.maskV / (vs.dzt * vs.area_v[:, :, npx.newaxis])
     vs.dv_adv = vs.dv_adv - tmp * flux_top
-    vs.dv_adv = update_add(vs.dv_adv, at[:, :, 1:], tmp[:, :, 1:] * flux_top[:, :, :-1])
+    vs.dv_adv = update_add(vs.dv_adv, at[:, :, 1:], tmp[:, :, 1:] * flux_top[:, :, :-1], inplace=True)
 
-    vs.du = update_add(vs.du, at[:, :, :, vs.tau], vs.du_adv)
-    vs.dv = update_add(vs.dv, at[:, :, :, vs.tau], vs.dv_adv)
+    vs.du = update_add(vs.du, at[:, :, :, vs.tau], vs.du_adv, inplace=True)
+    vs.dv = update_add(vs.dv, at[:, :, :, vs.tau], vs.dv_adv, inplace=True)
 
     return KernelOutput(du=vs.du, dv=vs.dv, du_adv=vs.du_adv, dv_adv=vs.dv_adv)
 
@@ -262,6 +276,7 @@ def vertical_velocity_kernel(state):
             )
             / (vs.cost[npx.newaxis, 1:] * vs.dyt[npx.newaxis, 1:])
         ),
+        inplace=True,
     )
 
     fxa = update(
@@ -279,9 +294,10 @@ def vertical_velocity_kernel(state):
             )
             / (vs.cost[npx.newaxis, 1:, npx.newaxis] * vs.dyt[npx.newaxis, 1:, npx.newaxis])
         ),
+        inplace=True,
     )
 
-    vs.w = update(vs.w, at[1:, 1:, :, vs.taup1], npx.cumsum(fxa[1:, 1:, :], axis=2))
+    vs.w = update(vs.w, at[1:, 1:, :, vs.taup1], npx.cumsum(fxa[1:, 1:, :], axis=2), inplace=True)
 
     return KernelOutput(w=vs.w)
 
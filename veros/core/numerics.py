@@ -253,6 +253,46 @@ def calc_topo(state):
     vs = state.variables
     vs.update(calc_topo_kernel(state))
 
+    if any(state.var_meta[name].active for name in utilities.GRID_METRIC_DEFINITIONS):
+        vs.update(calc_grid_metric_cache_kernel(state))
+
+    if state.var_meta["wet_columns"].active:
+        calc_wet_columns(state)
+
+
+@veros_routine
+def calc_wet_columns(state):
+    """
+    find all columns that contain water, column-local kernels skip the others
+    """
+    from veros.state import resize_dimension
+
+    vs = state.variables
+
+    # the number of wet columns is only known now, so resize all arrays depending on it
+    wet_columns = npx.flatnonzero(vs.kbot > 0)
+    wet_columns_interior = npx.flatnonzero(vs.kbot[2:-2, 2:-2] > 0)
+
+    resize_dimension(state, "wet_columns", wet_columns.size)
+    resize_dimension(state, "wet_columns_interior", wet_columns_interior.size)
+
+    vs.wet_columns = wet_columns
+    vs.wet_columns_interior = wet_columns_interior
+
+
+@veros_kernel
+def calc_grid_metric_cache_kernel(state):
+    """
+    precompute time-invariant stencil coefficients that fit into the metric cache
+    """
+    vs = state.variables
+
+    cached_metrics = {
+        name: metric(vs) for name, metric in utilities.GRID_METRIC_DEFINITIONS.items() if state.var_meta[name].active
+    }
+
+    return KernelOutput(**cached_metrics)
+
 
 @veros_kernel
 def calc_initial_conditions_kernel(state):
@@ -16,13 +16,35 @@ def noop(*args, **kwargs):
     pass
 
 
+_thread_pool = None
+
+
+def get_thread_pool():
+    """Return a thread pool shared by all multithreaded NumPy kernels (or None if num_threads is 1)."""
+    from veros.tiling import in_tile
+
+    global _thread_pool
+
+    # tiles are already evaluated on the pool, waiting for nested tasks could deadlock
+    if runtime_settings.num_threads < 2 or in_tile():
+        return None
+
+    if _thread_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _thread_pool = ThreadPoolExecutor(max_workers=runtime_settings.num_threads)
+
+    return _thread_pool
+
+
 @contextmanager
 def make_writeable(*arrs):
     orig_writeable = [arr.flags.writeable for arr in arrs]
     writeable_arrs = []
     try:
         for arr in arrs:
-            arr = arr.copy()
+            # preserve memory layout (e.g. of variables with contiguous time levels)
+            arr = arr.copy(order="K")
             arr.flags.writeable = True
             writeable_arrs.append(arr)
 
@@ -39,42 +61,85 @@ def make_writeable(*arrs):
                 pass
 
 
-def update_numpy(arr, at, to):
+def _can_update_inplace(arr):
+    # Only arrays that own their memory may be modified, views would leak the update into
+    # their base. Arrays with contiguous time levels are views of a buffer of the same size,
+    # which belongs to the view alone.
+    import numpy as np
+
+    if not runtime_settings.inplace_updates or type(arr) is not np.ndarray:
+        return False
+
+    if arr.flags.owndata:
+        return True
+
+    return type(arr.base) is np.ndarray and arr.base.flags.owndata and arr.base.size == arr.size
+
+
+@contextmanager
+def make_writeable_inplace(arr):
+    orig_writeable = arr.flags.writeable
+    try:
+        arr.flags.writeable = True
+        yield arr
+    finally:
+        arr.flags.writeable = orig_writeable
+
+
+def update_numpy(arr, at, to, inplace=False):
+    if inplace and _can_update_inplace(arr):
+        with make_writeable_inplace(arr) as warr:
+            warr[at] = to
+        return warr
+
     with make_writeable(arr) as warr:
         warr[at] = to
     return warr
 
 
-def update_add_numpy(arr, at, to):
+def update_add_numpy(arr, at, to, inplace=False):
+    if inplace and _can_update_inplace(arr):
+        with make_writeable_inplace(arr) as warr:
+            warr[at] += to
+        return warr
+
     with make_writeable(arr) as warr:
         warr[at] += to
     return warr
 
 
-def update_multiply_numpy(arr, at, to):
+def update_multiply_numpy(arr, at, to, inplace=False):
+    if inplace and _can_update_inplace(arr):
+        with make_writeable_inplace(arr) as warr:
+            warr[at] *= to
+        return warr
+
     with make_writeable(arr) as warr:
         warr[at] *= to
     return warr
 
 
 def solve_tridiagonal_numpy(a, b, c, d, water_mask, edge_mask):
+    from veros.core.special.tdma_numpy_ import tdma
+
+    return tdma(
+        a,
+        b,
+        c,
+        d,
+        water_mask,
+        edge_mask,
+        thread_pool=get_thread_pool(),
+        num_threads=runtime_settings.num_threads,
+        # like the compiled extension, skip columns without water
+        compact=True,
+    )
+
+
+def bincount_numpy(x, weights=None, length=None):
     import numpy as np
-    from scipy.linalg import lapack
 
-    out = np.zeros(a.shape, dtype=a.dtype)
-
-    if not np.any(water_mask):
-        return out
-
-    # remove couplings between slices
-    with make_writeable(a, c) as warr:
-        a, c = warr
-        a[edge_mask] = 0
-        c[..., -1] = 0
-
-    sol = lapack.dgtsv(a[water_mask][1:], b[water_mask], c[water_mask][:-1], d[water_mask])[3]
-    out[water_mask] = sol
-    return out
+    return np.bincount(x, weights=weights, minlength=length or 0)
 
 
 def fori_numpy(lower, upper, body_fun, init_val):
@@ -142,18 +207,26 @@ def solve_tridiagonal_jax(a, b, c, d, water_mask, edge_mask, use_ext=None):
     return jnp.moveaxis(sol, 0, 2)
 
 
-def update_jax(arr, at, to):
+# JAX arrays are immutable, XLA re-uses buffers on its own
+def update_jax(arr, at, to, inplace=False):
     return arr.at[at].set(to)
 
 
-def update_add_jax(arr, at, to):
+def update_add_jax(arr, at, to, inplace=False):
     return arr.at[at].add(to)
 
 
-def update_multiply_jax(arr, at, to):
+def update_multiply_jax(arr, at, to, inplace=False):
     return arr.at[at].multiply(to)
 
 
+def bincount_jax(x, weights=None, length=None):
+    import jax.numpy as jnp
+
+    # length must be static when jitting
+    return jnp.bincount(x, weights=weights, length=length)
+
+
 def flush_jax():
     import jax
 
@@ -173,6 +246,7 @@ if runtime_settings.backend == "numpy":
     update_multiply = update_multiply_numpy
     at = Index()
     solve_tridiagonal = solve_tridiagonal_numpy
+    bincount = bincount_numpy
     for_loop = fori_numpy
     scan = scan_numpy
     flush = noop
@@ -185,6 +259,7 @@ elif runtime_settings.backend == "jax":
     update_multiply = update_multiply_jax
     at = Index()
     solve_tridiagonal = solve_tridiagonal_jax
+    bincount = bincount_jax
     for_loop = jax.lax.fori_loop
     scan = jax.lax.scan
     flush = flush_jax
@@ -2,6 +2,7 @@ import cython
 from cpython.pycapsule cimport PyCapsule_New
 
 from libc.stdint cimport int32_t, int64_t
+from libc.stdlib cimport malloc, free
 
 
 @cython.cdivision(True)
@@ -120,6 +121,84 @@ cdef void tdma_cython_float(void** out_ptr, void** data_ptr) nogil:
         ii += stride
 
 
+ctypedef fused real:
+    float
+    double
+
+
+@cython.cdivision(True)
+cdef void _tdma_cython_fused(
+    int64_t n, const real* a, const real* b, const real* c, const real* d, real* cp, real* dp
+) noexcept nogil:
+    cdef:
+        int64_t i
+        real denom
+
+    if n < 1:
+        return
+
+    cp[0] = c[0] / b[0]
+    dp[0] = d[0] / b[0]
+
+    for i in range(1, n):
+        denom = 1. / (b[i] - a[i] * cp[i - 1])
+        cp[i] = c[i] * denom
+        dp[i] = (d[i] - a[i] * dp[i - 1]) * denom
+
+    for i in range(n - 2, -1, -1):
+        dp[i] -= cp[i] * dp[i + 1]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def tdma_numpy(
+    const real[:, ::1] a,
+    const real[:, ::1] b,
+    const real[:, ::1] c,
+    const real[:, ::1] d,
+    const int32_t[::1] system_depths,
+    real[:, ::1] out,
+):
+    """Solve tridiagonal systems stored in the rows of 2D arrays (used by the NumPy backend).
+
+    Only the last ``system_depths[i]`` elements of row ``i`` belong to the system, all other
+    elements of the solution are set to 0. Releases the GIL.
+    """
+    cdef:
+        int64_t i, j, system_depth, system_start
+        int64_t num_systems = a.shape[0]
+        int64_t stride = a.shape[1]
+        real* workspace
+
+    workspace = <real*>malloc(max(stride, 1) * sizeof(real))
+    if workspace is NULL:
+        raise MemoryError()
+
+    try:
+        with nogil:
+            for i in range(num_systems):
+                system_depth = system_depths[i]
+                system_start = stride - system_depth
+
+                for j in range(system_start):
+                    out[i, j] = 0.
+
+                if system_depth < 1:
+                    continue
+
+                _tdma_cython_fused(
+                    system_depth,
+                    &a[i, system_start],
+                    &b[i, system_start],
+                    &c[i, system_start],
+                    &d[i, system_start],
+                    workspace,
+                    &out[i, system_start],
+                )
+    finally:
+        free(workspace)
+
+
 cpu_custom_call_targets = {}
 
 cdef register_custom_call_target(fn_name, void* fn):
@@ -0,0 +1,116 @@
+try:
+    from veros.core.special import tdma_cython_
+except ImportError:
+    HAS_CPU_EXT = False
+else:
+    HAS_CPU_EXT = hasattr(tdma_cython_, "tdma_numpy")
+
+import numpy as np
+
+SUPPORTED_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def _tdma_ext(a, b, c, d, system_depths, out):
+    nz = a.shape[-1]
+    tdma_cython_.tdma_numpy(
+        a.reshape(-1, nz),
+        b.reshape(-1, nz),
+        c.reshape(-1, nz),
+        d.reshape(-1, nz),
+        system_depths.reshape(-1),
+        out.reshape(-1, nz),
+    )
+
+
+def _tdma_vectorized(a, b, c, d, water_mask, edge_mask, out, compact=False):
+    # Thomas algorithm, vectorized over all columns
+    nz = a.shape[-1]
+
+    if compact:
+        # columns without water have a trivial solution, so only wet columns are solved
+        columns = np.flatnonzero(np.any(water_mask, axis=-1))
+        a, b, c, d, water_mask, edge_mask = (
+            np.reshape(arr, (-1, nz))[columns] for arr in (a, b, c, d, water_mask, edge_mask)
+        )
+
+    a = np.where(np.logical_and(water_mask, np.logical_not(edge_mask)), a, 0)
+    b = np.where(water_mask, b, 1)
+    c = np.where(water_mask, c, 0)
+    d = np.where(water_mask, d, 0)
+
+    # make vertical axis the leading one, so every level is contiguous in memory
+    a, b, c, d = (np.ascontiguousarray(np.moveaxis(arr, -1, 0)) for arr in (a, b, c, d))
+
+    cp = np.empty_like(a)
+    dp = np.empty_like(a)
+    denom = np.empty_like(a[0])
+
+    np.divide(c[0], b[0], out=cp[0])
+    np.divide(d[0], b[0], out=dp[0])
+
+    for k in range(1, nz):
+        np.multiply(a[k], cp[k - 1], out=denom)
+        np.subtract(b[k], denom, out=denom)
+        np.divide(c[k], denom, out=cp[k])
+        np.multiply(a[k], dp[k - 1], out=dp[k])
+        np.subtract(d[k], dp[k], out=dp[k])
+        np.divide(dp[k], denom, out=dp[k])
+
+    for k in range(nz - 2, -1, -1):
+        dp[k] -= cp[k] * dp[k + 1]
+
+    if compact:
+        out = np.reshape(out, (-1, nz))
+        out[...] = 0
+        out[columns] = dp.T
+    else:
+        out[...] = np.moveaxis(dp, 0, -1)
+
+
+def tdma(a, b, c, d, water_mask, edge_mask, thread_pool=None, num_threads=1, compact=False):
+    """Solve tridiagonal systems along the last axis of (x, y, z) arrays.
+
+    Each system consists of the water cells of a column, which must be contiguous and extend
+    to the last element of the column. Solution values outside of water cells are set to 0.
+
+    If a thread pool is given, columns are split into num_threads chunks along the first axis
+    that are solved concurrently.
+
+    If compact is set, columns without water cells are removed before solving. The compiled
+    extension skips them anyway, so this only affects the pure NumPy implementation.
+    """
+    if not a.shape == b.shape == c.shape == d.shape:
+        raise ValueError("all inputs must have identical shape")
+
+    dtype = np.result_type(a, b, c, d)
+    use_ext = HAS_CPU_EXT and dtype in SUPPORTED_DTYPES
+
+    out = np.empty(a.shape, dtype=dtype)
+
+    if use_ext:
+        a, b, c, d = (np.ascontiguousarray(arr, dtype=dtype) for arr in (a, b, c, d))
+        system_depths = np.sum(water_mask, axis=-1, dtype=np.int32)
+
+        def solve_chunk(chunk):
+            _tdma_ext(a[chunk], b[chunk], c[chunk], d[chunk], system_depths[chunk], out[chunk])
+
+    else:
+
+        def solve_chunk(chunk):
+            _tdma_vectorized(
+                a[chunk], b[chunk], c[chunk], d[chunk], water_mask[chunk], edge_mask[chunk], out[chunk], compact
+            )
+
+    num_chunks = min(num_threads, a.shape[0])
+
+    if thread_pool is None or num_chunks < 2:
+        solve_chunk(Ellipsis)
+        return out
+
+    bounds = np.linspace(0, a.shape[0], num_chunks + 1).astype(int)
+    chunks = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    for future in [thread_pool.submit(solve_chunk, chunk) for chunk in chunks]:
+        future.result()
+
+    return out
@@ -1,12 +1,17 @@
+from functools import partial
+
 from veros.core.operators import numpy as npx
 
 from veros import veros_routine, veros_kernel, KernelOutput
 from veros.distributed import global_sum
+from veros.tiling import tiled
 from veros.variables import allocate
 from veros.core import advection, diffusion, isoneutral, density, utilities
+from veros.core.density import gsw
 from veros.core.operators import update, update_add, at
 
 
+@tiled
 @veros_kernel
 def advect_tracer(state, tr):
     """
@@ -15,6 +20,9 @@ def advect_tracer(state, tr):
     vs = state.variables
     settings = state.settings
 
+    inv_dx_t = utilities.grid_metric(state, "inv_dx_t")
+    inv_dy_t = utilities.grid_metric(state, "inv_dy_t")
+
     if settings.enable_superbee_advection:
         flux_east, flux_north, flux_top = advection.adv_flux_superbee(state, tr)
     else:
@@ -24,17 +32,16 @@ def advect_tracer(state, tr):
     dtr = update(
         dtr,
         at[2:-2, 2:-2, :],
-        vs.maskT[2:-2, 2:-2, :]
-        * (
-            -(flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :])
-            / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
-            - (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :])
-            / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dyt[npx.newaxis, 2:-2, npx.newaxis])
-        ),
+        -(flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :]) * inv_dx_t[2:-2, 2:-2, :]
+        - (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :]) * inv_dy_t[2:-2, 2:-2, :],
+        inplace=True,
     )
-    dtr = update_add(dtr, at[:, :, 0], -1 * vs.maskT[:, :, 0] * flux_top[:, :, 0] / vs.dzt[0])
+    dtr = update_add(dtr, at[:, :, 0], -1 * vs.maskT[:, :, 0] * flux_top[:, :, 0] / vs.dzt[0], inplace=True)
     dtr = update_add(
-        dtr, at[:, :, 1:], -1 * vs.maskT[:, :, 1:] * (flux_top[:, :, 1:] - flux_top[:, :, :-1]) / vs.dzt[1:]
+        dtr,
+        at[:, :, 1:],
+        -1 * vs.maskT[:, :, 1:] * (flux_top[:, :, 1:] - flux_top[:, :, :-1]) / vs.dzt[1:],
+        inplace=True,
     )
 
     return dtr
@@ -47,7 +54,7 @@ def advect_temperature(state):
     """
     vs = state.variables
     dtr = advect_tracer(state, vs.temp[..., vs.tau])
-    vs.dtemp = update(vs.dtemp, at[..., vs.tau], dtr)
+    vs.dtemp = update(vs.dtemp, at[..., vs.tau], dtr, inplace=True)
     return KernelOutput(dtemp=vs.dtemp)
 
 
@@ -58,7 +65,7 @@ def advect_salinity(state):
     """
     vs = state.variables
     dtr = advect_tracer(state, vs.salt[..., vs.tau])
-    vs.dsalt = update(vs.dsalt, at[..., vs.tau], dtr)
+    vs.dsalt = update(vs.dsalt, at[..., vs.tau], dtr, inplace=True)
     return KernelOutput(dsalt=vs.dsalt)
 
 
@@ -75,41 +82,84 @@ def calc_eq_of_state(state, n):
     temp = vs.temp[..., n]
     press = npx.abs(vs.zt)
 
-    """
-    calculate new density
-    """
-    vs.rho = update(vs.rho, at[..., n], density.get_rho(state, salt, temp, press) * vs.maskT)
+    # only columns that contain water are evaluated if wet-column compaction is enabled,
+    # unmasked quantities keep their previous values in the other columns
+    columns = utilities.get_wet_columns(state)
 
-    """
-    calculate new potential density
-    """
-    vs.prho = update(vs.prho, at[...], density.get_potential_rho(state, salt, temp) * vs.maskT)
+    def eos(func, *args, out=None):
+        return utilities.map_wet_columns(lambda s, t: func(s, t, *args), columns, salt, temp, out=out)
 
-    """
-    calculate new dynamic enthalpy and derivatives
-    """
-    if settings.enable_conserve_energy:
-        vs.Hd = update(vs.Hd, at[..., n], density.get_dyn_enthalpy(state, salt, temp, press) * vs.maskT)
-        vs.int_drhodT = update(vs.int_drhodT, at[..., n], density.get_int_drhodT(state, salt, temp, press))
-        vs.int_drhodS = update(vs.int_drhodS, at[..., n], density.get_int_drhodS(state, salt, temp, press))
+    if settings.eq_of_state_type == 5:
+        """
+        all quantities share the terms of the TEOS-10 polynomials, so evaluate them together
+        """
+
+        def teos10_state(salt_loc, temp_loc):
+            rho, prho, rho_shifted, Hd, dHdT, dHdS = gsw.gsw_state(
+                salt_loc, temp_loc, press, settings.enable_conserve_energy
+            )
+            if not settings.enable_conserve_energy:
+                return rho, prho, rho_shifted, Hd, None, None
+
+            return rho, prho, rho_shifted, Hd, -(1024.0 / 9.81) * dHdT, -(1024.0 / 9.81) * dHdS
+
+        rho, prho, rho_shifted, Hd, int_drhodT, int_drhodS = eos(
+            teos10_state, out=(None, None, None, None, vs.int_drhodT[..., n], vs.int_drhodS[..., n])
+        )
+        vs.rho = update(vs.rho, at[..., n], rho * vs.maskT)
+        vs.prho = update(vs.prho, at[...], prho * vs.maskT)
+
+        if settings.enable_conserve_energy:
+            vs.Hd = update(vs.Hd, at[..., n], Hd * vs.maskT)
+            vs.int_drhodT = update(vs.int_drhodT, at[..., n], int_drhodT)
+            vs.int_drhodS = update(vs.int_drhodS, at[..., n], int_drhodS)
+
+    else:
+        """
+        calculate new density
+        """
+        vs.rho = update(vs.rho, at[..., n], eos(partial(density.get_rho, state), press) * vs.maskT, inplace=True)
+
+        """
+        calculate new potential density
+        """
+        vs.prho = update(vs.prho, at[...], eos(partial(density.get_potential_rho, state)) * vs.maskT, inplace=True)
+
+        """
+        calculate new dynamic enthalpy and derivatives
+        """
+        if settings.enable_conserve_energy:
+            vs.Hd = update(
+                vs.Hd, at[..., n], eos(partial(density.get_dyn_enthalpy, state), press) * vs.maskT, inplace=True
+            )
+            vs.int_drhodT = update(
+                vs.int_drhodT,
+                at[..., n],
+                eos(partial(density.get_int_drhodT, state), press, out=vs.int_drhodT[..., n]),
+                inplace=True,
+            )
+            vs.int_drhodS = update(
+                vs.int_drhodS,
+                at[..., n],
+                eos(partial(density.get_int_drhodS, state), press, out=vs.int_drhodS[..., n]),
+                inplace=True,
+            )
+
+        rho_shifted = density.get_rho(state, salt[:, :, 1:], temp[:, :, 1:], press[:-1])
 
     """
     new stability frequency
     """
     fxa = -settings.grav / settings.rho_0 / vs.dzw[npx.newaxis, npx.newaxis, :-1] * vs.maskW[:, :, :-1]
-    vs.Nsqr = update(
-        vs.Nsqr,
-        at[:, :, :-1, n],
-        fxa * (density.get_rho(state, salt[:, :, 1:], temp[:, :, 1:], press[:-1]) - vs.rho[:, :, :-1, n]),
-    )
-    vs.Nsqr = update(vs.Nsqr, at[:, :, -1, n], vs.Nsqr[:, :, -2, n])
+    vs.Nsqr = update(vs.Nsqr, at[:, :, :-1, n], fxa * (rho_shifted - vs.rho[:, :, :-1, n]), inplace=True)
+    vs.Nsqr = update(vs.Nsqr, at[:, :, -1, n], vs.Nsqr[:, :, -2, n], inplace=True)
 
     return KernelOutput(
         rho=vs.rho, prho=vs.prho, Hd=vs.Hd, int_drhodT=vs.int_drhodT, int_drhodS=vs.int_drhodS, Nsqr=vs.Nsqr
     )
 
 
-@veros_kernel
+@veros_kernel(donate_outputs=True)
 def advect_temp_salt_enthalpy(state):
     """
     integrate temperature and salinity and diagnose sources of dynamic enthalpy
@@ -117,6 +167,9 @@ def advect_temp_salt_enthalpy(state):
     vs = state.variables
     settings = state.settings
 
+    inv_dx_t = utilities.grid_metric(state, "inv_dx_t")
+    inv_dy_t = utilities.grid_metric(state, "inv_dy_t")
+
     vs.dtemp = advect_temperature(state).dtemp
     vs.dsalt = advect_salinity(state).dsalt
 
@@ -132,19 +185,18 @@ def advect_temp_salt_enthalpy(state):
         vs.dHd = update(
             vs.dHd,
             at[2:-2, 2:-2, :, vs.tau],
-            vs.maskT[2:-2, 2:-2, :]
-            * (
-                -(flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
-                - (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dyt[npx.newaxis, 2:-2, npx.newaxis])
-            ),
+            -(flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :]) * inv_dx_t[2:-2, 2:-2, :]
+            - (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :]) * inv_dy_t[2:-2, 2:-2, :],
+            inplace=True,
+        )
+        vs.dHd = update_add(
+            vs.dHd, at[:, :, 0, vs.tau], -1 * vs.maskT[:, :, 0] * flux_top[:, :, 0] / vs.dzt[0], inplace=True
         )
-        vs.dHd = update_add(vs.dHd, at[:, :, 0, vs.tau], -1 * vs.maskT[:, :, 0] * flux_top[:, :, 0] / vs.dzt[0])
         vs.dHd = update_add(
             vs.dHd,
             at[:, :, 1:, vs.tau],
             -1 * vs.maskT[:, :, 1:] * (flux_top[:, :, 1:] - flux_top[:, :, :-1]) / vs.dzt[npx.newaxis, npx.newaxis, 1:],
+            inplace=True,
         )
 
         """
@@ -161,6 +213,7 @@ def advect_temp_salt_enthalpy(state):
                 - vs.int_drhodS[2:-2, 2:-2, :, vs.tau] * vs.dsalt[2:-2, 2:-2, :, vs.tau]
             )
             - vs.dHd[2:-2, 2:-2, :, vs.tau],
+            inplace=True,
         )
 
         """
@@ -176,6 +229,7 @@ def advect_temp_salt_enthalpy(state):
             * (vs.rho[:, :, :-1, vs.tau] + vs.rho[:, :, 1:, vs.tau])
             * vs.dzw[npx.newaxis, npx.newaxis, :-1]
             / vs.dzt[npx.newaxis, npx.newaxis, :-1],
+            inplace=True,
         )
         diss = update_add(
             diss,
@@ -187,6 +241,7 @@ def advect_temp_salt_enthalpy(state):
             * (vs.rho[:, :, 1:, vs.tau] + vs.rho[:, :, :-1, vs.tau])
             * vs.dzw[npx.newaxis, npx.newaxis, :-1]
             / vs.dzt[npx.newaxis, npx.newaxis, 1:],
+            inplace=True,
         )
 
     if settings.enable_conserve_energy and settings.enable_tke:
@@ -217,8 +272,8 @@ def advect_temp_salt_enthalpy(state):
         fxa = global_sum(fxa)
         fxb = global_sum(fxb)
 
-        vs.P_diss_adv = update(vs.P_diss_adv, at[2:-2, 2:-2, :-1], fxa / fxb * tke_mask)
-        vs.P_diss_adv = update(vs.P_diss_adv, at[2:-2, 2:-2, -1], fxa / fxb)
+        vs.P_diss_adv = update(vs.P_diss_adv, at[2:-2, 2:-2, :-1], fxa / fxb * tke_mask, inplace=True)
+        vs.P_diss_adv = update(vs.P_diss_adv, at[2:-2, 2:-2, -1], fxa / fxb, inplace=True)
 
     """
     Adam Bashforth time stepping for advection
@@ -230,6 +285,7 @@ def advect_temp_salt_enthalpy(state):
         + settings.dt_tracer
         * ((1.5 + settings.AB_eps) * vs.dtemp[:, :, :, vs.tau] - (0.5 + settings.AB_eps) * vs.dtemp[:, :, :, vs.taum1])
         * vs.maskT,
+        inplace=True,
     )
     vs.salt = update(
         vs.salt,
@@ -238,6 +294,7 @@ def advect_temp_salt_enthalpy(state):
         + settings.dt_tracer
         * ((1.5 + settings.AB_eps) * vs.dsalt[:, :, :, vs.tau] - (0.5 + settings.AB_eps) * vs.dsalt[:, :, :, vs.taum1])
         * vs.maskT,
+        inplace=True,
     )
 
     return KernelOutput(
@@ -253,50 +310,76 @@ def vertmix_tempsalt(state):
     vs = state.variables
     settings = state.settings
 
-    vs.dtemp_vmix = update(vs.dtemp_vmix, at[...], vs.temp[:, :, :, vs.taup1])
-    vs.dsalt_vmix = update(vs.dsalt_vmix, at[...], vs.salt[:, :, :, vs.taup1])
-
-    a_tri = allocate(state.dimensions, ("xt", "yt", "zt"))[2:-2, 2:-2]
-    b_tri = allocate(state.dimensions, ("xt", "yt", "zt"))[2:-2, 2:-2]
-    c_tri = allocate(state.dimensions, ("xt", "yt", "zt"))[2:-2, 2:-2]
-    d_tri = allocate(state.dimensions, ("xt", "yt", "zt"))[2:-2, 2:-2]
-    delta = allocate(state.dimensions, ("xt", "yt", "zt"))[2:-2, 2:-2]
+    vs.dtemp_vmix = update(vs.dtemp_vmix, at[...], vs.temp[:, :, :, vs.taup1], inplace=True)
+    vs.dsalt_vmix = update(vs.dsalt_vmix, at[...], vs.salt[:, :, :, vs.taup1], inplace=True)
 
     _, water_mask, edge_mask = utilities.create_water_masks(vs.kbot[2:-2, 2:-2], settings.nz)
 
-    delta = update(
-        delta, at[:, :, :-1], settings.dt_tracer / vs.dzw[npx.newaxis, npx.newaxis, :-1] * vs.kappaH[2:-2, 2:-2, :-1]
-    )
-    delta = update(delta, at[:, :, -1], 0.0)
-    a_tri = update(a_tri, at[:, :, 1:], -delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:])
-    b_tri = update(b_tri, at[:, :, 1:], 1 + (delta[:, :, 1:] + delta[:, :, :-1]) / vs.dzt[npx.newaxis, npx.newaxis, 1:])
-    b_tri_edge = 1 + delta / vs.dzt[npx.newaxis, npx.newaxis, :]
-    c_tri = update(c_tri, at[:, :, :-1], -delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, :-1])
-    d_tri = vs.temp[2:-2, 2:-2, :, vs.taup1]
-    d_tri = update_add(d_tri, at[:, :, -1], settings.dt_tracer * vs.forc_temp_surface[2:-2, 2:-2] / vs.dzt[-1])
-
-    sol = utilities.solve_implicit(a_tri, b_tri, c_tri, d_tri, water_mask, b_edge=b_tri_edge, edge_mask=edge_mask)
-    vs.temp = update(vs.temp, at[2:-2, 2:-2, :, vs.taup1], npx.where(water_mask, sol, vs.temp[2:-2, 2:-2, :, vs.taup1]))
+    def mix_columns(kappaH, temp, salt, forc_temp_surface, forc_salt_surface, water_mask, edge_mask):
+        a_tri, b_tri, c_tri, delta = (npx.zeros_like(kappaH) for _ in range(4))
 
-    d_tri = vs.salt[2:-2, 2:-2, :, vs.taup1]
-    d_tri = update_add(d_tri, at[:, :, -1], settings.dt_tracer * vs.forc_salt_surface[2:-2, 2:-2] / vs.dzt[-1])
+        delta = update(
+            delta, at[:, :, :-1], settings.dt_tracer / vs.dzw[npx.newaxis, npx.newaxis, :-1] * kappaH[:, :, :-1]
+        )
+        delta = update(delta, at[:, :, -1], 0.0, inplace=True)
+        a_tri = update(a_tri, at[:, :, 1:], -delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, 1:])
+        b_tri = update(
+            b_tri, at[:, :, 1:], 1 + (delta[:, :, 1:] + delta[:, :, :-1]) / vs.dzt[npx.newaxis, npx.newaxis, 1:]
+        )
+        b_tri_edge = 1 + delta / vs.dzt[npx.newaxis, npx.newaxis, :]
+        c_tri = update(c_tri, at[:, :, :-1], -delta[:, :, :-1] / vs.dzt[npx.newaxis, npx.newaxis, :-1])
 
-    sol = utilities.solve_implicit(a_tri, b_tri, c_tri, d_tri, water_mask, b_edge=b_tri_edge, edge_mask=edge_mask)
-    vs.salt = update(vs.salt, at[2:-2, 2:-2, :, vs.taup1], npx.where(water_mask, sol, vs.salt[2:-2, 2:-2, :, vs.taup1]))
+        d_tri = update_add(temp, at[:, :, -1], settings.dt_tracer * forc_temp_surface / vs.dzt[-1])
+        new_temp = utilities.solve_implicit(
+            a_tri, b_tri, c_tri, d_tri, water_mask, b_edge=b_tri_edge, edge_mask=edge_mask
+        )
 
-    vs.dtemp_vmix = (vs.temp[:, :, :, vs.taup1] - vs.dtemp_vmix) / settings.dt_tracer
-    vs.dsalt_vmix = (vs.salt[:, :, :, vs.taup1] - vs.dsalt_vmix) / settings.dt_tracer
+        d_tri = update_add(salt, at[:, :, -1], settings.dt_tracer * forc_salt_surface / vs.dzt[-1])
+        new_salt = utilities.solve_implicit(
+            a_tri, b_tri, c_tri, d_tri, water_mask, b_edge=b_tri_edge, edge_mask=edge_mask
+        )
 
-    """
-    boundary exchange
-    """
+        return new_temp, new_salt
+
+    # only columns that contain water are mixed if wet-column compaction is enabled
+    sol_temp, sol_salt = utilities.map_wet_columns(
+        mix_columns,
+        utilities.get_wet_columns(state, interior=True),
+        vs.kappaH[2:-2, 2:-2],
+        vs.temp[2:-2, 2:-2, :, vs.taup1],
+        vs.salt[2:-2, 2:-2, :, vs.taup1],
+        vs.forc_temp_surface[2:-2, 2:-2],
+        vs.forc_salt_surface[2:-2, 2:-2],
+        water_mask,
+        edge_mask,
+    )
     vs.temp = update(
-        vs.temp, at[..., vs.taup1], utilities.enforce_boundaries(vs.temp[..., vs.taup1], settings.enable_cyclic_x)
+        vs.temp,
+        at[2:-2, 2:-2, :, vs.taup1],
+        npx.where(water_mask, sol_temp, vs.temp[2:-2, 2:-2, :, vs.taup1]),
+        inplace=True,
     )
     vs.salt = update(
-        vs.salt, at[..., vs.taup1], utilities.enforce_boundaries(vs.salt[..., vs.taup1], settings.enable_cyclic_x)
+        vs.salt,
+        at[2:-2, 2:-2, :, vs.taup1],
+        npx.where(water_mask, sol_salt, vs.salt[2:-2, 2:-2, :, vs.taup1]),
+        inplace=True,
     )
 
+    """
+    boundary exchange (overlaps with the vertical mixing diagnostics, which do not change)
+    """
+    exchange = utilities.start_enforce_boundaries(
+        (vs.temp[..., vs.taup1], vs.salt[..., vs.taup1]), settings.enable_cyclic_x
+    )
+
+    vs.dtemp_vmix = (vs.temp[:, :, :, vs.taup1] - vs.dtemp_vmix) / settings.dt_tracer
+    vs.dsalt_vmix = (vs.salt[:, :, :, vs.taup1] - vs.dsalt_vmix) / settings.dt_tracer
+
+    temp_exchanged, salt_exchanged = exchange.wait()
+    vs.temp = update(vs.temp, at[..., vs.taup1], temp_exchanged, inplace=True)
+    vs.salt = update(vs.salt, at[..., vs.taup1], salt_exchanged, inplace=True)
+
     return KernelOutput(dtemp_vmix=vs.dtemp_vmix, temp=vs.temp, dsalt_vmix=vs.dsalt_vmix, salt=vs.salt)
 
 
@@ -322,7 +405,7 @@ def diag_P_diss_v(state):
     vs = state.variables
     settings = state.settings
 
-    vs.P_diss_v = update(vs.P_diss_v, at[...], 0.0)
+    vs.P_diss_v = update(vs.P_diss_v, at[...], 0.0, inplace=True)
     aloc = allocate(state.dimensions, ("xt", "yt", "zt"))
 
     if settings.enable_conserve_energy:
@@ -342,6 +425,7 @@ def diag_P_diss_v(state):
             * (vs.temp[2:-2, 2:-2, 1:, vs.taup1] - vs.temp[2:-2, 2:-2, :-1, vs.taup1])
             / vs.dzw[npx.newaxis, npx.newaxis, :-1]
             * vs.maskW[2:-2, 2:-2, :-1],
+            inplace=True,
         )
         fxa = (-vs.int_drhodS[2:-2, 2:-2, 1:, vs.taup1] + vs.int_drhodS[2:-2, 2:-2, :-1, vs.taup1]) / vs.dzw[
             npx.newaxis, npx.newaxis, :-1
@@ -356,6 +440,7 @@ def diag_P_diss_v(state):
             * (vs.salt[2:-2, 2:-2, 1:, vs.taup1] - vs.salt[2:-2, 2:-2, :-1, vs.taup1])
             / vs.dzw[npx.newaxis, npx.newaxis, :-1]
             * vs.maskW[2:-2, 2:-2, :-1],
+            inplace=True,
         )
 
         fxa = 2 * vs.int_drhodT[2:-2, 2:-2, -1, vs.taup1] / vs.dzw[-1]
@@ -363,21 +448,25 @@ def diag_P_diss_v(state):
             vs.P_diss_v,
             at[2:-2, 2:-2, -1],
             -settings.grav / settings.rho_0 * fxa * vs.forc_temp_surface[2:-2, 2:-2] * vs.maskW[2:-2, 2:-2, -1],
+            inplace=True,
         )
         fxa = 2 * vs.int_drhodS[2:-2, 2:-2, -1, vs.taup1] / vs.dzw[-1]
         vs.P_diss_v = update_add(
             vs.P_diss_v,
             at[2:-2, 2:-2, -1],
             -settings.grav / settings.rho_0 * fxa * vs.forc_salt_surface[2:-2, 2:-2] * vs.maskW[2:-2, 2:-2, -1],
+            inplace=True,
         )
 
     if settings.enable_conserve_energy:
         """
         determine effect due to nonlinear equation of state
         """
-        aloc = update(aloc, at[:, :, :-1], vs.kappaH[:, :, :-1] * vs.Nsqr[:, :, :-1, vs.taup1])
-        vs.P_diss_nonlin = update(vs.P_diss_nonlin, at[:, :, :-1], vs.P_diss_v[:, :, :-1] - aloc[:, :, :-1])
-        vs.P_diss_v = update(vs.P_diss_v, at[:, :, :-1], aloc[:, :, :-1])
+        aloc = update(aloc, at[:, :, :-1], vs.kappaH[:, :, :-1] * vs.Nsqr[:, :, :-1, vs.taup1], inplace=True)
+        vs.P_diss_nonlin = update(
+            vs.P_diss_nonlin, at[:, :, :-1], vs.P_diss_v[:, :, :-1] - aloc[:, :, :-1], inplace=True
+        )
+        vs.P_diss_v = update(vs.P_diss_v, at[:, :, :-1], aloc[:, :, :-1], inplace=True)
     else:
         """
         diagnose N^2 vs. kappaH, i.e. exchange of pot. energy with TKE
@@ -423,16 +512,16 @@ def thermodynamics(state):
         isopycnal diffusion
         """
         if settings.enable_neutral_diffusion:
-            vs.P_diss_iso = update(vs.P_diss_iso, at[...], 0.0)
-            vs.dtemp_iso = update(vs.dtemp_iso, at[...], 0.0)
-            vs.dsalt_iso = update(vs.dsalt_iso, at[...], 0.0)
+            vs.P_diss_iso = update(vs.P_diss_iso, at[...], 0.0, inplace=True)
+            vs.dtemp_iso = update(vs.dtemp_iso, at[...], 0.0, inplace=True)
+            vs.dsalt_iso = update(vs.dsalt_iso, at[...], 0.0, inplace=True)
 
             vs.update(isoneutral.isoneutral_diffusion_pre(state))
             vs.update(isoneutral.isoneutral_diffusion(state, tr=vs.temp, istemp=True))
             vs.update(isoneutral.isoneutral_diffusion(state, tr=vs.salt, istemp=False))
 
             if settings.enable_skew_diffusion:
-                vs.P_diss_skew = update(vs.P_diss_skew, at[...], 0.0)
+                vs.P_diss_skew = update(vs.P_diss_skew, at[...], 0.0, inplace=True)
                 vs.update(isoneutral.isoneutral_skew_diffusion(state, tr=vs.temp, istemp=True))
                 vs.update(isoneutral.isoneutral_skew_diffusion(state, tr=vs.salt, istemp=False))
 
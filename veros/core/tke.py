@@ -56,7 +56,9 @@ def set_tke_diffusivities_kernel(state):
             return update(mxl, at[:, :, k], npx.minimum(mxl[:, :, k], mxl[:, :, k + 1] + vs.dzt[k + 1]))
 
         vs.mxl = for_loop(1, nz, backwards_pass, vs.mxl)
-        vs.mxl = update(vs.mxl, at[:, :, -1], npx.minimum(vs.mxl[:, :, -1], settings.mxl_min + vs.dzt[-1]))
+        vs.mxl = update(
+            vs.mxl, at[:, :, -1], npx.minimum(vs.mxl[:, :, -1], settings.mxl_min + vs.dzt[-1]), inplace=True
+        )
 
         def forwards_pass(k, mxl):
             return update(mxl, at[:, :, k], npx.minimum(mxl[:, :, k], mxl[:, :, k - 1] + vs.dzt[k]))
@@ -70,9 +72,14 @@ def set_tke_diffusivities_kernel(state):
     calculate viscosity and diffusivity based on Prandtl number
     """
     vs.K_diss_v = utilities.enforce_boundaries(vs.K_diss_v, settings.enable_cyclic_x)
-    vs.kappaM = update(vs.kappaM, at[...], npx.minimum(settings.kappaM_max, settings.c_k * vs.mxl * vs.sqrttke))
+    vs.kappaM = update(
+        vs.kappaM, at[...], npx.minimum(settings.kappaM_max, settings.c_k * vs.mxl * vs.sqrttke), inplace=True
+    )
     Rinumber = update(
-        Rinumber, at[...], vs.Nsqr[:, :, :, vs.tau] / npx.maximum(vs.K_diss_v / npx.maximum(1e-12, vs.kappaM), 1e-12)
+        Rinumber,
+        at[...],
+        vs.Nsqr[:, :, :, vs.tau] / npx.maximum(vs.K_diss_v / npx.maximum(1e-12, vs.kappaM), 1e-12),
+        inplace=True,
     )
     if settings.enable_idemix:
         Rinumber = update(
@@ -120,7 +127,7 @@ def integrate_tke(state):
     vs.update(tke_out)
 
 
-@veros_kernel
+@veros_kernel(donate_outputs=True)
 def integrate_tke_kernel(state):
     """
     integrate Tke equation on W grid with surface flux boundary condition
@@ -128,6 +135,9 @@ def integrate_tke_kernel(state):
     vs = state.variables
     settings = state.settings
 
+    inv_dx_w = utilities.grid_metric(state, "inv_dx_w")
+    inv_dy_w = utilities.grid_metric(state, "inv_dy_w")
+
     conditional_outputs = {}
 
     flux_east = allocate(state.dimensions, ("xt", "yt", "zt"))
@@ -182,51 +192,63 @@ def integrate_tke_kernel(state):
     """
     _, water_mask, edge_mask = utilities.create_water_masks(vs.kbot[2:-2, 2:-2], settings.nz)
 
-    a_tri, b_tri, c_tri, d_tri, delta = (
-        allocate(state.dimensions, ("xt", "yt", "zt"))[2:-2, 2:-2, :] for _ in range(5)
-    )
+    def integrate_columns(kappaM, sqrttke, mxl, tke, forc, forc_tke_surface, water_mask, edge_mask):
+        a_tri, b_tri, c_tri, delta = (npx.zeros_like(kappaM) for _ in range(4))
 
-    delta = update(
-        delta,
-        at[:, :, :-1],
-        dt_tke
-        / vs.dzt[npx.newaxis, npx.newaxis, 1:]
-        * settings.alpha_tke
-        * 0.5
-        * (vs.kappaM[2:-2, 2:-2, :-1] + vs.kappaM[2:-2, 2:-2, 1:]),
-    )
+        delta = update(
+            delta,
+            at[:, :, :-1],
+            dt_tke
+            / vs.dzt[npx.newaxis, npx.newaxis, 1:]
+            * settings.alpha_tke
+            * 0.5
+            * (kappaM[:, :, :-1] + kappaM[:, :, 1:]),
+            inplace=True,
+        )
 
-    a_tri = update(a_tri, at[:, :, 1:-1], -delta[:, :, :-2] / vs.dzw[npx.newaxis, npx.newaxis, 1:-1])
-    a_tri = update(a_tri, at[:, :, -1], -delta[:, :, -2] / (0.5 * vs.dzw[-1]))
+        a_tri = update(a_tri, at[:, :, 1:-1], -delta[:, :, :-2] / vs.dzw[npx.newaxis, npx.newaxis, 1:-1], inplace=True)
+        a_tri = update(a_tri, at[:, :, -1], -delta[:, :, -2] / (0.5 * vs.dzw[-1]), inplace=True)
 
-    b_tri = update(
-        b_tri,
-        at[:, :, 1:-1],
-        1
-        + (delta[:, :, 1:-1] + delta[:, :, :-2]) / vs.dzw[npx.newaxis, npx.newaxis, 1:-1]
-        + dt_tke * settings.c_eps * vs.sqrttke[2:-2, 2:-2, 1:-1] / vs.mxl[2:-2, 2:-2, 1:-1],
-    )
-    b_tri = update(
-        b_tri,
-        at[:, :, -1],
-        1
-        + delta[:, :, -2] / (0.5 * vs.dzw[-1])
-        + dt_tke * settings.c_eps / vs.mxl[2:-2, 2:-2, -1] * vs.sqrttke[2:-2, 2:-2, -1],
+        b_tri = update(
+            b_tri,
+            at[:, :, 1:-1],
+            1
+            + (delta[:, :, 1:-1] + delta[:, :, :-2]) / vs.dzw[npx.newaxis, npx.newaxis, 1:-1]
+            + dt_tke * settings.c_eps * sqrttke[:, :, 1:-1] / mxl[:, :, 1:-1],
+            inplace=True,
+        )
+        b_tri = update(
+            b_tri,
+            at[:, :, -1],
+            1 + delta[:, :, -2] / (0.5 * vs.dzw[-1]) + dt_tke * settings.c_eps / mxl[:, :, -1] * sqrttke[:, :, -1],
+            inplace=True,
+        )
+        b_tri_edge = 1 + delta / vs.dzw[npx.newaxis, npx.newaxis, :] + dt_tke * settings.c_eps / mxl * sqrttke
+
+        c_tri = update(c_tri, at[:, :, :-1], -delta[:, :, :-1] / vs.dzw[npx.newaxis, npx.newaxis, :-1], inplace=True)
+
+        d_tri = tke + dt_tke * forc
+        d_tri = update_add(d_tri, at[:, :, -1], dt_tke * forc_tke_surface / (0.5 * vs.dzw[-1]), inplace=True)
+
+        return utilities.solve_implicit(a_tri, b_tri, c_tri, d_tri, water_mask, b_edge=b_tri_edge, edge_mask=edge_mask)
+
+    # only columns that contain water are integrated if wet-column compaction is enabled
+    sol = utilities.map_wet_columns(
+        integrate_columns,
+        utilities.get_wet_columns(state, interior=True),
+        vs.kappaM[2:-2, 2:-2],
+        vs.sqrttke[2:-2, 2:-2],
+        vs.mxl[2:-2, 2:-2],
+        vs.tke[2:-2, 2:-2, :, vs.tau],
+        forc[2:-2, 2:-2],
+        vs.forc_tke_surface[2:-2, 2:-2],
+        water_mask,
+        edge_mask,
     )
-    b_tri_edge = (
-        1
-        + delta / vs.dzw[npx.newaxis, npx.newaxis, :]
-        + dt_tke * settings.c_eps / vs.mxl[2:-2, 2:-2, :] * vs.sqrttke[2:-2, 2:-2, :]
+    vs.tke = update(
+        vs.tke, at[2:-2, 2:-2, :, vs.taup1], npx.where(water_mask, sol, vs.tke[2:-2, 2:-2, :, vs.taup1]), inplace=True
     )
 
-    c_tri = update(c_tri, at[:, :, :-1], -delta[:, :, :-1] / vs.dzw[npx.newaxis, npx.newaxis, :-1])
-
-    d_tri = update(d_tri, at[...], vs.tke[2:-2, 2:-2, :, vs.tau] + dt_tke * forc[2:-2, 2:-2, :])
-    d_tri = update_add(d_tri, at[:, :, -1], dt_tke * vs.forc_tke_surface[2:-2, 2:-2] / (0.5 * vs.dzw[-1]))
-
-    sol = utilities.solve_implicit(a_tri, b_tri, c_tri, d_tri, water_mask, b_edge=b_tri_edge, edge_mask=edge_mask)
-    vs.tke = update(vs.tke, at[2:-2, 2:-2, :, vs.taup1], npx.where(water_mask, sol, vs.tke[2:-2, 2:-2, :, vs.taup1]))
-
     """
     store tke dissipation for diagnostics
     """
@@ -240,8 +262,11 @@ def integrate_tke_kernel(state):
         vs.tke_surf_corr,
         at[2:-2, 2:-2],
         npx.where(mask, -vs.tke[2:-2, 2:-2, -1, vs.taup1] * 0.5 * vs.dzw[-1] / dt_tke, 0.0),
+        inplace=True,
+    )
+    vs.tke = update(
+        vs.tke, at[2:-2, 2:-2, -1, vs.taup1], npx.maximum(0.0, vs.tke[2:-2, 2:-2, -1, vs.taup1]), inplace=True
     )
-    vs.tke = update(vs.tke, at[2:-2, 2:-2, -1, vs.taup1], npx.maximum(0.0, vs.tke[2:-2, 2:-2, -1, vs.taup1]))
 
     if settings.enable_tke_hor_diffusion:
         """
@@ -271,12 +296,9 @@ def integrate_tke_kernel(state):
             vs.tke,
             at[2:-2, 2:-2, :, vs.taup1],
             dt_tke
-            * vs.maskW[2:-2, 2:-2, :]
             * (
-                (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
-                + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dyt[npx.newaxis, 2:-2, npx.newaxis])
+                (flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :]) * inv_dx_w[2:-2, 2:-2, :]
+                + (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :]) * inv_dy_w[2:-2, 2:-2, :]
             ),
         )
 
@@ -293,13 +315,8 @@ def integrate_tke_kernel(state):
         vs.dtke = update(
             vs.dtke,
             at[2:-2, 2:-2, :, vs.tau],
-            vs.maskW[2:-2, 2:-2, :]
-            * (
-                -(flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
-                - (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :])
-                / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dyt[npx.newaxis, 2:-2, npx.newaxis])
-            ),
+            -(flux_east[2:-2, 2:-2, :] - flux_east[1:-3, 2:-2, :]) * inv_dx_w[2:-2, 2:-2, :]
+            - (flux_north[2:-2, 2:-2, :] - flux_north[2:-2, 1:-3, :]) * inv_dy_w[2:-2, 2:-2, :],
         )
         vs.dtke = update_add(vs.dtke, at[:, :, 0, vs.tau], -flux_top[:, :, 0] / vs.dzw[0])
         vs.dtke = update_add(
@@ -1,6 +1,7 @@
 from veros.core.operators import numpy as npx
 
 from veros import veros_kernel
+from veros.variables import GRID_METRICS
 from veros.core.operators import update, at, solve_tridiagonal
 
 
@@ -21,6 +22,35 @@ def enforce_boundaries(arr, enable_cyclic_x, local=False):
     return arr
 
 
+def start_enforce_boundaries(arrs, enable_cyclic_x, inplace=False):
+    """Starts enforcing the boundaries of several arrays at once.
+
+    Returns an object whose ``wait()`` method returns the updated arrays. Between the two calls,
+    communication may overlap with computations that do not require the overlap.
+
+    Only the exchange along x is overlapped with those computations. The exchange along y
+    (which also fills the corners) has to send the overlap received along x, so it is started and
+    completed inside ``wait()``. With JAX, the whole exchange happens in ``wait()``.
+
+    Pass ``inplace=True`` if the given arrays are not used afterwards, so the overlap may be
+    written into them instead of copies.
+    """
+    from veros import runtime_state as rst
+    from veros.routines import CURRENT_CONTEXT
+    from veros.distributed import start_exchange_overlap
+
+    if rst.proc_num == 1 or not CURRENT_CONTEXT.is_dist_safe:
+        arrs = [enforce_boundaries(arr, enable_cyclic_x) for arr in arrs]
+
+    return start_exchange_overlap(arrs, ["xt", "yt"], cyclic=enable_cyclic_x, inplace=inplace)
+
+
+@veros_kernel(static_args=("enable_cyclic_x", "inplace"))
+def enforce_boundaries_many(arrs, enable_cyclic_x, inplace=False):
+    """Enforces the boundaries of several arrays, with one message per neighbor for all arrays"""
+    return start_enforce_boundaries(arrs, enable_cyclic_x, inplace=inplace).wait()
+
+
 @veros_kernel
 def pad_z_edges(array):
     """
@@ -49,11 +79,109 @@ def create_water_masks(ks, nz):
 
 
 @veros_kernel
-def solve_implicit(a, b, c, d, water_mask, edge_mask, b_edge=None, d_edge=None):
+def solve_implicit(a, b, c, d, water_mask, edge_mask, b_edge=None, d_edge=None, wet_columns=None):
+    """Solves the tridiagonal systems of all columns.
+
+    If ``wet_columns`` is given (see :func:`get_wet_columns`), only these columns are solved and the
+    solution is zero elsewhere.
+    """
     if b_edge is not None:
         b = npx.where(edge_mask, b_edge, b)
 
     if d_edge is not None:
         d = npx.where(edge_mask, d_edge, d)
 
-    return solve_tridiagonal(a, b, c, d, water_mask, edge_mask)
+    return map_wet_columns(solve_tridiagonal, wet_columns, a, b, c, d, water_mask, edge_mask)
+
+
+def get_wet_columns(state, interior=False):
+    """Returns the flat horizontal indices of all columns that contain water (as found by ``calc_topo``),
+    or None if column-local kernels operate on all columns.
+
+    With ``interior=True``, the indices refer to the horizontal grid without overlap (``[2:-2, 2:-2]``).
+    """
+    if not state.var_meta["wet_columns"].active:
+        return None
+
+    if interior:
+        return state.variables.wet_columns_interior
+
+    return state.variables.wet_columns
+
+
+def compact_columns(arr, columns):
+    """Gathers the given columns of an array into a dense array of shape (ncolumns, 1, ...).
+
+    The singleton axis keeps the number of dimensions, so code written for the horizontal grid
+    works on compacted arrays as well.
+    """
+    return npx.take(arr.reshape(-1, *arr.shape[2:]), columns, axis=0)[:, npx.newaxis]
+
+
+def expand_columns(compact_arr, columns, shape, out=None):
+    """Scatters densely stored columns back to an array of the given horizontal shape.
+
+    Other columns are taken from ``out``, or are zero if it is not given.
+    """
+    if out is None:
+        res = npx.zeros((*shape, *compact_arr.shape[2:]), dtype=compact_arr.dtype)
+    else:
+        res = npx.array(out, dtype=compact_arr.dtype)
+
+    res.reshape(-1, *compact_arr.shape[2:])[columns] = compact_arr[:, 0]
+    return res
+
+
+def map_wet_columns(func, columns, *arrs, out=None):
+    """Evaluates a column-local function only on the given columns of arrays on the horizontal grid.
+
+    The function may return a single array or a tuple of arrays (or None). Other columns of the result
+    are taken from ``out`` (a matching array or tuple), and are zero where it is not given. Results
+    without horizontal dimensions are returned as they are.
+    If ``columns`` is None, the function is evaluated on the full arrays.
+    """
+    if columns is None:
+        return func(*arrs)
+
+    shape = arrs[0].shape[:2]
+    res = func(*(compact_columns(arr, columns) for arr in arrs))
+
+    def expand(arr, out):
+        if arr is None or arr.ndim < 2:
+            # not horizontally resolved, broadcasts like the result on all columns would
+            return arr
+        return expand_columns(arr, columns, shape, out=out)
+
+    if isinstance(res, tuple):
+        if out is None:
+            out = (None,) * len(res)
+        return tuple(expand(arr, arr_out) for arr, arr_out in zip(res, out))
+
+    return expand(res, out)
+
+
+def _masked_inverse_spacing(mask, cos, spacing, axis):
+    if axis == 0:
+        metric = cos[npx.newaxis, :, npx.newaxis] * spacing[:, npx.newaxis, npx.newaxis]
+    else:
+        metric = cos[npx.newaxis, :, npx.newaxis] * spacing[npx.newaxis, :, npx.newaxis]
+    return mask / metric
+
+
+def _grid_metric_definition(mask, cos, spacing, axis):
+    return lambda vs: _masked_inverse_spacing(getattr(vs, mask), getattr(vs, cos), getattr(vs, spacing), axis)
+
+
+GRID_METRIC_DEFINITIONS = {name: _grid_metric_definition(*spec) for name, spec in GRID_METRICS.items()}
+
+
+def grid_metric(state, name):
+    """Returns a time-invariant stencil coefficient like ``maskT / (cost * dxt)``.
+
+    Metrics are cached as variables if they fit into the ``grid_metric_max_memory`` runtime setting,
+    and computed on the fly otherwise.
+    """
+    if state.var_meta[name].active:
+        return getattr(state.variables, name)
+
+    return GRID_METRIC_DEFINITIONS[name](state.variables)
@@ -0,0 +1,233 @@
+"""Load-balanced domain decompositions.
+
+By default, every process owns a subdomain of the same size. Since land cells cost (almost) no
+work, processes owning mostly land wait for those owning open ocean. A planned decomposition keeps
+the rectilinear process grid, but moves the boundaries between subdomains such that all processes
+own a similar number of wet cells.
+
+Plans are created from the topography of a setup (e.g. through ``veros plan-decomposition``) and
+used in runs through the ``decomposition_file`` runtime setting.
+"""
+
+import os
+import json
+import functools
+from collections import namedtuple
+
+import numpy as onp
+
+from veros import logger, veros_routine, runtime_state as rst
+
+#: Minimum size of a subdomain along each axis (the overlap to neighboring processes is 2 cells wide)
+MIN_BLOCK_SIZE = 2
+
+
+class Decomposition(namedtuple("Decomposition", ("nx", "ny", "num_proc", "x_bounds", "y_bounds"))):
+    """Rectilinear domain decomposition with given subdomain boundaries along each axis.
+
+    Process ``(px, py)`` owns the cells ``x_bounds[px]:x_bounds[px + 1]`` and
+    ``y_bounds[py]:y_bounds[py + 1]`` (excluding ghost cells).
+    """
+
+    __slots__ = ()
+
+    @property
+    def bounds(self):
+        return (self.x_bounds, self.y_bounds)
+
+    def validate(self, nx, ny, num_proc):
+        if (self.nx, self.ny) != (nx, ny):
+            raise ValueError(f"decomposition was planned for a domain of {self.nx}x{self.ny} cells, got {nx}x{ny}")
+
+        if tuple(self.num_proc) != tuple(num_proc):
+            raise ValueError(
+                f"decomposition was planned for {self.num_proc[0]}x{self.num_proc[1]} processes, "
+                f"got {num_proc[0]}x{num_proc[1]}"
+            )
+
+        for axis, (n, bounds) in enumerate(zip((nx, ny), self.bounds)):
+            if len(bounds) != num_proc[axis] + 1 or bounds[0] != 0 or bounds[-1] != n:
+                raise ValueError(f"invalid subdomain boundaries along axis {axis}: {bounds}")
+
+            if any(upper - lower < MIN_BLOCK_SIZE for lower, upper in zip(bounds[:-1], bounds[1:])):
+                raise ValueError(f"subdomains must be at least {MIN_BLOCK_SIZE} cells wide along axis {axis}")
+
+
+def get_uniform_decomposition(nx, ny, num_proc):
+    x_bounds, y_bounds = (tuple(n * i // p for i in range(p + 1)) for n, p in zip((nx, ny), num_proc))
+    return Decomposition(nx, ny, tuple(num_proc), x_bounds, y_bounds)
+
+
+def get_wet_cell_counts(kbot, nz):
+    """Number of wet cells in every water column"""
+    kbot = onp.asarray(kbot)
+    return onp.where(kbot > 0, nz - kbot + 1, 0).astype("int64")
+
+
+def get_block_loads(weights, decomposition):
+    """Sum of weights in every subdomain, shape (num_proc[0], num_proc[1])"""
+    x_bounds, y_bounds = decomposition.bounds
+    cumulative = onp.zeros((weights.shape[0] + 1, weights.shape[1] + 1), dtype=weights.dtype)
+    cumulative[1:, 1:] = weights.cumsum(axis=0).cumsum(axis=1)
+    corners = cumulative[onp.ix_(x_bounds, y_bounds)]
+    return corners[1:, 1:] - corners[:-1, 1:] - corners[1:, :-1] + corners[:-1, :-1]
+
+
+def get_imbalance(loads):
+    """Ratio of the largest to the mean subdomain load (1 is perfectly balanced)"""
+    mean_load = loads.mean()
+    if mean_load == 0:
+        return 1.0
+
+    return float(loads.max() / mean_load)
+
+
+def _partition_strips(strip_weights, num_strips, max_load):
+    """Splits the first axis into num_strips strips such that no strip exceeds max_load along any
+    column of strip_weights (greedily, so every strip is as wide as possible). Returns None if impossible."""
+    n = strip_weights.shape[0]
+    cumulative = onp.zeros((n + 1, strip_weights.shape[1]), dtype=strip_weights.dtype)
+    cumulative[1:] = strip_weights.cumsum(axis=0)
+
+    bounds = [0]
+    for strip in range(num_strips - 1):
+        lower = bounds[-1]
+        # leave enough space for the remaining strips
+        upper_limit = n - MIN_BLOCK_SIZE * (num_strips - strip - 1)
+        upper = min(
+            int(onp.searchsorted(cumulative[:, col], cumulative[lower, col] + max_load, side="right")) - 1
+            for col in range(cumulative.shape[1])
+        )
+        upper = min(upper, upper_limit)
+
+        if upper - lower < MIN_BLOCK_SIZE:
+            return None
+
+        bounds.append(upper)
+
+    if onp.any(cumulative[n] - cumulative[bounds[-1]] > max_load):
+        return None
+
+    bounds.append(n)
+    return tuple(bounds)
+
+
+def _balance_axis(weights, num_strips, other_bounds):
+    """Optimal boundaries along the first axis of weights for fixed boundaries along the second axis"""
+    # weights of every slice along the first axis in each block along the second axis
+    strip_weights = onp.add.reduceat(weights, other_bounds[:-1], axis=1)
+
+    lower_load, upper_load = 0, int(strip_weights.sum())
+    best_bounds = _partition_strips(strip_weights, num_strips, upper_load)
+
+    # bisect for the smallest maximum load that still admits a partition
+    while lower_load < upper_load:
+        max_load = (lower_load + upper_load) // 2
+        bounds = _partition_strips(strip_weights, num_strips, max_load)
+        if bounds is None:
+            lower_load = max_load + 1
+        else:
+            upper_load = max_load
+            best_bounds = bounds
+
+    return best_bounds
+
+
+def plan_decomposition(kbot, nz, num_proc, max_iterations=10):
+    """Computes subdomain boundaries that balance the number of wet cells between processes.
+
+    Boundaries along x and y are optimized alternately (each time minimizing the load of the most
+    loaded subdomain), starting from a uniform decomposition.
+
+    Arguments:
+        kbot: Index of the bottom cell of every water column (0 on land), without ghost cells
+        nz: Number of vertical levels
+        num_proc: Number of processes along x and y
+
+    Returns:
+        Planned :class:`Decomposition`.
+    """
+    weights = get_wet_cell_counts(kbot, nz)
+    nx, ny = weights.shape
+
+    for n, p in zip((nx, ny), num_proc):
+        if n < MIN_BLOCK_SIZE * p:
+            raise ValueError(f"cannot split {n} cells between {p} processes")
+
+    decomposition = get_uniform_decomposition(nx, ny, num_proc)
+    max_load = get_block_loads(weights, decomposition).max()
+
+    for _ in range(max_iterations):
+        x_bounds = _balance_axis(weights, num_proc[0], decomposition.y_bounds)
+        y_bounds = _balance_axis(weights.T, num_proc[1], x_bounds)
+        candidate = decomposition._replace(x_bounds=x_bounds, y_bounds=y_bounds)
+
+        candidate_max_load = get_block_loads(weights, candidate).max()
+        if candidate_max_load >= max_load:
+            break
+
+        decomposition, max_load = candidate, candidate_max_load
+
+    return decomposition
+
+
+def summarize_decomposition(kbot, nz, decomposition):
+    """Returns predicted load imbalance and number of subdomains without any wet cells"""
+    loads = get_block_loads(get_wet_cell_counts(kbot, nz), decomposition)
+    return dict(
+        imbalance=get_imbalance(loads),
+        land_blocks=int(onp.count_nonzero(loads == 0)),
+        wet_cells=loads.tolist(),
+    )
+
+
+def save_decomposition(path, decomposition, **extra_info):
+    with open(path, "w") as f:
+        json.dump(
+            dict(
+                nx=decomposition.nx,
+                ny=decomposition.ny,
+                num_proc=list(decomposition.num_proc),
+                x_bounds=[int(b) for b in decomposition.x_bounds],
+                y_bounds=[int(b) for b in decomposition.y_bounds],
+                **extra_info,
+            ),
+            f,
+            indent=4,
+        )
+
+
+@functools.lru_cache()
+def _load_decomposition(path, mtime):
+    with open(path) as f:
+        data = json.load(f)
+
+    return Decomposition(
+        nx=int(data["nx"]),
+        ny=int(data["ny"]),
+        num_proc=tuple(data["num_proc"]),
+        x_bounds=tuple(data["x_bounds"]),
+        y_bounds=tuple(data["y_bounds"]),
+    )
+
+
+def load_decomposition(path):
+    return _load_decomposition(path, os.path.getmtime(path))
+
+
+@veros_routine
+def log_load_balance(state):
+    """Logs the imbalance of wet cells between processes of the current run"""
+    from veros.core.operators import numpy as npx
+    from veros.distributed import global_max, global_sum
+
+    if rst.proc_num == 1:
+        return
+
+    vs = state.variables
+    local_load = npx.sum(npx.where(vs.kbot[2:-2, 2:-2] > 0, state.settings.nz - vs.kbot[2:-2, 2:-2] + 1, 0))
+    max_load = global_max(local_load)
+    mean_load = global_sum(local_load) / rst.proc_num
+
+    if mean_load > 0:
+        logger.info(f"Wet-cell load imbalance between processes (max / mean): {float(max_load / mean_load):.2f}")
@@ -1,7 +1,7 @@
 from veros import logger
 from veros.core.operators import numpy as npx
 from veros.diagnostics.base import VerosDiagnostic
-from veros.distributed import global_max
+from veros.distributed import batched_reductions
 
 
 class CFLMonitor(VerosDiagnostic):
@@ -27,61 +27,69 @@ class CFLMonitor(VerosDiagnostic):
         vs = state.variables
         settings = state.settings
 
-        cfl = global_max(
-            max(
-                npx.max(
-                    npx.abs(vs.u[2:-2, 2:-2, :, vs.tau])
-                    * vs.maskU[2:-2, 2:-2, :]
-                    / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
-                    * settings.dt_tracer
-                ),
-                npx.max(
-                    npx.abs(vs.v[2:-2, 2:-2, :, vs.tau])
-                    * vs.maskV[2:-2, 2:-2, :]
-                    / vs.dyt[npx.newaxis, 2:-2, npx.newaxis]
-                    * settings.dt_tracer
-                ),
-            )
-        )
-        wcfl = global_max(
-            npx.max(
-                npx.abs(vs.w[2:-2, 2:-2, :, vs.tau])
-                * vs.maskW[2:-2, 2:-2, :]
-                / vs.dzt[npx.newaxis, npx.newaxis, :]
-                * settings.dt_tracer
-            )
-        )
+        with_wgrid = settings.enable_eke or settings.enable_tke or settings.enable_idemix
 
-        if npx.isnan(cfl) or npx.isnan(wcfl):
-            raise RuntimeError(f"CFL number is NaN at iteration {vs.itt}")
-
-        logger.diagnostic(f" Maximal hor. CFL number = {cfl}")
-        logger.diagnostic(f" Maximal ver. CFL number = {wcfl}")
-
-        if settings.enable_eke or settings.enable_tke or settings.enable_idemix:
-            cfl = global_max(
-                max(
+        # all maxima are reduced together
+        with batched_reductions() as batch:
+            cfl = batch.max(
+                npx.maximum(
                     npx.max(
-                        npx.abs(vs.u_wgrid[2:-2, 2:-2, :])
+                        npx.abs(vs.u[2:-2, 2:-2, :, vs.tau])
                         * vs.maskU[2:-2, 2:-2, :]
                         / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
                         * settings.dt_tracer
                     ),
                     npx.max(
-                        npx.abs(vs.v_wgrid[2:-2, 2:-2, :])
+                        npx.abs(vs.v[2:-2, 2:-2, :, vs.tau])
                         * vs.maskV[2:-2, 2:-2, :]
                         / vs.dyt[npx.newaxis, 2:-2, npx.newaxis]
                         * settings.dt_tracer
                     ),
                 )
             )
-            wcfl = global_max(
+            wcfl = batch.max(
                 npx.max(
-                    npx.abs(vs.w_wgrid[2:-2, 2:-2, :])
+                    npx.abs(vs.w[2:-2, 2:-2, :, vs.tau])
                     * vs.maskW[2:-2, 2:-2, :]
                     / vs.dzt[npx.newaxis, npx.newaxis, :]
                     * settings.dt_tracer
                 )
             )
-            logger.diagnostic(f" Maximal hor. CFL number on w grid = {cfl}")
-            logger.diagnostic(f" Maximal ver. CFL number on w grid = {wcfl}")
+
+            if with_wgrid:
+                cfl_wgrid = batch.max(
+                    npx.maximum(
+                        npx.max(
+                            npx.abs(vs.u_wgrid[2:-2, 2:-2, :])
+                            * vs.maskU[2:-2, 2:-2, :]
+                            / (vs.cost[npx.newaxis, 2:-2, npx.newaxis] * vs.dxt[2:-2, npx.newaxis, npx.newaxis])
+                            * settings.dt_tracer
+                        ),
+                        npx.max(
+                            npx.abs(vs.v_wgrid[2:-2, 2:-2, :])
+                            * vs.maskV[2:-2, 2:-2, :]
+                            / vs.dyt[npx.newaxis, 2:-2, npx.newaxis]
+                            * settings.dt_tracer
+                        ),
+                    )
+                )
+                wcfl_wgrid = batch.max(
+                    npx.max(
+                        npx.abs(vs.w_wgrid[2:-2, 2:-2, :])
+                        * vs.maskW[2:-2, 2:-2, :]
+                        / vs.dzt[npx.newaxis, npx.newaxis, :]
+                        * settings.dt_tracer
+                    )
+                )
+
+        cfl, wcfl = cfl.value, wcfl.value
+
+        if npx.isnan(cfl) or npx.isnan(wcfl):
+            raise RuntimeError(f"CFL number is NaN at iteration {vs.itt}")
+
+        logger.diagnostic(f" Maximal hor. CFL number = {cfl}")
+        logger.diagnostic(f" Maximal ver. CFL number = {wcfl}")
+
+        if with_wgrid:
+            logger.diagnostic(f" Maximal hor. CFL number on w grid = {cfl_wgrid.value}")
+            logger.diagnostic(f" Maximal ver. CFL number on w grid = {wcfl_wgrid.value}")
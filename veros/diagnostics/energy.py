@@ -4,7 +4,7 @@ from veros import veros_kernel, KernelOutput, runtime_settings
 from veros.core.operators import numpy as npx, update_multiply, at
 from veros.diagnostics.base import VerosDiagnostic
 from veros.variables import Variable
-from veros.distributed import global_sum
+from veros.distributed import batched_reductions
 
 
 ENERGY_VARIABLES = dict(
@@ -162,51 +162,43 @@ def diagnose_kernel(state):
     # changes of dynamic enthalpy
     vol_t = vs.area_t[2:-2, 2:-2, npx.newaxis] * vs.dzt[npx.newaxis, npx.newaxis, :] * vs.maskT[2:-2, 2:-2, :]
 
-    dP_iso = global_sum(
-        npx.sum(
-            vol_t
-            * settings.grav
-            / settings.rho_0
-            * (
-                -vs.int_drhodT[2:-2, 2:-2, :, vs.tau] * vs.dtemp_iso[2:-2, 2:-2, :]
-                - vs.int_drhodS[2:-2, 2:-2, :, vs.tau] * vs.dsalt_iso[2:-2, 2:-2, :]
-            )
+    dP_iso = npx.sum(
+        vol_t
+        * settings.grav
+        / settings.rho_0
+        * (
+            -vs.int_drhodT[2:-2, 2:-2, :, vs.tau] * vs.dtemp_iso[2:-2, 2:-2, :]
+            - vs.int_drhodS[2:-2, 2:-2, :, vs.tau] * vs.dsalt_iso[2:-2, 2:-2, :]
         )
     )
 
-    dP_hmix = global_sum(
-        npx.sum(
-            vol_t
-            * settings.grav
-            / settings.rho_0
-            * (
-                -vs.int_drhodT[2:-2, 2:-2, :, vs.tau] * vs.dtemp_hmix[2:-2, 2:-2, :]
-                - vs.int_drhodS[2:-2, 2:-2, :, vs.tau] * vs.dsalt_hmix[2:-2, 2:-2, :]
-            )
+    dP_hmix = npx.sum(
+        vol_t
+        * settings.grav
+        / settings.rho_0
+        * (
+            -vs.int_drhodT[2:-2, 2:-2, :, vs.tau] * vs.dtemp_hmix[2:-2, 2:-2, :]
+            - vs.int_drhodS[2:-2, 2:-2, :, vs.tau] * vs.dsalt_hmix[2:-2, 2:-2, :]
         )
     )
 
-    dP_vmix = global_sum(
-        npx.sum(
-            vol_t
-            * settings.grav
-            / settings.rho_0
-            * (
-                -vs.int_drhodT[2:-2, 2:-2, :, vs.tau] * vs.dtemp_vmix[2:-2, 2:-2, :]
-                - vs.int_drhodS[2:-2, 2:-2, :, vs.tau] * vs.dsalt_vmix[2:-2, 2:-2, :]
-            )
+    dP_vmix = npx.sum(
+        vol_t
+        * settings.grav
+        / settings.rho_0
+        * (
+            -vs.int_drhodT[2:-2, 2:-2, :, vs.tau] * vs.dtemp_vmix[2:-2, 2:-2, :]
+            - vs.int_drhodS[2:-2, 2:-2, :, vs.tau] * vs.dsalt_vmix[2:-2, 2:-2, :]
         )
     )
 
-    dP_m = global_sum(
-        npx.sum(
-            vol_t
-            * settings.grav
-            / settings.rho_0
-            * (
-                -vs.int_drhodT[2:-2, 2:-2, :, vs.tau] * vs.dtemp[2:-2, 2:-2, :, vs.tau]
-                - vs.int_drhodS[2:-2, 2:-2, :, vs.tau] * vs.dsalt[2:-2, 2:-2, :, vs.tau]
-            )
+    dP_m = npx.sum(
+        vol_t
+        * settings.grav
+        / settings.rho_0
+        * (
+            -vs.int_drhodT[2:-2, 2:-2, :, vs.tau] * vs.dtemp[2:-2, 2:-2, :, vs.tau]
+            - vs.int_drhodS[2:-2, 2:-2, :, vs.tau] * vs.dsalt[2:-2, 2:-2, :, vs.tau]
         )
     )
 
@@ -215,25 +207,21 @@ def diagnose_kernel(state):
     # changes of kinetic energy
     vol_u = vs.area_u[2:-2, 2:-2, npx.newaxis] * vs.dzt[npx.newaxis, npx.newaxis, :]
     vol_v = vs.area_v[2:-2, 2:-2, npx.newaxis] * vs.dzt[npx.newaxis, npx.newaxis, :]
-    k_m = global_sum(
-        npx.sum(
-            vol_t
-            * 0.5
-            * (
-                0.5 * (vs.u[2:-2, 2:-2, :, vs.tau] ** 2 + vs.u[1:-3, 2:-2, :, vs.tau] ** 2)
-                + 0.5 * (vs.v[2:-2, 2:-2, :, vs.tau] ** 2)
-                + vs.v[2:-2, 1:-3, :, vs.tau] ** 2
-            )
+    k_m = npx.sum(
+        vol_t
+        * 0.5
+        * (
+            0.5 * (vs.u[2:-2, 2:-2, :, vs.tau] ** 2 + vs.u[1:-3, 2:-2, :, vs.tau] ** 2)
+            + 0.5 * (vs.v[2:-2, 2:-2, :, vs.tau] ** 2)
+            + vs.v[2:-2, 1:-3, :, vs.tau] ** 2
         )
     )
-    p_m = global_sum(npx.sum(vol_t * vs.Hd[2:-2, 2:-2, :, vs.tau]))
-    dk_m = global_sum(
-        npx.sum(
-            vs.u[2:-2, 2:-2, :, vs.tau] * vs.du[2:-2, 2:-2, :, vs.tau] * vol_u
-            + vs.v[2:-2, 2:-2, :, vs.tau] * vs.dv[2:-2, 2:-2, :, vs.tau] * vol_v
-            + vs.u[2:-2, 2:-2, :, vs.tau] * vs.du_mix[2:-2, 2:-2, :] * vol_u
-            + vs.v[2:-2, 2:-2, :, vs.tau] * vs.dv_mix[2:-2, 2:-2, :] * vol_v
-        )
+    p_m = npx.sum(vol_t * vs.Hd[2:-2, 2:-2, :, vs.tau])
+    dk_m = npx.sum(
+        vs.u[2:-2, 2:-2, :, vs.tau] * vs.du[2:-2, 2:-2, :, vs.tau] * vol_u
+        + vs.v[2:-2, 2:-2, :, vs.tau] * vs.dv[2:-2, 2:-2, :, vs.tau] * vol_v
+        + vs.u[2:-2, 2:-2, :, vs.tau] * vs.du_mix[2:-2, 2:-2, :] * vol_u
+        + vs.v[2:-2, 2:-2, :, vs.tau] * vs.dv_mix[2:-2, 2:-2, :] * vol_v
     )
 
     # K*Nsqr and KE and dyn. enthalpy dissipation
@@ -241,7 +229,7 @@ def diagnose_kernel(state):
     vol_w = update_multiply(vol_w, at[:, :, -1], 0.5)
 
     def mean_w(var):
-        return global_sum(npx.sum(var[2:-2, 2:-2, :] * vol_w))
+        return npx.sum(var[2:-2, 2:-2, :] * vol_w)
 
     mdiss_vmix = mean_w(vs.P_diss_v)
     mdiss_nonlin = mean_w(vs.P_diss_nonlin)
@@ -256,52 +244,44 @@ def diagnose_kernel(state):
     mdiss_gm = mean_w(vs.K_diss_gm)
     mdiss_bot = mean_w(vs.K_diss_bot)
 
-    wrhom = global_sum(
-        npx.sum(
-            -vs.area_t[2:-2, 2:-2, npx.newaxis]
-            * vs.maskW[2:-2, 2:-2, :-1]
-            * (vs.p_hydro[2:-2, 2:-2, 1:] - vs.p_hydro[2:-2, 2:-2, :-1])
-            * vs.w[2:-2, 2:-2, :-1, vs.tau]
-        )
+    wrhom = npx.sum(
+        -vs.area_t[2:-2, 2:-2, npx.newaxis]
+        * vs.maskW[2:-2, 2:-2, :-1]
+        * (vs.p_hydro[2:-2, 2:-2, 1:] - vs.p_hydro[2:-2, 2:-2, :-1])
+        * vs.w[2:-2, 2:-2, :-1, vs.tau]
     )
 
     # wind work
     if runtime_settings.pyom_compatibility_mode:
         # surface_tau* has different units in PyOM
-        wind = global_sum(
-            npx.sum(
-                vs.u[2:-2, 2:-2, -1, vs.tau]
-                * vs.surface_taux[2:-2, 2:-2]
-                * vs.maskU[2:-2, 2:-2, -1]
-                * vs.area_u[2:-2, 2:-2]
-                + vs.v[2:-2, 2:-2, -1, vs.tau]
-                * vs.surface_tauy[2:-2, 2:-2]
-                * vs.maskV[2:-2, 2:-2, -1]
-                * vs.area_v[2:-2, 2:-2]
-            )
+        wind = npx.sum(
+            vs.u[2:-2, 2:-2, -1, vs.tau]
+            * vs.surface_taux[2:-2, 2:-2]
+            * vs.maskU[2:-2, 2:-2, -1]
+            * vs.area_u[2:-2, 2:-2]
+            + vs.v[2:-2, 2:-2, -1, vs.tau]
+            * vs.surface_tauy[2:-2, 2:-2]
+            * vs.maskV[2:-2, 2:-2, -1]
+            * vs.area_v[2:-2, 2:-2]
         )
     else:
-        wind = global_sum(
-            npx.sum(
-                vs.u[2:-2, 2:-2, -1, vs.tau]
-                * vs.surface_taux[2:-2, 2:-2]
-                / settings.rho_0
-                * vs.maskU[2:-2, 2:-2, -1]
-                * vs.area_u[2:-2, 2:-2]
-                + vs.v[2:-2, 2:-2, -1, vs.tau]
-                * vs.surface_tauy[2:-2, 2:-2]
-                / settings.rho_0
-                * vs.maskV[2:-2, 2:-2, -1]
-                * vs.area_v[2:-2, 2:-2]
-            )
+        wind = npx.sum(
+            vs.u[2:-2, 2:-2, -1, vs.tau]
+            * vs.surface_taux[2:-2, 2:-2]
+            / settings.rho_0
+            * vs.maskU[2:-2, 2:-2, -1]
+            * vs.area_u[2:-2, 2:-2]
+            + vs.v[2:-2, 2:-2, -1, vs.tau]
+            * vs.surface_tauy[2:-2, 2:-2]
+            / settings.rho_0
+            * vs.maskV[2:-2, 2:-2, -1]
+            * vs.area_v[2:-2, 2:-2]
         )
 
     # meso-scale energy
     if settings.enable_eke:
         eke_m = mean_w(vs.eke[..., vs.tau])
-        deke_m = global_sum(
-            npx.sum(vol_w * (vs.eke[2:-2, 2:-2, :, vs.taup1] - vs.eke[2:-2, 2:-2, :, vs.tau]) / settings.dt_tracer)
-        )
+        deke_m = npx.sum(vol_w * (vs.eke[2:-2, 2:-2, :, vs.taup1] - vs.eke[2:-2, 2:-2, :, vs.tau]) / settings.dt_tracer)
         eke_diss = mean_w(vs.eke_diss_iw)
         eke_diss_tke = mean_w(vs.eke_diss_tke)
     else:
@@ -316,12 +296,10 @@ def diagnose_kernel(state):
         tke_m = mean_w(vs.tke[..., vs.tau])
         dtke_m = mean_w((vs.tke[..., vs.taup1] - vs.tke[..., vs.tau]) / dt_tke)
         tke_diss = mean_w(vs.tke_diss)
-        tke_forc = global_sum(
-            npx.sum(
-                vs.area_t[2:-2, 2:-2]
-                * vs.maskW[2:-2, 2:-2, -1]
-                * (vs.forc_tke_surface[2:-2, 2:-2] + vs.tke_surf_corr[2:-2, 2:-2])
-            )
+        tke_forc = npx.sum(
+            vs.area_t[2:-2, 2:-2]
+            * vs.maskW[2:-2, 2:-2, -1]
+            * (vs.forc_tke_surface[2:-2, 2:-2] + vs.tke_surf_corr[2:-2, 2:-2])
         )
     else:
         tke_m = dtke_m = tke_diss = tke_forc = 0.0
@@ -329,20 +307,16 @@ def diagnose_kernel(state):
     # internal wave energy
     if settings.enable_idemix:
         iw_m = mean_w(vs.E_iw[..., vs.tau])
-        diw_m = global_sum(
-            npx.sum(vol_w * (vs.E_iw[2:-2, 2:-2, :, vs.taup1] - vs.E_iw[2:-2, 2:-2, :, vs.tau]) / vs.dt_tracer)
-        )
+        diw_m = npx.sum(vol_w * (vs.E_iw[2:-2, 2:-2, :, vs.taup1] - vs.E_iw[2:-2, 2:-2, :, vs.tau]) / vs.dt_tracer)
         iw_diss = mean_w(vs.iw_diss)
 
         k = npx.maximum(1, vs.kbot[2:-2, 2:-2]) - 1
         mask = k[:, :, npx.newaxis] == npx.arange(settings.nz)[npx.newaxis, npx.newaxis, :]
-        iwforc = global_sum(
-            npx.sum(
-                vs.area_t[2:-2, 2:-2]
-                * (
-                    vs.forc_iw_surface[2:-2, 2:-2] * vs.maskW[2:-2, 2:-2, -1]
-                    + npx.sum(mask * vs.forc_iw_bottom[2:-2, 2:-2, npx.newaxis] * vs.maskW[2:-2, 2:-2, :], axis=2)
-                )
+        iwforc = npx.sum(
+            vs.area_t[2:-2, 2:-2]
+            * (
+                vs.forc_iw_surface[2:-2, 2:-2] * vs.maskW[2:-2, 2:-2, -1]
+                + npx.sum(mask * vs.forc_iw_bottom[2:-2, 2:-2, npx.newaxis] * vs.maskW[2:-2, 2:-2, :], axis=2)
             )
         )
     else:
@@ -363,7 +337,7 @@ def diagnose_kernel(state):
         hd_eke_m = hd_eke_m - mdiss_hmix - mdiss_iso
         tke_hd_m = tke_hd_m - mdiss_nonlin
 
-    return KernelOutput(
+    energies = dict(
         k_m=k_m,
         Hd_m=p_m,
         eke_m=eke_m,
@@ -396,3 +370,9 @@ def diagnose_kernel(state):
         cabb_m=mdiss_nonlin,
         cabb_iso_m=mdiss_hmix + mdiss_iso,
     )
+
+    # all energies are sums over the local domain, so they can be reduced together
+    with batched_reductions() as batch:
+        energies = {key: batch.sum(val) for key, val in energies.items()}
+
+    return KernelOutput(**{key: val.value for key, val in energies.items()})
@@ -6,7 +6,7 @@ from veros.diagnostics.base import VerosDiagnostic
 from veros.core import density
 from veros.variables import Variable, allocate
 from veros.distributed import global_sum
-from veros.core.operators import numpy as npx, update, update_add, at, for_loop
+from veros.core.operators import numpy as npx, update, update_add, at, bincount
 
 
 VARIABLES = {
@@ -145,12 +145,46 @@ class Overturning(VerosDiagnostic):
 
 @veros_kernel
 def _interpolate_depth_coords(coords, arr, interp_coords):
+    """Linear interpolation along the last axis, batched over all other axes
+    (same as ``numpy.interp`` applied to each row)"""
     # ensure depth coordinates are monotonically increasing
     coords = -coords
     interp_coords = -interp_coords
 
-    interp_vectorized = npx.vectorize(npx.interp, signature="(n),(m),(m)->(n)")
-    return interp_vectorized(interp_coords, coords, arr)
+    # index of the last coordinate that is smaller or equal to each interpolation point
+    idx = npx.sum(coords[..., npx.newaxis, :] <= interp_coords[..., npx.newaxis], axis=-1) - 1
+    idx = npx.clip(idx, 0, coords.shape[-1] - 2)
+
+    x0 = npx.take_along_axis(coords, idx, axis=-1)
+    x1 = npx.take_along_axis(coords, idx + 1, axis=-1)
+    y0 = npx.take_along_axis(arr, idx, axis=-1)
+    y1 = npx.take_along_axis(arr, idx + 1, axis=-1)
+
+    dx = x1 - x0
+    weight = (interp_coords - x0) / npx.where(dx > 0, dx, 1.0)
+    res = y0 + weight * (y1 - y0)
+
+    # constant extrapolation outside of the given coordinates
+    res = npx.where(interp_coords < coords[..., :1], arr[..., :1], res)
+    res = npx.where(interp_coords >= coords[..., -1:], arr[..., -1:], res)
+    return res
+
+
+@veros_kernel(static_args=("nlevel",))
+def _transport_above_levels(sig_class, weights, nlevel):
+    """Sums weights over all cells with a sigma class above each level, per row along y.
+
+    Every cell is assigned to exactly one bin, so this does not depend on the number of levels.
+    """
+    nbins = nlevel + 1
+    ny = sig_class.shape[1]
+
+    row_idx = npx.arange(ny)[npx.newaxis, :, npx.newaxis]
+    bin_idx = (row_idx * nbins + sig_class).reshape(-1)
+    binned = bincount(bin_idx, weights=weights.reshape(-1), length=ny * nbins).reshape(ny, nbins)
+
+    # cells in class c are denser than sigma levels 0, ..., c - 1
+    return npx.cumsum(binned[:, ::-1], axis=1)[:, ::-1][:, 1:]
 
 
 @veros_kernel
@@ -171,6 +205,9 @@ def diagnose_kernel(state, ovt_vs, p_ref):
     # transports below isopycnals and area below isopycnals
     sig_loc_face = 0.5 * (sig_loc[2:-2, 2:-2, :] + sig_loc[2:-2, 3:-1, :])
 
+    # number of sigma levels that are lighter than each cell
+    sig_class = npx.searchsorted(ovt_vs.sigma, sig_loc_face, side="left")
+
     trans = allocate(state.dimensions, ("yu", nlevel))
     z_sig = allocate(state.dimensions, ("yu", nlevel))
 
@@ -181,14 +218,8 @@ def diagnose_kernel(state, ovt_vs, p_ref):
         * vs.maskV[2:-2, 2:-2, :]
     )
 
-    def loop_body(m, values):
-        trans, z_sig = values
-        mask = sig_loc_face > ovt_vs.sigma[m]
-        trans = update(trans, at[2:-2, m], npx.sum(vs.v[2:-2, 2:-2, :, vs.tau] * fac * mask, axis=(0, 2)))
-        z_sig = update(z_sig, at[2:-2, m], npx.sum(fac * mask, axis=(0, 2)))
-        return (trans, z_sig)
-
-    trans, z_sig = for_loop(0, nlevel, loop_body, init_val=(trans, z_sig))
+    trans = update(trans, at[2:-2, :], _transport_above_levels(sig_class, vs.v[2:-2, 2:-2, :, vs.tau] * fac, nlevel))
+    z_sig = update(z_sig, at[2:-2, :], _transport_above_levels(sig_class, fac, nlevel))
     trans = zonal_sum(trans)
     z_sig = zonal_sum(z_sig)
 
@@ -198,31 +229,14 @@ def diagnose_kernel(state, ovt_vs, p_ref):
         # eddy-driven transports below isopycnals
         bolus_trans = allocate(state.dimensions, ("yu", nlevel))
 
-        def loop_body(m, bolus_trans):
-            mask = sig_loc_face > ovt_vs.sigma[m]
-            bolus_trans = update(
-                bolus_trans,
-                at[2:-2, m],
-                npx.sum(
-                    npx.sum(
-                        (vs.B1_gm[2:-2, 2:-2, 1:] - vs.B1_gm[2:-2, 2:-2, :-1])
-                        * vs.dxt[2:-2, npx.newaxis, npx.newaxis]
-                        * vs.cosu[npx.newaxis, 2:-2, npx.newaxis]
-                        * vs.maskV[2:-2, 2:-2, 1:]
-                        * mask[:, :, 1:],
-                        axis=2,
-                    )
-                    + vs.B1_gm[2:-2, 2:-2, 0]
-                    * vs.dxt[2:-2, npx.newaxis]
-                    * vs.cosu[npx.newaxis, 2:-2]
-                    * vs.maskV[2:-2, 2:-2, 0]
-                    * mask[:, :, 0],
-                    axis=0,
-                ),
-            )
-            return bolus_trans
+        bolus_fac = (
+            vs.dxt[2:-2, npx.newaxis, npx.newaxis] * vs.cosu[npx.newaxis, 2:-2, npx.newaxis] * vs.maskV[2:-2, 2:-2, :]
+        )
+        bolus_weights = bolus_fac * npx.concatenate(
+            (vs.B1_gm[2:-2, 2:-2, :1], vs.B1_gm[2:-2, 2:-2, 1:] - vs.B1_gm[2:-2, 2:-2, :-1]), axis=2
+        )
 
-        bolus_trans = for_loop(0, nlevel, loop_body, init_val=bolus_trans)
+        bolus_trans = update(bolus_trans, at[2:-2, :], _transport_above_levels(sig_class, bolus_weights, nlevel))
         bolus_trans = zonal_sum(bolus_trans)
 
     # streamfunction on geopotentials
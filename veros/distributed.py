@@ -1,4 +1,5 @@
 import functools
+import contextlib
 
 from veros import runtime_settings as rs, runtime_state as rst
 from veros.routines import CURRENT_CONTEXT
@@ -95,7 +96,41 @@ def bcast(buf, comm, root=0):
     return comm.bcast(buf, root=root)
 
 
+def is_local_comm(comm):
+    """Whether the given communicator connects processes on this node through shared memory (see veros.local_comm)"""
+    from veros.local_comm import LocalComm
+
+    return isinstance(comm, LocalComm)
+
+
+def get_reduction_op(op, comm):
+    """Returns the reduction operation with the given name (e.g. "SUM") that can be passed to comm"""
+    if not isinstance(op, str) or is_local_comm(comm):
+        return op
+
+    from mpi4py import MPI
+
+    return getattr(MPI, op)
+
+
+def waitall(requests):
+    if not requests:
+        return
+
+    if is_local_comm(rs.mpi_comm):
+        from veros.local_comm import LocalRequest
+
+        LocalRequest.Waitall(requests)
+        return
+
+    from mpi4py import MPI
+
+    MPI.Request.Waitall(requests)
+
+
 def allreduce(buf, op, comm):
+    op = get_reduction_op(op, comm)
+
     if rs.backend == "jax":
         from mpi4jax import allreduce
 
@@ -131,15 +166,61 @@ def validate_decomposition(dimensions):
     if proc_num != comm_size:
         raise RuntimeError(f"number of processes ({proc_num}) does not match size of communicator ({comm_size})")
 
-    if nx % rs.num_proc[0]:
-        raise ValueError("processes do not divide domain evenly in x-direction")
+    if proc_num > 1 and is_local_comm(rs.mpi_comm) and rs.backend != "numpy":
+        raise RuntimeError("Shared-memory communicators are only supported with the NumPy backend")
 
-    if ny % rs.num_proc[1]:
-        raise ValueError("processes do not divide domain evenly in y-direction")
+    decomposition = get_decomposition()
 
+    if decomposition is None:
+        if nx % rs.num_proc[0]:
+            raise ValueError("processes do not divide domain evenly in x-direction")
 
-def get_chunk_size(nx, ny):
-    return (nx // rs.num_proc[0], ny // rs.num_proc[1])
+        if ny % rs.num_proc[1]:
+            raise ValueError("processes do not divide domain evenly in y-direction")
+
+        return
+
+    decomposition.validate(nx, ny, rs.num_proc)
+
+
+def get_decomposition():
+    """Returns the non-uniform domain decomposition given in the runtime settings (or None)"""
+    if rs.decomposition_file is None or rs.num_proc == (1, 1):
+        return None
+
+    from veros.decomposition import load_decomposition
+
+    return load_decomposition(rs.decomposition_file)
+
+
+def get_proc_bounds(n, axis):
+    """Returns the boundaries of the subdomains of all processes along the given axis (excluding ghost cells)"""
+    decomposition = get_decomposition()
+
+    if decomposition is not None:
+        return decomposition.bounds[axis]
+
+    chunk_size = n // rs.num_proc[axis]
+    return tuple(i * chunk_size for i in range(rs.num_proc[axis] + 1))
+
+
+def get_local_size(n, axis, proc_idx=None):
+    """Returns the number of cells owned by a process along the given axis"""
+    if proc_idx is None:
+        proc_idx = proc_rank_to_index(rst.proc_rank)
+
+    bounds = get_proc_bounds(n, axis)
+    return bounds[proc_idx[axis] + 1] - bounds[proc_idx[axis]]
+
+
+def get_chunk_size(nx, ny, proc_idx=None):
+    return (get_local_size(nx, 0, proc_idx), get_local_size(ny, 1, proc_idx))
+
+
+def get_max_local_size(n, axis):
+    """Returns the number of cells of the largest subdomain along the given axis"""
+    bounds = get_proc_bounds(n, axis)
+    return max(upper - lower for lower, upper in zip(bounds[:-1], bounds[1:]))
 
 
 def proc_rank_to_index(rank):
@@ -158,13 +239,35 @@ def get_chunk_slices(nx, ny, dim_grid, proc_idx=None, include_overlap=False):
         proc_idx = proc_rank_to_index(rst.proc_rank)
 
     px, py = proc_idx
-    nxl, nyl = get_chunk_size(nx, ny)
+    xbounds, ybounds = get_proc_bounds(nx, 0), get_proc_bounds(ny, 1)
+
+    return get_block_slices(
+        dim_grid,
+        block_start=(xbounds[px], ybounds[py]),
+        block_size=(xbounds[px + 1] - xbounds[px], ybounds[py + 1] - ybounds[py]),
+        is_first=(px == 0, py == 0),
+        is_last=(px + 1 == rs.num_proc[0], py + 1 == rs.num_proc[1]),
+        include_overlap=include_overlap,
+    )
+
+
+def get_block_slices(dim_grid, block_start, block_size, is_first, is_last, include_overlap=False):
+    """Returns slices into the enclosing and the block-local array of a rectangular block of the x-y domain.
+
+    With include_overlap, the 2-cell overlap is included on sides where the block touches the edge
+    of the enclosing domain (given by is_first and is_last).
+    """
+    if not dim_grid:
+        return Ellipsis, Ellipsis
+
+    x0, y0 = block_start
+    nxl, nyl = block_size
 
     if include_overlap:
-        sxl = 0 if px == 0 else 2
-        sxu = nxl + 4 if (px + 1) == rs.num_proc[0] else nxl + 2
-        syl = 0 if py == 0 else 2
-        syu = nyl + 4 if (py + 1) == rs.num_proc[1] else nyl + 2
+        sxl = 0 if is_first[0] else 2
+        sxu = nxl + 4 if is_last[0] else nxl + 2
+        syl = 0 if is_first[1] else 2
+        syu = nyl + 4 if is_last[1] else nyl + 2
     else:
         sxl = syl = 0
         sxu = nxl
@@ -174,10 +277,10 @@ def get_chunk_slices(nx, ny, dim_grid, proc_idx=None, include_overlap=False):
 
     for dim in dim_grid:
         if dim in SCATTERED_DIMENSIONS[0]:
-            global_slice.append(slice(sxl + px * nxl, sxu + px * nxl))
+            global_slice.append(slice(sxl + x0, sxu + x0))
             local_slice.append(slice(sxl, sxu))
         elif dim in SCATTERED_DIMENSIONS[1]:
-            global_slice.append(slice(syl + py * nyl, syu + py * nyl))
+            global_slice.append(slice(syl + y0, syu + y0))
             local_slice.append(slice(syl, syu))
         else:
             global_slice.append(slice(None))
@@ -229,30 +332,6 @@ def get_process_neighbors(cyclic=False):
 def exchange_overlap(arr, var_grid, cyclic):
     from veros.core.operators import numpy as npx, update, at
 
-    # start west, go clockwise
-    send_order = (
-        "west",
-        "northwest",
-        "north",
-        "northeast",
-        "east",
-        "southeast",
-        "south",
-        "southwest",
-    )
-
-    # start east, go clockwise
-    recv_order = (
-        "east",
-        "southeast",
-        "south",
-        "southwest",
-        "west",
-        "northwest",
-        "north",
-        "northeast",
-    )
-
     if len(var_grid) < 2:
         d1, d2 = var_grid[0], None
     else:
@@ -262,54 +341,34 @@ def exchange_overlap(arr, var_grid, cyclic):
         # neither x nor y dependent, nothing to do
         return arr
 
-    proc_neighbors = get_process_neighbors(cyclic)
-
     if d1 in SCATTERED_DIMENSIONS[0] and d2 in SCATTERED_DIMENSIONS[1]:
-        overlap_slices_from = dict(
-            west=(slice(2, 4), slice(0, None), Ellipsis),
-            south=(slice(0, None), slice(2, 4), Ellipsis),
-            east=(slice(-4, -2), slice(0, None), Ellipsis),
-            north=(slice(0, None), slice(-4, -2), Ellipsis),
-            southwest=(slice(2, 4), slice(2, 4), Ellipsis),
-            southeast=(slice(-4, -2), slice(2, 4), Ellipsis),
-            northeast=(slice(-4, -2), slice(-4, -2), Ellipsis),
-            northwest=(slice(2, 4), slice(-4, -2), Ellipsis),
-        )
-
-        overlap_slices_to = dict(
-            west=(slice(0, 2), slice(0, None), Ellipsis),
-            south=(slice(0, None), slice(0, 2), Ellipsis),
-            east=(slice(-2, None), slice(0, None), Ellipsis),
-            north=(slice(0, None), slice(-2, None), Ellipsis),
-            southwest=(slice(0, 2), slice(0, 2), Ellipsis),
-            southeast=(slice(-2, None), slice(0, 2), Ellipsis),
-            northeast=(slice(-2, None), slice(-2, None), Ellipsis),
-            northwest=(slice(0, 2), slice(-2, None), Ellipsis),
-        )
+        # corners are exchanged without extra messages, see OverlapExchange
+        return OverlapExchange((arr,), cyclic).wait()[0]
 
+    proc_neighbors = get_process_neighbors(cyclic)
+
+    if d1 in SCATTERED_DIMENSIONS[0]:
+        send_order = ("west", "east")
+        recv_order = ("east", "west")
+    elif d1 in SCATTERED_DIMENSIONS[1]:
+        send_order = ("north", "south")
+        recv_order = ("south", "north")
     else:
-        if d1 in SCATTERED_DIMENSIONS[0]:
-            send_order = ("west", "east")
-            recv_order = ("east", "west")
-        elif d1 in SCATTERED_DIMENSIONS[1]:
-            send_order = ("north", "south")
-            recv_order = ("south", "north")
-        else:
-            raise NotImplementedError()
-
-        overlap_slices_from = dict(
-            west=(slice(2, 4), Ellipsis),
-            south=(slice(2, 4), Ellipsis),
-            east=(slice(-4, -2), Ellipsis),
-            north=(slice(-4, -2), Ellipsis),
-        )
-
-        overlap_slices_to = dict(
-            west=(slice(0, 2), Ellipsis),
-            south=(slice(0, 2), Ellipsis),
-            east=(slice(-2, None), Ellipsis),
-            north=(slice(-2, None), Ellipsis),
-        )
+        raise NotImplementedError()
+
+    overlap_slices_from = dict(
+        west=(slice(2, 4), Ellipsis),
+        south=(slice(2, 4), Ellipsis),
+        east=(slice(-4, -2), Ellipsis),
+        north=(slice(-4, -2), Ellipsis),
+    )
+
+    overlap_slices_to = dict(
+        west=(slice(0, 2), Ellipsis),
+        south=(slice(0, 2), Ellipsis),
+        east=(slice(-2, None), Ellipsis),
+        north=(slice(-2, None), Ellipsis),
+    )
 
     for send_dir, recv_dir in zip(send_order, recv_order):
         send_proc = proc_neighbors[send_dir]
@@ -336,15 +395,287 @@ def exchange_overlap(arr, var_grid, cyclic):
     return arr
 
 
+# The overlap of arrays on x-y grids is exchanged in two phases: first along x, then along y.
+# Since the y-phase sends full rows including the x-overlap received before, corners are
+# filled without additional messages.
+BATCHED_EXCHANGE_PHASES = (
+    (("west", "east"), ("east", "west")),
+    (("south", "north"), ("north", "south")),
+)
+
+BATCHED_OVERLAP_SLICES_FROM = dict(
+    west=(slice(2, 4), slice(0, None)),
+    south=(slice(0, None), slice(2, 4)),
+    east=(slice(-4, -2), slice(0, None)),
+    north=(slice(0, None), slice(-4, -2)),
+)
+
+BATCHED_OVERLAP_SLICES_TO = dict(
+    west=(slice(0, 2), slice(0, None)),
+    south=(slice(0, None), slice(0, 2)),
+    east=(slice(-2, None), slice(0, None)),
+    north=(slice(0, None), slice(-2, None)),
+)
+
+BATCHED_EXCHANGE_TAG = 100
+
+# communication buffers that are not in use, by (size, dtype)
+_EXCHANGE_BUFFER_POOL = {}
+
+
+def _get_exchange_buffer(size, dtype):
+    """Returns a communication buffer, reusing one of a previous exchange if possible"""
+    import numpy
+
+    dtype = numpy.dtype(dtype)
+    free_buffers = _EXCHANGE_BUFFER_POOL.get((size, dtype))
+
+    if free_buffers:
+        return free_buffers.pop()
+
+    return numpy.empty(size, dtype=dtype)
+
+
+def _release_exchange_buffers(buffers):
+    for buf in buffers:
+        _EXCHANGE_BUFFER_POOL.setdefault((buf.size, buf.dtype), []).append(buf)
+
+
+class OverlapExchange:
+    """A pending exchange of the overlap of several arrays, as returned by :func:`start_exchange_overlap`.
+
+    Call :meth:`wait` to complete the exchange and get the updated arrays. Only the first phase
+    (along x) is in flight before :meth:`wait`; the second phase (along y, including the corners)
+    depends on its result and runs inside :meth:`wait`.
+
+    With ``inplace=True``, the caller hands the arrays over and received overlaps may be written into
+    them (see :func:`veros.core.operators.update`). Otherwise, each array that receives an overlap is
+    copied once.
+    """
+
+    def __init__(self, arrs, cyclic, inplace=False):
+        self._arrs = list(arrs)
+        self._cyclic = cyclic
+        self._inplace = inplace
+        # whether an array may be written to directly because it belongs to this exchange
+        self._owned = [False] * len(self._arrs)
+        self._active = rst.proc_num > 1 and CURRENT_CONTEXT.is_dist_safe and len(self._arrs) > 0
+        self._requests = []
+        self._send_buffers = []
+        self._recv_buffers = []
+
+        # arrays of the same type are packed into one message per neighbor
+        self._groups = {}
+        for i, arr in enumerate(self._arrs):
+            self._groups.setdefault(arr.dtype, []).append(i)
+
+        if self._active and rs.backend == "numpy":
+            self._start_phase(0)
+
+    def _get_tag(self, phase, side, group_idx):
+        return BATCHED_EXCHANGE_TAG + (2 * phase + side) * len(self._groups) + group_idx
+
+    def _buffer_size(self, overlap_idx, group):
+        return sum(self._arrs[i][overlap_idx].size for i in group)
+
+    def _pack(self, send_dir, group):
+        from veros.core.operators import numpy as npx
+
+        send_idx = BATCHED_OVERLAP_SLICES_FROM[send_dir]
+        return npx.concatenate([self._arrs[i][send_idx].reshape(-1) for i in group])
+
+    def _pack_into(self, buf, send_dir, group):
+        send_idx = BATCHED_OVERLAP_SLICES_FROM[send_dir]
+        offset = 0
+        for i in group:
+            strip = self._arrs[i][send_idx]
+            buf[offset : offset + strip.size].reshape(strip.shape)[...] = strip
+            offset += strip.size
+
+    def _unpack(self, arrs, recv_dir, group, buf):
+        from veros.core.operators import update, at
+
+        recv_idx = BATCHED_OVERLAP_SLICES_TO[recv_dir]
+        offset = 0
+        for i in group:
+            recv_shape = arrs[i][recv_idx].shape
+            recv_size = arrs[i][recv_idx].size
+            arrs[i] = update(arrs[i], at[recv_idx], buf[offset : offset + recv_size].reshape(recv_shape))
+            offset += recv_size
+
+    def _unpack_inplace(self, recv_dir, group, buf):
+        from veros.core.operators import update, at, make_writeable_inplace
+
+        recv_idx = BATCHED_OVERLAP_SLICES_TO[recv_dir]
+        offset = 0
+        for i in group:
+            recv_shape = self._arrs[i][recv_idx].shape
+            recv_size = self._arrs[i][recv_idx].size
+            strip = buf[offset : offset + recv_size].reshape(recv_shape)
+
+            if self._owned[i]:
+                with make_writeable_inplace(self._arrs[i]) as arr:
+                    arr[recv_idx] = strip
+            else:
+                # copies the input unless the caller handed it over
+                self._arrs[i] = update(self._arrs[i], at[recv_idx], strip, inplace=self._inplace)
+                self._owned[i] = True
+
+            offset += recv_size
+
+    def _start_phase(self, phase):
+        proc_neighbors = get_process_neighbors(self._cyclic)
+
+        for side, (send_dir, recv_dir) in enumerate(BATCHED_EXCHANGE_PHASES[phase]):
+            send_proc = proc_neighbors[send_dir]
+            recv_proc = proc_neighbors[recv_dir]
+
+            for group_idx, (dtype, group) in enumerate(self._groups.items()):
+                tag = self._get_tag(phase, side, group_idx)
+
+                if recv_proc is not None:
+                    recvbuf = _get_exchange_buffer(self._buffer_size(BATCHED_OVERLAP_SLICES_TO[recv_dir], group), dtype)
+                    self._requests.append(rs.mpi_comm.Irecv(recvbuf, source=recv_proc, tag=tag))
+                    self._recv_buffers.append((recv_dir, group, recvbuf))
+
+                if send_proc is not None:
+                    sendbuf = _get_exchange_buffer(
+                        self._buffer_size(BATCHED_OVERLAP_SLICES_FROM[send_dir], group), dtype
+                    )
+                    self._pack_into(sendbuf, send_dir, group)
+                    # buffer must stay alive until the request is completed
+                    self._send_buffers.append(sendbuf)
+                    self._requests.append(rs.mpi_comm.Isend(sendbuf, dest=send_proc, tag=tag))
+
+    def _finish_phase(self):
+        waitall(self._requests)
+
+        for recv_dir, group, recvbuf in self._recv_buffers:
+            self._unpack_inplace(recv_dir, group, recvbuf)
+
+        _release_exchange_buffers(self._send_buffers)
+        _release_exchange_buffers(recvbuf for _, _, recvbuf in self._recv_buffers)
+        self._requests, self._send_buffers, self._recv_buffers = [], [], []
+
+    def _exchange_blocking(self, arrs):
+        from veros.core.operators import numpy as npx
+
+        proc_neighbors = get_process_neighbors(self._cyclic)
+
+        for phase, directions in enumerate(BATCHED_EXCHANGE_PHASES):
+            for side, (send_dir, recv_dir) in enumerate(directions):
+                send_proc = proc_neighbors[send_dir]
+                recv_proc = proc_neighbors[recv_dir]
+
+                if send_proc is None and recv_proc is None:
+                    continue
+
+                for group_idx, (dtype, group) in enumerate(self._groups.items()):
+                    tag = self._get_tag(phase, side, group_idx)
+
+                    if send_proc is None:
+                        recvbuf = npx.empty(self._buffer_size(BATCHED_OVERLAP_SLICES_TO[recv_dir], group), dtype=dtype)
+                        recvbuf = recv(recvbuf, recv_proc, rs.mpi_comm, tag=tag)
+                    elif recv_proc is None:
+                        send(self._pack(send_dir, group), send_proc, rs.mpi_comm, tag=tag)
+                    else:
+                        sendbuf = self._pack(send_dir, group)
+                        # sent and received overlaps have the same size, so the send buffer
+                        # serves as template of the received one
+                        recvbuf = sendrecv(
+                            sendbuf,
+                            sendbuf,
+                            source=recv_proc,
+                            dest=send_proc,
+                            comm=rs.mpi_comm,
+                            sendtag=tag,
+                            recvtag=tag,
+                        )
+
+                    if recv_proc is not None:
+                        self._unpack(arrs, recv_dir, group, recvbuf)
+
+            # the next phase sends the overlap received in this one
+            self._arrs = list(arrs)
+
+        return arrs
+
+    def wait(self):
+        """Completes the exchange and returns the updated arrays (in the order they were given)"""
+        if not self._active:
+            return tuple(self._arrs)
+
+        if rs.backend == "numpy":
+            self._finish_phase()
+            self._start_phase(1)
+            self._finish_phase()
+            arrs = tuple(self._arrs)
+        else:
+            # mpi4jax has no non-blocking communication, so everything happens here
+            arrs = tuple(self._exchange_blocking(list(self._arrs)))
+
+        self._active = False
+        return arrs
+
+
+def _is_xy_grid(var_grid):
+    return len(var_grid) >= 2 and var_grid[0] in SCATTERED_DIMENSIONS[0] and var_grid[1] in SCATTERED_DIMENSIONS[1]
+
+
+def start_exchange_overlap(arrs, var_grid, cyclic, inplace=False):
+    """Starts exchanging the overlap of several arrays on horizontal grids with all neighbors.
+
+    The overlap of all arrays is packed into a single message per neighbor (and data type),
+    and communication buffers are reused between exchanges. With the NumPy backend, communication
+    is non-blocking, so computations that do not need the overlap can be carried out before
+    calling :meth:`OverlapExchange.wait` on the returned object:
+
+    Example:
+        >>> exchange = start_exchange_overlap((u, v), ["xu", "yu"], cyclic=False)
+        >>> interior = compute_interior(u, v)
+        >>> u, v = exchange.wait()
+
+    Arguments:
+        arrs: Arrays to exchange
+        var_grid: Grid of all arrays, or a sequence of grids (one per array)
+        cyclic: Whether the domain is periodic along x
+        inplace: Whether the received overlap may be written into the given arrays, which
+            must not be used by the caller afterwards
+
+    """
+    arrs = tuple(arrs)
+
+    if var_grid and isinstance(var_grid[0], str):
+        var_grids = [var_grid] * len(arrs)
+    else:
+        var_grids = list(var_grid)
+
+    if len(var_grids) != len(arrs):
+        raise ValueError("got a different number of arrays and grids")
+
+    if not all(_is_xy_grid(grid) for grid in var_grids):
+        raise NotImplementedError("batched overlap exchange is only supported for arrays on x-y grids")
+
+    return OverlapExchange(arrs, cyclic, inplace=inplace)
+
+
+def exchange_overlap_many(arrs, var_grid, cyclic, inplace=False):
+    """Exchanges the overlap of several arrays at once (see :func:`start_exchange_overlap`)"""
+    return start_exchange_overlap(arrs, var_grid, cyclic, inplace=inplace).wait()
+
+
 def _memoize(function):
     cached = {}
 
     @functools.wraps(function)
     def memoized(*args):
-        from mpi4py import MPI
+        if is_local_comm(rs.mpi_comm):
+            cache_args = args
+        else:
+            from mpi4py import MPI
 
-        # MPI Comms are not hashable, so we use the underlying handle instead
-        cache_args = tuple(MPI._handleof(arg) if isinstance(arg, MPI.Comm) else arg for arg in args)
+            # MPI Comms are not hashable, so we use the underlying handle instead
+            cache_args = tuple(MPI._handleof(arg) if isinstance(arg, MPI.Comm) else arg for arg in args)
 
         if cache_args not in cached:
             cached[cache_args] = function(*args)
@@ -387,37 +718,114 @@ def _reduce(arr, op, axis=None):
 
 @dist_context_only(noop_return_arg=0)
 def global_and(arr, axis=None):
-    from mpi4py import MPI
-
-    return _reduce(arr, MPI.LAND, axis=axis)
+    return _reduce(arr, "LAND", axis=axis)
 
 
 @dist_context_only(noop_return_arg=0)
 def global_or(arr, axis=None):
-    from mpi4py import MPI
-
-    return _reduce(arr, MPI.LOR, axis=axis)
+    return _reduce(arr, "LOR", axis=axis)
 
 
 @dist_context_only(noop_return_arg=0)
 def global_max(arr, axis=None):
-    from mpi4py import MPI
-
-    return _reduce(arr, MPI.MAX, axis=axis)
+    return _reduce(arr, "MAX", axis=axis)
 
 
 @dist_context_only(noop_return_arg=0)
 def global_min(arr, axis=None):
-    from mpi4py import MPI
-
-    return _reduce(arr, MPI.MIN, axis=axis)
+    return _reduce(arr, "MIN", axis=axis)
 
 
 @dist_context_only(noop_return_arg=0)
 def global_sum(arr, axis=None):
-    from mpi4py import MPI
+    return _reduce(arr, "SUM", axis=axis)
+
+
+class DeferredReduction:
+    """Result of a reduction that is part of a :class:`ReductionBatch`"""
+
+    __slots__ = ("_value", "_done")
+
+    def __init__(self):
+        self._value = None
+        self._done = False
+
+    @property
+    def value(self):
+        if not self._done:
+            raise RuntimeError("Results of batched reductions are only available after the batch is completed")
+
+        return self._value
+
 
-    return _reduce(arr, MPI.SUM, axis=axis)
+class ReductionBatch:
+    """Collects reductions of scalars and small arrays, so they can be carried out in a single
+    message per reduction operation (see :func:`batched_reductions`)."""
+
+    def __init__(self):
+        # (operation, dtype) -> [(local array, result)]
+        self._pending = {}
+
+    def _add(self, op, arr):
+        from veros.core.operators import numpy as npx
+
+        arr = npx.asarray(arr)
+        result = DeferredReduction()
+        self._pending.setdefault((op, arr.dtype), []).append((arr, result))
+        return result
+
+    def sum(self, arr):
+        return self._add("sum", arr)
+
+    def max(self, arr):
+        return self._add("max", arr)
+
+    def min(self, arr):
+        return self._add("min", arr)
+
+    def complete(self):
+        """Reduces all collected arrays and makes the results available"""
+        from veros.core.operators import numpy as npx
+
+        reduce_funcs = dict(sum=global_sum, max=global_max, min=global_min)
+
+        for (op, _), entries in self._pending.items():
+            packed = npx.concatenate([arr.reshape(-1) for arr, _ in entries])
+            reduced = reduce_funcs[op](packed)
+
+            offset = 0
+            for arr, result in entries:
+                if arr.ndim == 0:
+                    result._value = reduced[offset]
+                else:
+                    result._value = reduced[offset : offset + arr.size].reshape(arr.shape)
+
+                result._done = True
+                offset += arr.size
+
+        self._pending = {}
+
+
+@contextlib.contextmanager
+def batched_reductions():
+    """Context manager that collects global reductions and carries them out on exit,
+    with one message for all reductions of the same type.
+
+    Example:
+        >>> with batched_reductions() as batch:
+        ...     total_volume = batch.sum(npx.sum(volume))
+        ...     max_speed = batch.max(npx.max(npx.abs(u)))
+        >>> total_volume.value / max_speed.value
+
+    """
+    batch = ReductionBatch()
+    yield batch
+    batch.complete()
+
+
+def _get_slice_shape(idx, shape):
+    """Shape of arr[idx] for an array of the given shape"""
+    return tuple(len(range(*s.indices(n))) for s, n in zip(idx, shape)) + tuple(shape[len(idx) :])
 
 
 @dist_context_only(noop_return_arg=2)
@@ -436,17 +844,17 @@ def _gather_1d(nx, ny, arr, dim):
     sendbuf = arr[idx]
 
     if rst.proc_rank == 0:
+        out_shape = ((nx + 4, ny + 4)[dim],) + arr.shape[1:]
         buffer_list = []
         for proc in range(1, rst.proc_num):
             pi = proc_rank_to_index(proc)
             if pi[otherdim] != 0:
                 continue
-            idx_g, idx_l = get_chunk_slices(nx, ny, dim_grid, include_overlap=True, proc_idx=pi)
-            recvbuf = npx.empty_like(arr[idx_l])
+            idx_g, _ = get_chunk_slices(nx, ny, dim_grid, include_overlap=True, proc_idx=pi)
+            recvbuf = npx.empty(_get_slice_shape(idx_g, out_shape), dtype=arr.dtype)
             recvbuf = recv(recvbuf, source=proc, tag=20, comm=rs.mpi_comm)
             buffer_list.append((idx_g, recvbuf))
 
-        out_shape = ((nx + 4, ny + 4)[dim],) + arr.shape[1:]
         out = npx.empty(out_shape, dtype=arr.dtype)
         out = update(out, at[gidx], sendbuf)
 
@@ -472,14 +880,14 @@ def _gather_xy(nx, ny, arr):
     sendbuf = arr[idx]
 
     if rst.proc_rank == 0:
+        out_shape = (nx + 4, ny + 4) + arr.shape[2:]
         buffer_list = []
         for proc in range(1, rst.proc_num):
-            idx_g, idx_l = get_chunk_slices(nx, ny, dim_grid, include_overlap=True, proc_idx=proc_rank_to_index(proc))
-            recvbuf = npx.empty_like(arr[idx_l])
+            idx_g, _ = get_chunk_slices(nx, ny, dim_grid, include_overlap=True, proc_idx=proc_rank_to_index(proc))
+            recvbuf = npx.empty(_get_slice_shape(idx_g, out_shape), dtype=arr.dtype)
             recvbuf = recv(recvbuf, source=proc, tag=30, comm=rs.mpi_comm)
             buffer_list.append((idx_g, recvbuf))
 
-        out_shape = (nx + 4, ny + 4) + arr.shape[2:]
         out = npx.empty(out_shape, dtype=arr.dtype)
         out = update(out, at[gidx], sendbuf)
 
@@ -635,3 +1043,43 @@ def barrier():
 @dist_context_only
 def abort():
     rs.mpi_comm.Abort()
+
+
+SEQUENTIAL_ACCESS_TAG = 60
+
+
+def uses_sequential_io():
+    """Whether processes have to access files one after another (parallel HDF5 requires MPI)"""
+    return rst.proc_num > 1 and is_local_comm(rs.mpi_comm)
+
+
+def get_sequential_mode(mode):
+    """File mode to use in sequential access, where only the first process may create files"""
+    if rst.proc_rank == 0 or mode in ("r", "r+"):
+        return mode
+
+    return "r+"
+
+
+@contextlib.contextmanager
+def sequential_access():
+    """Lets processes enter this context one after another, in order of their rank"""
+    import numpy
+
+    if rst.proc_num == 1 or not CURRENT_CONTEXT.is_dist_safe:
+        yield
+        return
+
+    token = numpy.zeros(1, dtype="int8")
+
+    if rst.proc_rank > 0:
+        recv(token, source=rst.proc_rank - 1, comm=rs.mpi_comm, tag=SEQUENTIAL_ACCESS_TAG)
+
+    try:
+        yield
+    finally:
+        if rst.proc_rank + 1 < rst.proc_num:
+            send(token, dest=rst.proc_rank + 1, comm=rs.mpi_comm, tag=SEQUENTIAL_ACCESS_TAG)
+
+    # the first process must not enter again before the last one is done
+    barrier()
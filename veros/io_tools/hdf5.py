@@ -10,6 +10,16 @@ def threaded_io(filepath, mode):
     If using IO threads, start a new thread to write the HDF5 data to disk.
     """
     import h5py
+    from veros import distributed
+
+    if distributed.uses_sequential_io():
+        with distributed.sequential_access():
+            h5file = h5py.File(filepath, distributed.get_sequential_mode(mode))
+            try:
+                yield h5file
+            finally:
+                h5file.close()
+        return
 
     if runtime_settings.use_io_threads:
         _wait_for_disk(filepath)
@@ -56,12 +56,15 @@ def initialize_file(state, ncfile, extra_dimensions=None, create_time_dimension=
             var = variables.Variable(dim, (dim,), time_dependent=False)
             var_data = np.arange(dimensions[dim])
 
-        dimsize = variables.get_shape(dimensions, var.dims[::-1], include_ghosts=False, local=False)[0]
-        ncfile.dimensions[dim] = dimsize
-        initialize_variable(state, dim, var, ncfile)
+        # with sequential file access, other processes may have initialized the file already
+        if dim not in ncfile.dimensions:
+            dimsize = variables.get_shape(dimensions, var.dims[::-1], include_ghosts=False, local=False)[0]
+            ncfile.dimensions[dim] = dimsize
+            initialize_variable(state, dim, var, ncfile)
+
         write_variable(state, dim, var, var_data, ncfile)
 
-    if create_time_dimension:
+    if create_time_dimension and "Time" not in ncfile.dimensions:
         ncfile.dimensions["Time"] = None
         nc_dim_var_time = ncfile.create_variable("Time", ("Time",), float)
         nc_dim_var_time.attrs.update(
@@ -88,10 +91,7 @@ def initialize_variable(state, key, var, ncfile):
     if rs.hdf5_gzip_compression and runtime_state.proc_num == 1:
         kwargs.update(compression="gzip", compression_opts=1)
 
-    chunksize = [
-        variables.get_shape(state.dimensions, (d,), local=True, include_ghosts=False)[0] if d in state.dimensions else 1
-        for d in dims
-    ]
+    chunksize = variables.get_chunk_shape(state.dimensions, dims)
 
     dtype = var.dtype
     if dtype is None:
@@ -108,6 +108,10 @@ def initialize_variable(state, key, var, ncfile):
 
 
 def advance_time(time_value, ncfile):
+    if distributed.uses_sequential_io() and runtime_state.proc_rank > 0:
+        # time was already advanced by the first process
+        return
+
     current_time_step = len(ncfile.variables["Time"])
     ncfile.resize_dimension("Time", current_time_step + 1)
     ncfile.variables["Time"][current_time_step] = time_value
@@ -149,15 +153,24 @@ def threaded_io(filepath, mode):
     import h5py
     import h5netcdf
 
-    if rs.use_io_threads:
-        _wait_for_disk(filepath)
-        _io_locks[filepath].clear()
-
     kwargs = dict()
 
     if int(h5py.__version__.split(".")[0]) >= 3:
         kwargs.update(decode_vlen_strings=True)
 
+    if distributed.uses_sequential_io():
+        with distributed.sequential_access():
+            nc_dataset = h5netcdf.File(filepath, distributed.get_sequential_mode(mode), **kwargs)
+            try:
+                yield nc_dataset
+            finally:
+                nc_dataset.close()
+        return
+
+    if rs.use_io_threads:
+        _wait_for_disk(filepath)
+        _io_locks[filepath].clear()
+
     if runtime_state.proc_num > 1:
         kwargs.update(driver="mpio", comm=rs.mpi_comm)
 
@@ -0,0 +1,495 @@
+"""Shared-memory communicator for distributed runs on a single node without MPI.
+
+:class:`LocalComm` implements the subset of the ``mpi4py.MPI.Comm`` interface that Veros uses.
+Processes are started by :func:`launch` and exchange messages through byte ring buffers in
+shared memory (one per ordered pair of processes), so sending a message is a memory copy.
+
+Messages are buffered, i.e., blocking sends return as soon as the message has been copied
+to shared memory, and waiting processes keep draining incoming messages so that large
+messages can not deadlock.
+"""
+
+import os
+import time
+import pickle
+import struct
+import zlib
+import collections
+
+import numpy as np
+
+ANY_TAG = -1
+
+# tags below 0 are reserved for collective operations
+_COLLECTIVE_TAG = -2
+
+DEFAULT_CHANNEL_SIZE = 2 * 1024**2
+
+# context, tag, payload size
+_HEADER = struct.Struct("<qqq")
+_CONTROL_SIZE = 64
+_COUNTER_SIZE = 64
+
+REDUCTION_OPS = {
+    "SUM": np.add,
+    "MAX": np.maximum,
+    "MIN": np.minimum,
+    "LAND": np.logical_and,
+    "LOR": np.logical_or,
+}
+
+
+def _get_op_name(op):
+    if isinstance(op, str):
+        return op
+
+    # accept mpi4py ops for compatibility with code written for MPI
+    from mpi4py import MPI
+
+    for name in REDUCTION_OPS:
+        if op == getattr(MPI, name):
+            return name
+
+    raise ValueError(f"unsupported reduction operation {op}")
+
+
+def _as_bytes(arr):
+    arr = np.ascontiguousarray(arr)
+    return arr.reshape(-1).view(np.uint8)
+
+
+class _Channel:
+    """Single-producer, single-consumer byte ring buffer in shared memory"""
+
+    def __init__(self, buf, lock):
+        self._counters = np.ndarray(2, dtype=np.uint64, buffer=buf[:_COUNTER_SIZE])
+        self._data = np.ndarray(len(buf) - _COUNTER_SIZE, dtype=np.uint8, buffer=buf[_COUNTER_SIZE:])
+        self._capacity = self._data.size
+        # the lock provides memory ordering between data and counter updates
+        self._lock = lock
+
+    def _get_counters(self):
+        with self._lock:
+            return int(self._counters[0]), int(self._counters[1])
+
+    def write(self, data):
+        """Copies as many bytes as possible into the ring, returns the number of bytes written"""
+        head, tail = self._get_counters()
+        nbytes = min(self._capacity - (tail - head), data.size)
+        if nbytes == 0:
+            return 0
+
+        start = tail % self._capacity
+        first = min(nbytes, self._capacity - start)
+        self._data[start : start + first] = data[:first]
+        self._data[: nbytes - first] = data[first:nbytes]
+
+        with self._lock:
+            self._counters[1] = tail + nbytes
+
+        return nbytes
+
+    def read(self, out):
+        """Copies as many bytes as available into out, returns the number of bytes read"""
+        head, tail = self._get_counters()
+        nbytes = min(tail - head, out.size)
+        if nbytes == 0:
+            return 0
+
+        start = head % self._capacity
+        first = min(nbytes, self._capacity - start)
+        out[:first] = self._data[start : start + first]
+        out[first:nbytes] = self._data[: nbytes - first]
+
+        with self._lock:
+            self._counters[0] = head + nbytes
+
+        return nbytes
+
+
+class _IncomingMessage:
+    __slots__ = ("header", "header_filled", "payload", "payload_filled")
+
+    def __init__(self):
+        self.header = np.empty(_HEADER.size, dtype=np.uint8)
+        self.header_filled = 0
+        self.payload = None
+        self.payload_filled = 0
+
+
+class _Transport:
+    """Moves messages between the ring buffers of this process and local queues"""
+
+    def __init__(self, shm, locks, rank, size, channel_size):
+        self.rank = rank
+        self.size = size
+        self._shm = shm
+        self._abort_flag = np.ndarray(1, dtype=np.int64, buffer=shm.buf[:8])
+
+        self._outbox = {}
+        self._inbox = {}
+        for other in range(size):
+            if other == rank:
+                continue
+            outbuf = _get_channel_buffer(shm, rank, other, size, channel_size)
+            self._outbox[other] = _Channel(outbuf, locks[rank][other])
+            inbuf = _get_channel_buffer(shm, other, rank, size, channel_size)
+            self._inbox[other] = _Channel(inbuf, locks[other][rank])
+
+        # messages that still need to be copied to shared memory, per destination
+        self._pending_sends = {other: collections.deque() for other in self._outbox}
+        # partially received message per source
+        self._incoming = {other: _IncomingMessage() for other in self._inbox}
+        # fully received messages per source (ordered)
+        self._received = {other: collections.deque() for other in self._inbox}
+        # messages sent to this process itself
+        self._received[rank] = collections.deque()
+
+    def post_send(self, data, dest, context, tag):
+        """Queues a message, returns a handle that is empty once the message is in shared memory"""
+        if dest == self.rank:
+            self._received[dest].append((context, tag, data.copy()))
+            return collections.deque()
+
+        header = np.frombuffer(_HEADER.pack(context, tag, data.size), dtype=np.uint8)
+        pending = collections.deque([header, data])
+        self._pending_sends[dest].append(pending)
+        self.progress()
+        return pending
+
+    def match(self, source, context, tag):
+        """Removes and returns the payload of the first matching received message (or None)"""
+        queue = self._received[source]
+        for i, (msg_context, msg_tag, payload) in enumerate(queue):
+            if msg_context == context and (tag == ANY_TAG or msg_tag == tag):
+                del queue[i]
+                return payload
+
+        return None
+
+    def progress(self):
+        """Makes progress on all pending transfers, returns whether anything happened"""
+        active = False
+
+        for dest, sends in self._pending_sends.items():
+            channel = self._outbox[dest]
+
+            while sends:
+                pending = sends[0]
+
+                while pending:
+                    chunk = pending[0]
+                    nbytes = channel.write(chunk)
+                    active = active or nbytes > 0
+
+                    if nbytes < chunk.size:
+                        pending[0] = chunk[nbytes:]
+                        break
+
+                    pending.popleft()
+
+                if pending:
+                    # ring is full
+                    break
+
+                sends.popleft()
+
+        for source, channel in self._inbox.items():
+            while self._receive_from(source, channel):
+                active = True
+
+        return active
+
+    def _receive_from(self, source, channel):
+        msg = self._incoming[source]
+
+        if msg.header_filled < _HEADER.size:
+            nbytes = channel.read(msg.header[msg.header_filled :])
+            msg.header_filled += nbytes
+            if msg.header_filled < _HEADER.size:
+                return nbytes > 0
+
+            _, _, payload_size = _HEADER.unpack(msg.header.tobytes())
+            msg.payload = np.empty(payload_size, dtype=np.uint8)
+
+        nbytes = channel.read(msg.payload[msg.payload_filled :])
+        msg.payload_filled += nbytes
+
+        if msg.payload_filled < msg.payload.size:
+            return nbytes > 0
+
+        context, tag, _ = _HEADER.unpack(msg.header.tobytes())
+        self._received[source].append((context, tag, msg.payload))
+        self._incoming[source] = _IncomingMessage()
+        return True
+
+    def wait_until(self, condition):
+        idle_count = 0
+
+        while not condition():
+            if self.progress():
+                idle_count = 0
+                continue
+
+            if self._abort_flag[0]:
+                raise RuntimeError("Another process aborted the run")
+
+            idle_count += 1
+            # back off gradually while waiting for other processes
+            time.sleep(min(1e-6 * idle_count, 1e-3))
+
+    def abort(self, errorcode):
+        self._abort_flag[0] = max(int(errorcode), 1)
+
+
+def _get_channel_buffer(shm, source, dest, size, channel_size):
+    channel_idx = source * size + dest
+    offset = _CONTROL_SIZE + channel_idx * (_COUNTER_SIZE + channel_size)
+    return shm.buf[offset : offset + _COUNTER_SIZE + channel_size]
+
+
+class LocalRequest:
+    """Handle of a non-blocking operation, like ``mpi4py.MPI.Request``"""
+
+    def __init__(self, transport, is_done, finalize=None):
+        self._transport = transport
+        self._is_done = is_done
+        self._finalize = finalize
+        self._completed = False
+
+    def Test(self):
+        if not self._completed:
+            self._transport.progress()
+            self._completed = self._is_done()
+            if self._completed and self._finalize is not None:
+                self._finalize()
+
+        return self._completed
+
+    def Wait(self):
+        self._transport.wait_until(self.Test)
+
+    @staticmethod
+    def Waitall(requests):
+        for request in requests:
+            request.Wait()
+
+
+class LocalComm:
+    """Communicator between processes started by :func:`launch`, like ``mpi4py.MPI.Comm``"""
+
+    def __init__(self, transport, ranks, context=0):
+        self._transport = transport
+        # ranks of the members of this communicator in the transport
+        self._ranks = tuple(ranks)
+        self._context = context
+        self._rank = self._ranks.index(transport.rank)
+        self._num_splits = 0
+
+    def Get_rank(self):
+        return self._rank
+
+    def Get_size(self):
+        return len(self._ranks)
+
+    # point-to-point communication
+
+    def Isend(self, buf, dest, tag=0):
+        pending = self._transport.post_send(_as_bytes(buf), self._ranks[dest], self._context, tag)
+        return LocalRequest(self._transport, lambda: not pending)
+
+    def Send(self, buf, dest, tag=0):
+        self.Isend(buf, dest, tag=tag).Wait()
+
+    def Irecv(self, buf, source, tag=ANY_TAG):
+        payload = None
+
+        def is_done():
+            nonlocal payload
+            payload = self._transport.match(self._ranks[source], self._context, tag)
+            return payload is not None
+
+        def finalize():
+            out = buf.reshape(-1).view(np.uint8)
+            if payload.size != out.size:
+                raise ValueError(f"received message of {payload.size} bytes, but buffer has {out.size} bytes")
+            out[...] = payload
+
+        return LocalRequest(self._transport, is_done, finalize)
+
+    def Recv(self, buf, source, tag=ANY_TAG):
+        self.Irecv(buf, source, tag=tag).Wait()
+
+    def Sendrecv(self, sendbuf, dest, sendtag=0, recvbuf=None, source=None, recvtag=ANY_TAG):
+        send_request = self.Isend(sendbuf, dest, tag=sendtag)
+        self.Recv(recvbuf, source, tag=recvtag)
+        send_request.Wait()
+
+    def _send_bytes(self, data, dest, tag=_COLLECTIVE_TAG):
+        pending = self._transport.post_send(data, self._ranks[dest], self._context, tag)
+        return LocalRequest(self._transport, lambda: not pending)
+
+    def _recv_bytes(self, source, tag=_COLLECTIVE_TAG):
+        payload = []
+
+        def is_done():
+            msg = self._transport.match(self._ranks[source], self._context, tag)
+            if msg is not None:
+                payload.append(msg)
+            return bool(payload)
+
+        self._transport.wait_until(is_done)
+        return payload[0]
+
+    # collective communication (rooted at rank 0 of the communicator)
+
+    def _gather_bytes(self, data):
+        if self._rank == 0:
+            return [data] + [self._recv_bytes(source) for source in range(1, self.Get_size())]
+
+        self._send_bytes(data, 0).Wait()
+        return None
+
+    def _bcast_bytes(self, data, root=0):
+        if self._rank == root:
+            requests = [self._send_bytes(data, dest) for dest in range(self.Get_size()) if dest != root]
+            LocalRequest.Waitall(requests)
+            return data
+
+        return self._recv_bytes(root)
+
+    def Allreduce(self, sendbuf, recvbuf, op):
+        reduce_op = REDUCTION_OPS[_get_op_name(op)]
+        sendbuf = np.ascontiguousarray(sendbuf)
+        contributions = self._gather_bytes(_as_bytes(sendbuf))
+
+        if self._rank == 0:
+            # reduce in rank order, so results are reproducible
+            arrs = [c.view(sendbuf.dtype).reshape(sendbuf.shape) for c in contributions]
+            result = arrs[0].copy()
+            for arr in arrs[1:]:
+                result = reduce_op(result, arr).astype(sendbuf.dtype)
+            data = _as_bytes(result)
+        else:
+            data = None
+
+        data = self._bcast_bytes(data)
+        recvbuf.reshape(-1).view(np.uint8)[...] = data
+
+    def Bcast(self, buf, root=0):
+        data = self._bcast_bytes(_as_bytes(buf) if self._rank == root else None, root=root)
+        if self._rank != root:
+            buf.reshape(-1).view(np.uint8)[...] = data
+
+    def bcast(self, obj, root=0):
+        data = None
+        if self._rank == root:
+            data = np.frombuffer(pickle.dumps(obj), dtype=np.uint8)
+
+        data = self._bcast_bytes(data, root=root)
+        return pickle.loads(data.tobytes())
+
+    def allgather(self, obj):
+        data = np.frombuffer(pickle.dumps(obj), dtype=np.uint8)
+        contributions = self._gather_bytes(data)
+
+        if self._rank == 0:
+            result = [pickle.loads(c.tobytes()) for c in contributions]
+        else:
+            result = None
+
+        return self.bcast(result)
+
+    def Barrier(self):
+        empty = np.empty(0, dtype=np.uint8)
+        self._gather_bytes(empty)
+        self._bcast_bytes(empty)
+
+    barrier = Barrier
+
+    def Split(self, color=0, key=0):
+        members = self.allgather((color, key, self._rank))
+        self._num_splits += 1
+
+        group = sorted((member_key, rank) for member_color, member_key, rank in members if member_color == color)
+        context = zlib.crc32(f"{self._context}/{self._num_splits}/{color}".encode())
+        return LocalComm(self._transport, [self._ranks[rank] for _, rank in group], context=context)
+
+    def Abort(self, errorcode=1):
+        self._transport.abort(errorcode)
+        os._exit(errorcode)
+
+    def Free(self):
+        pass
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} rank {self._rank} of {self.Get_size()}>"
+
+
+def _run_worker(shm_name, locks, rank, size, channel_size, target, args, kwargs):
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    comm = LocalComm(_Transport(shm, locks, rank, size, channel_size), range(size))
+
+    try:
+        target(comm, *args, **kwargs)
+    except BaseException:
+        # make other processes stop waiting for this one
+        comm._transport.abort(1)
+        raise
+
+
+def launch(num_processes, target, *args, channel_size=DEFAULT_CHANNEL_SIZE, **kwargs):
+    """Runs ``target(comm, *args, **kwargs)`` on num_processes new processes.
+
+    ``comm`` is a :class:`LocalComm` connecting all processes. Raises if any process fails.
+    """
+    import multiprocessing
+    from multiprocessing import shared_memory
+
+    ctx = multiprocessing.get_context("spawn")
+
+    num_channels = num_processes * num_processes
+    shm = shared_memory.SharedMemory(create=True, size=_CONTROL_SIZE + num_channels * (_COUNTER_SIZE + channel_size))
+
+    try:
+        # new shared memory is zero-initialized, so all channels start out empty
+        locks = [[ctx.Lock() for _ in range(num_processes)] for _ in range(num_processes)]
+
+        processes = [
+            ctx.Process(
+                target=_run_worker,
+                args=(shm.name, locks, rank, num_processes, channel_size, target, args, kwargs),
+                name=f"veros-local-{rank}",
+            )
+            for rank in range(num_processes)
+        ]
+
+        for proc in processes:
+            proc.start()
+
+        failed = []
+        while processes:
+            for proc in list(processes):
+                proc.join(timeout=0.1)
+                if proc.exitcode is None:
+                    continue
+
+                processes.remove(proc)
+                if proc.exitcode != 0:
+                    failed.append(proc.name)
+
+            if failed:
+                # other processes would wait forever
+                for proc in processes:
+                    proc.terminate()
+                    proc.join()
+                processes = []
+
+        if failed:
+            raise RuntimeError(f"Process(es) {', '.join(failed)} failed")
+
+    finally:
+        shm.close()
+        shm.unlink()
@@ -41,8 +41,8 @@ class LoggingProgressBar:
     def __exit__(self, *args, **kwargs):
         pass
 
-    def advance_time(self, amount, *args, **kwargs):
-        self._iteration += 1
+    def advance_time(self, amount, iterations=1):
+        self._iteration += iterations
         self._time += amount
         self.flush()
 
@@ -153,8 +153,8 @@ class FancyProgressBar:
         logs.setup_logging(loglevel=rs.loglevel)
         self._pbar.__exit__(*args, **kwargs)
 
-    def advance_time(self, amount):
-        self._iteration += 1
+    def advance_time(self, amount, iterations=1):
+        self._iteration += iterations
         self._time += amount
         self.flush()
 
@@ -1,10 +1,11 @@
 import os
+import collections
 
 from veros import logger, runtime_settings, runtime_state
 from veros.io_tools import hdf5 as h5tools
 from veros.signals import do_not_disturb
 from veros.distributed import get_chunk_slices, exchange_overlap
-from veros.variables import get_shape
+from veros.variables import get_shape, get_chunk_shape
 
 
 def read_from_h5(dimensions, var_meta, infile, groupname, enable_cyclic_x):
@@ -49,14 +50,7 @@ def write_to_h5(dimensions, var_meta, var_data, outfile, groupname, attributes=N
         )
 
         if var_dims:
-            chunksize = []
-            for d in var_dims:
-                if d in dimensions:
-                    chunksize.append(get_shape(dimensions, (d,), local=True, include_ghosts=False)[0])
-                else:
-                    chunksize.append(1)
-
-            kwargs.update(chunks=tuple(chunksize))
+            kwargs.update(chunks=get_chunk_shape(dimensions, var_dims))
 
             if runtime_settings.hdf5_gzip_compression and runtime_state.proc_num == 1:
                 kwargs.update(compression="gzip", compression_opts=1)
@@ -74,6 +68,9 @@ def read_restart(state):
     if not settings.restart_input_filename:
         return
 
+    # the restart file might still be written by this process
+    wait_for_restarts()
+
     if runtime_settings.force_overwrite:
         raise RuntimeError("To prevent data loss, force_overwrite cannot be used in restart runs")
 
@@ -127,6 +124,121 @@ def read_restart(state):
     return state
 
 
+def _get_restart_groups(state):
+    """Returns (group name, dimensions, variable metadata, variable data) of everything in a restart file"""
+    vs = state.variables
+    restart_vars = {var: meta for var, meta in state.var_meta.items() if meta.write_to_restart and meta.active}
+    restart_data = {var: getattr(vs, var) for var in restart_vars}
+
+    # core restart
+    restart_groups = [("core", state.dimensions, restart_vars, restart_data)]
+
+    # diagnostic restarts
+    for diag_name, diagnostic in state.diagnostics.items():
+        if not diagnostic.var_meta:
+            # nothing to do
+            continue
+
+        dimensions = dict(state.dimensions)
+        if diagnostic.extra_dimensions:
+            dimensions.update(diagnostic.extra_dimensions)
+
+        restart_vars = {var: meta for var, meta in diagnostic.var_meta.items() if meta.write_to_restart and meta.active}
+        restart_data = {var: getattr(diagnostic.variables, var) for var in restart_vars}
+        restart_groups.append((diag_name, dimensions, restart_vars, restart_data))
+
+    return restart_groups
+
+
+# restart files that are being written in the background (oldest first)
+_pending_restarts = collections.deque()
+
+# host buffers of written restarts that can be reused for new snapshots
+_free_snapshot_buffers = []
+
+_restart_writer = None
+
+
+def _snapshot_to_host(arr, buffer):
+    import numpy as onp
+
+    arr = onp.asarray(arr)
+
+    if buffer is None or buffer.shape != arr.shape or buffer.dtype != arr.dtype:
+        return onp.array(arr)
+
+    onp.copyto(buffer, arr)
+    return buffer
+
+
+def _snapshot_restart_groups(restart_groups):
+    """Copies all restart data to host buffers, so the model can continue while they are written"""
+    buffers = _free_snapshot_buffers.pop() if _free_snapshot_buffers else {}
+
+    snapshot = []
+    for groupname, dimensions, var_meta, var_data in restart_groups:
+        host_data = {key: _snapshot_to_host(val, buffers.get((groupname, key))) for key, val in var_data.items()}
+        snapshot.append((groupname, dimensions, var_meta, host_data))
+
+    return snapshot
+
+
+def _write_restart_file(restart_filename, restart_groups):
+    """Writes a restart file to a temporary location, syncs it to disk, and moves it into place"""
+    import h5py
+
+    tmp_filename = f"{restart_filename}.tmp"
+
+    with h5py.File(tmp_filename, "w") as outfile:
+        for groupname, dimensions, var_meta, var_data in restart_groups:
+            write_to_h5(dimensions, var_meta, var_data, outfile, groupname)
+
+    with open(tmp_filename, "rb") as f:
+        os.fsync(f.fileno())
+
+    # atomic, so there is never an incomplete file under the final name
+    os.replace(tmp_filename, restart_filename)
+    return restart_groups
+
+
+def _init_restart_writer():
+    from veros.routines import CURRENT_CONTEXT, RoutineStack
+
+    # routine context is thread-local, so the writer thread needs its own
+    CURRENT_CONTEXT.is_dist_safe = True
+    CURRENT_CONTEXT.routine_stack = RoutineStack()
+    CURRENT_CONTEXT.mpi4jax_token = None
+
+
+def wait_for_restarts(max_pending=0):
+    """Blocks until at most ``max_pending`` restart files are still being written in the background.
+
+    Errors that occurred while writing are raised here.
+    """
+    while _pending_restarts and (len(_pending_restarts) > max_pending or _pending_restarts[0].done()):
+        restart_groups = _pending_restarts.popleft().result()
+        _free_snapshot_buffers.append(
+            {(groupname, key): val for groupname, _, _, var_data in restart_groups for key, val in var_data.items()}
+        )
+
+
+def _write_restart_async(restart_filename, restart_groups):
+    global _restart_writer
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # make room for the new restart first, so snapshot buffers can be reused
+    wait_for_restarts(max_pending=max(runtime_settings.max_pending_restarts, 1) - 1)
+
+    if _restart_writer is None:
+        _restart_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="veros-restart", initializer=_init_restart_writer
+        )
+
+    snapshot = _snapshot_restart_groups(restart_groups)
+    _pending_restarts.append(_restart_writer.submit(_write_restart_file, restart_filename, snapshot))
+
+
 @do_not_disturb
 def write_restart(state, force=False):
     vs = state.variables
@@ -151,25 +263,13 @@ def write_restart(state, force=False):
 
     logger.info(f"Writing restart file {restart_filename}")
 
-    with h5tools.threaded_io(restart_filename, "w") as outfile:
-        # core restart
-        vs = state.variables
-        restart_vars = {var: meta for var, meta in state.var_meta.items() if meta.write_to_restart and meta.active}
-        restart_data = {var: getattr(vs, var) for var in restart_vars}
-        write_to_h5(state.dimensions, restart_vars, restart_data, outfile, "core")
-
-        # diagnostic restarts
-        for diag_name, diagnostic in state.diagnostics.items():
-            if not diagnostic.var_meta:
-                # nothing to do
-                continue
+    restart_groups = _get_restart_groups(state)
 
-            dimensions = dict(state.dimensions)
-            if diagnostic.extra_dimensions:
-                dimensions.update(diagnostic.extra_dimensions)
+    # parallel HDF5 output is collective, so it is not moved to a background thread
+    if runtime_settings.async_restarts and runtime_state.proc_num == 1:
+        _write_restart_async(restart_filename, restart_groups)
+        return
 
-            restart_vars = {
-                var: meta for var, meta in diagnostic.var_meta.items() if meta.write_to_restart and meta.active
-            }
-            restart_data = {var: getattr(diagnostic.variables, var) for var in restart_vars}
-            write_to_h5(dimensions, restart_vars, restart_data, outfile, diag_name)
+    with h5tools.threaded_io(restart_filename, "w") as outfile:
+        for groupname, dimensions, var_meta, var_data in restart_groups:
+            write_to_h5(dimensions, var_meta, var_data, outfile, groupname)
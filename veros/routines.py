@@ -1,11 +1,13 @@
+import copy
 import functools
+import collections
 import inspect
 import threading
 from contextlib import ExitStack, contextmanager
 
 from veros import logger
 
-from veros.state import VerosState
+from veros.state import VerosState, VerosVariables, PrunedVariables, PrunedVariableAccess
 
 
 # stack helpers
@@ -236,7 +238,7 @@ class VerosRoutine:
 # kernel
 
 
-def veros_kernel(function=None, *, static_args=()):
+def veros_kernel(function=None, *, static_args=(), donate_outputs=False):
     """Decorator that marks a function as a kernel that can be JIT compiled if supported
     by the backend.
 
@@ -245,6 +247,10 @@ def veros_kernel(function=None, *, static_args=()):
 
     Parameters:
         static_args (Tuple[str]): Names of kernel arguments that should be static.
+        donate_outputs (bool): Whether the buffers of variables that are returned as part of a
+            ``KernelOutput`` may be re-used for the outputs (JAX only). Only use this if the caller
+            replaces these variables by the returned values right away, since the old values
+            are invalidated.
 
     Example:
         >>> from veros import veros_kernel, KernelOutput
@@ -258,7 +264,7 @@ def veros_kernel(function=None, *, static_args=()):
     """
 
     def inner_decorator(function):
-        kernel = VerosKernel(function, static_args=static_args)
+        kernel = VerosKernel(function, static_args=static_args, donate_outputs=donate_outputs)
         kernel = functools.wraps(function)(kernel)
         return kernel
 
@@ -271,7 +277,7 @@ def veros_kernel(function=None, *, static_args=()):
 class VerosKernel:
     """Do not instantiate directly!"""
 
-    def __init__(self, function, static_args=()):
+    def __init__(self, function, static_args=(), donate_outputs=False):
         """Do some parameter introspection."""
 
         # make sure function signature is in the form we need
@@ -303,6 +309,15 @@ class VerosKernel:
             self.static_argnums.append(arg_index)
 
         self.function = function
+        self.is_compiled = False
+
+        # variables accessed by the kernel for given static arguments (None: all)
+        self.accessed_variables = {}
+
+        # variables returned by the kernel whose input buffers can be re-used
+        self.donate_outputs = donate_outputs
+        self.donated_variables = {}
+        self._donating_function = None
 
     def __call__(self, *args, **kwargs):
         from veros import runtime_settings, runtime_state
@@ -311,30 +326,31 @@ class VerosKernel:
         inject_tokens = runtime_settings.backend == "jax" and runtime_state.proc_num > 1
 
         # apply JIT
-        if runtime_settings.backend == "jax":
+        if runtime_settings.backend == "jax" and not self.is_compiled:
             import jax
 
-            CompiledFunction = type(jax.jit(lambda: None))
+            if inject_tokens:
+                function = self.function
 
-            if not isinstance(self.function, CompiledFunction):
-                if inject_tokens:
-                    function = self.function
+                @functools.wraps(function)
+                def token_wrapper(*args):
+                    inputs = args[:-1]
+                    token = args[-1]
+                    CURRENT_CONTEXT.mpi4jax_token = token
+                    out = function(*inputs)
+                    token = CURRENT_CONTEXT.mpi4jax_token
+                    return out, token
 
-                    @functools.wraps(function)
-                    def token_wrapper(*args):
-                        inputs = args[:-1]
-                        token = args[-1]
-                        CURRENT_CONTEXT.mpi4jax_token = token
-                        out = function(*inputs)
-                        token = CURRENT_CONTEXT.mpi4jax_token
-                        return out, token
+                if CURRENT_CONTEXT.mpi4jax_token is None:
+                    CURRENT_CONTEXT.mpi4jax_token = jax.lax.create_token()
 
-                    if CURRENT_CONTEXT.mpi4jax_token is None:
-                        CURRENT_CONTEXT.mpi4jax_token = jax.lax.create_token()
+                self.function = token_wrapper
 
-                    self.function = token_wrapper
+            if self.donate_outputs:
+                self._donating_function = _jit_with_donated_variables(self.function, self.static_argnums)
 
-                self.function = jax.jit(self.function, static_argnums=self.static_argnums)
+            self.function = jax.jit(self.function, static_argnums=self.static_argnums)
+            self.is_compiled = True
 
         # JAX only accepts positional args when using static_argnums
         # so convert everything to positional for consistency
@@ -368,7 +384,7 @@ class VerosKernel:
                 args.append(CURRENT_CONTEXT.mpi4jax_token)
 
             with enter_routine(self.name, self, timer):
-                out = self.function(*args)
+                out = self._call_maybe_pruned(args, veros_state)
 
                 if runtime_settings.profile_mode:
                     flush()
@@ -379,10 +395,177 @@ class VerosKernel:
 
         return out
 
+    def _use_pruning(self, veros_state):
+        from veros import runtime_settings
+
+        return (
+            runtime_settings.backend == "jax"
+            and runtime_settings.prune_kernel_inputs
+            and veros_state is not None
+            # only prune top-level calls (kernels called from traced code see the variables of the caller)
+            and type(veros_state._variables) is VerosVariables
+        )
+
+    def _use_donation(self, veros_state):
+        from veros import runtime_settings
+
+        return (
+            self.donate_outputs
+            and runtime_settings.backend == "jax"
+            and veros_state is not None
+            # buffers can only be donated by top-level calls
+            and type(veros_state._variables) is VerosVariables
+        )
+
+    def _record_accessed_variables(self, args, veros_state):
+        """Traces the kernel (without compiling it) to find out which variables it reads or writes"""
+        import jax
+        from veros.state import RecordingVariables, VariableRecorder
+
+        recorder = VariableRecorder()
+        recording_state = copy.copy(veros_state)
+        recording_state._variables = RecordingVariables(veros_state._variables, recorder)
+
+        args = [recording_state if arg is veros_state else arg for arg in args]
+        dynamic_argnums = [i for i in range(len(args)) if i not in self.static_argnums]
+
+        def call_with_static_args(*dynamic_args):
+            full_args = list(args)
+            for i, arg in zip(dynamic_argnums, dynamic_args):
+                full_args[i] = arg
+            return self.function(*full_args)
+
+        mpi4jax_token = CURRENT_CONTEXT.mpi4jax_token
+        try:
+            out = jax.eval_shape(call_with_static_args, *(args[i] for i in dynamic_argnums))
+        except Exception:
+            # errors are raised again by the actual call
+            return None, ()
+        finally:
+            CURRENT_CONTEXT.mpi4jax_token = mpi4jax_token
+
+        fields = veros_state._variables.fields()
+        accessed_variables = tuple(field for field in fields if field in recorder.accessed)
+
+        output_variables = _get_kernel_output_fields(out)
+        donated_variables = tuple(field for field in accessed_variables if field in output_variables)
+
+        return accessed_variables, donated_variables
+
+    def _call_maybe_pruned(self, args, veros_state):
+        """Calls the kernel, passing only the variables it accesses (JAX only).
+
+        This makes the cost of flattening the inputs independent of the total number of variables.
+        If the kernel donates its outputs, the buffers of returned variables are passed separately
+        so they can be re-used by XLA.
+        """
+        use_pruning = self._use_pruning(veros_state)
+        use_donation = self._use_donation(veros_state)
+
+        if not use_pruning and not use_donation:
+            return self.function(*args)
+
+        # records are kept across settings changes; if they make the kernel access
+        # additional variables, this is detected during tracing and the kernel is recorded again
+        key = tuple(args[i] for i in self.static_argnums)
+
+        if key not in self.accessed_variables:
+            self._record(key, args, veros_state)
+
+        mpi4jax_token = CURRENT_CONTEXT.mpi4jax_token
+
+        for is_retry in (False, True):
+            accessed_variables = self.accessed_variables[key]
+
+            if accessed_variables is None:
+                return self.function(*args)
+
+            if not use_pruning:
+                accessed_variables = veros_state._variables.fields()
+
+            donated_variables = ()
+            if use_donation:
+                donated_variables = _get_donatable_variables(veros_state._variables, self.donated_variables[key])
+
+            passed_variables = tuple(field for field in accessed_variables if field not in donated_variables)
+
+            pruned_state = copy.copy(veros_state)
+            pruned_state._variables = PrunedVariables(veros_state._variables, passed_variables)
+
+            state_argnum = None
+            pruned_args = list(args)
+            for i, arg in enumerate(args):
+                if arg is veros_state:
+                    state_argnum = i
+                    pruned_args[i] = pruned_state
+
+            try:
+                if donated_variables:
+                    donated_values = {field: vars(veros_state._variables)[field] for field in donated_variables}
+                    return self._donating_function(donated_values, state_argnum, *pruned_args)
+
+                return self.function(*pruned_args)
+            except PrunedVariableAccess as exc:
+                CURRENT_CONTEXT.mpi4jax_token = mpi4jax_token
+
+                if is_retry:
+                    logger.debug(f"Kernel {self.name} accessed unexpected variable {exc}, passing all variables")
+                    self.accessed_variables[key] = None
+                else:
+                    self._record(key, args, veros_state)
+
+        return self.function(*args)
+
+    def _record(self, key, args, veros_state):
+        self.accessed_variables[key], self.donated_variables[key] = self._record_accessed_variables(args, veros_state)
+
     def __repr__(self):
         return f"<{self.__class__.__name__} {self.name} at {hex(id(self))}>"
 
 
+def _get_kernel_output_fields(out):
+    """Names of all variables returned as part of a KernelOutput (possibly nested in a tuple)"""
+    if hasattr(out, "_fields"):
+        return set(out._fields)
+
+    if isinstance(out, (tuple, list)):
+        return set().union(*(_get_kernel_output_fields(elem) for elem in out))
+
+    return set()
+
+
+def _get_donatable_variables(variables, donated_variables):
+    """Skips variables that share their buffer with other variables"""
+    if not donated_variables:
+        return ()
+
+    values = vars(variables)
+    buffer_counts = collections.Counter(id(val) for val in values.values())
+    return tuple(field for field in donated_variables if field in values and buffer_counts[id(values[field])] == 1)
+
+
+def _jit_with_donated_variables(function, static_argnums):
+    """JIT compiles function such that the buffers of the given variables are donated.
+
+    The returned function takes a dict of donated variables and the position of the
+    Veros state as additional first arguments.
+    """
+    import jax
+
+    def call_with_donated_variables(donated_values, state_argnum, *args):
+        args = list(args)
+        state = copy.copy(args[state_argnum])
+        state._variables = state._variables.with_values(donated_values)
+        args[state_argnum] = state
+        return function(*args)
+
+    return jax.jit(
+        call_with_donated_variables,
+        static_argnums=(1, *(argnum + 2 for argnum in static_argnums)),
+        donate_argnums=(0,),
+    )
+
+
 def is_veros_routine(func):
     if isinstance(func, functools.partial):
         func = func.func
@@ -51,12 +51,24 @@ def parse_bool(obj):
     return obj.lower() in {"1", "true", "on"}
 
 
+def parse_optional_path(path):
+    if path is None or path == "":
+        return None
+
+    return os.path.abspath(os.path.expanduser(str(path)))
+
+
 def check_mpi_comm(comm):
     if comm is not None:
+        from veros.local_comm import LocalComm
+
+        if isinstance(comm, LocalComm):
+            return comm
+
         from mpi4py import MPI
 
         if not isinstance(comm, MPI.Comm):
-            raise TypeError("mpi_comm must be Comm instance or None")
+            raise TypeError("mpi_comm must be Comm or LocalComm instance or None")
 
     return comm
 
@@ -79,7 +91,7 @@ def set_log_all_processes(val):
 
 DEVICES = ("cpu", "gpu", "tpu")
 FLOAT_TYPES = ("float64", "float32")
-LINEAR_SOLVERS = ("scipy", "scipy_jax", "petsc", "best")
+LINEAR_SOLVERS = ("scipy", "scipy_jax", "petsc", "multigrid", "distributed", "direct", "best")
 
 
 # settings
@@ -93,6 +105,8 @@ AVAILABLE_SETTINGS = {
     "float_type": RuntimeSetting(parse_choice(FLOAT_TYPES), "float64"),
     "linear_solver": RuntimeSetting(parse_choice(LINEAR_SOLVERS), "best"),
     "petsc_options": RuntimeSetting(str, ""),
+    "direct_solver_max_memory": RuntimeSetting(float, 2048),
+    "projection_vectors": RuntimeSetting(int, 0),
     "monitor_streamfunction_residual": RuntimeSetting(parse_bool, True),
     "num_proc": RuntimeSetting(parse_two_ints, (1, 1), read_from_env=False),
     "profile_mode": RuntimeSetting(parse_bool, False),
@@ -105,6 +119,19 @@ AVAILABLE_SETTINGS = {
     "force_overwrite": RuntimeSetting(bool, False),
     "diskless_mode": RuntimeSetting(bool, False),
     "pyom_compatibility_mode": RuntimeSetting(bool, False),
+    "fused_step": RuntimeSetting(parse_bool, False),
+    "prune_kernel_inputs": RuntimeSetting(parse_bool, True),
+    "check_variable_assignments": RuntimeSetting(parse_bool, False),
+    "grid_metric_max_memory": RuntimeSetting(float, 1024),
+    "inplace_updates": RuntimeSetting(parse_bool, False),
+    "num_threads": RuntimeSetting(int, 1),
+    "cache_dir": RuntimeSetting(parse_optional_path, None),
+    "async_restarts": RuntimeSetting(parse_bool, False),
+    "max_pending_restarts": RuntimeSetting(int, 2),
+    "contiguous_timesteps": RuntimeSetting(parse_bool, False),
+    "compact_wet_columns": RuntimeSetting(parse_bool, False),
+    "tile_size": RuntimeSetting(int, 0),
+    "decomposition_file": RuntimeSetting(parse_optional_path, None),
 }
 
 
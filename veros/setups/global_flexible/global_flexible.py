@@ -10,6 +10,7 @@ from veros.core.utilities import enforce_boundaries
 from veros.core.operators import numpy as npx, update, at
 import veros.tools
 import veros.time
+import veros.distributed
 
 BASE_PATH = os.path.dirname(os.path.realpath(__file__))
 DATA_FILES = veros.tools.get_assets("global_flexible", os.path.join(BASE_PATH, "assets.json"))
@@ -112,7 +113,7 @@ class GlobalFlexibleResolutionSetup(VerosSetup):
             idx = idx[::-1]
 
         kwargs = {}
-        if rst.proc_num > 1:
+        if rst.proc_num > 1 and not veros.distributed.is_local_comm(rs.mpi_comm):
             kwargs.update(
                 driver="mpio",
                 comm=rs.mpi_comm,
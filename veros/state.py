@@ -159,6 +159,8 @@ class StaticDictProxy(Mapping):
 
 
 class VerosSettings(Lockable, StrictContainer):
+    _hash = None
+
     def __init__(self, settings_meta):
         self.__metadata__ = settings_meta
         super().__init__(fields=settings_meta.keys())
@@ -168,18 +170,38 @@ class VerosSettings(Lockable, StrictContainer):
         with self.unlock():
             self.update(default_settings)
 
+    @contextlib.contextmanager
+    def unlock(self):
+        try:
+            with super().unlock():
+                yield
+        finally:
+            self._hash = None
+
     def __setattr__(self, key, val):
         if key.startswith("_") or key not in self.__metadata__:
             return super().__setattr__(key, val)
 
         meta = self.__metadata__[key]
         val = meta.type(val)
+        self._hash = None
         return super().__setattr__(key, val)
 
+    def get_hash(self):
+        """Hash of all setting values (cached until the settings are unlocked again)"""
+        if self._hash is None:
+            self._hash = hash(tuple(self.items()))
+
+        return self._hash
+
 
 class VerosVariables(Lockable, StrictContainer):
     """ """
 
+    # expected dtype of variables whose assignments are not validated (see enable_trusted_mode)
+    __trusted_dtypes__ = None
+    __array_type__ = None
+
     def __init__(self, var_meta, dimensions):
         self.__metadata__ = var_meta
         self.__dimensions__ = dimensions
@@ -214,6 +236,14 @@ class VerosVariables(Lockable, StrictContainer):
         return orig_getattr(attr)
 
     def __setattr__(self, key, val):
+        trusted_dtypes = self.__trusted_dtypes__
+        if trusted_dtypes is not None and type(val) is self.__array_type__ and trusted_dtypes.get(key) == val.dtype:
+            # fast path: skip coercion and shape checks
+            if self.__locked__:
+                return super().__setattr__(key, val)
+
+            return object.__setattr__(self, key, val)
+
         if key.startswith("_") or key not in self.__metadata__:
             return super().__setattr__(key, val)
 
@@ -237,11 +267,138 @@ class VerosVariables(Lockable, StrictContainer):
         if val.shape != expected_shape:
             raise ValueError(f"Got unexpected shape for variable {key} (expected: {expected_shape}, got: {val.shape})")
 
+        if var_mod.uses_contiguous_timesteps(var.dims) and not var_mod.has_contiguous_timesteps(val):
+            val = var_mod.to_contiguous_timesteps(val)
+
         return super().__setattr__(key, val)
 
     def _get_expected_shape(self, dims):
         return var_mod.get_shape(self.__dimensions__, dims)
 
+    def update(self, other=None, **new_fields):
+        trusted_dtypes = self.__trusted_dtypes__
+
+        if trusted_dtypes is not None and hasattr(other, "_fields") and not new_fields:
+            # fast path for kernel outputs (all keys are known to be valid fields)
+            if all(key in trusted_dtypes for key in other._fields):
+                for key, val in zip(other._fields, other):
+                    setattr(self, key, val)
+
+                return self
+
+        return super().update(other, **new_fields)
+
+    def enable_trusted_mode(self):
+        """Skips validation of assignments of backend arrays with the expected dtype.
+
+        Assigned arrays are neither coerced nor checked for the correct shape, so this should only be
+        enabled after the model setup has been validated.
+        """
+        import numpy as onp
+
+        trusted_dtypes = {}
+
+        for key in self.__fields__:
+            var = self.__metadata__[key]
+
+            # these need to be converted on assignment
+            if var_mod.uses_contiguous_timesteps(var.dims):
+                continue
+
+            trusted_dtypes[key] = onp.dtype(var.dtype if var.dtype is not None else rs.float_type)
+
+        self.__array_type__ = type(rst.backend_module.zeros(()))
+        self.__trusted_dtypes__ = trusted_dtypes
+
+
+class PrunedVariableAccess(RuntimeError):
+    """Raised when a kernel accesses a variable that was not passed to it"""
+
+
+class PrunedVariables(VerosVariables):
+    """Subset of the variables of a state, passed to kernels that only access these variables (JAX only)"""
+
+    def __init__(self, parent_variables, fields):
+        for attr in ("__dimensions__", "__metadata__", "__locked__"):
+            object.__setattr__(self, attr, getattr(parent_variables, attr))
+
+        # skip variables that are not active (anymore)
+        parent_values = vars(parent_variables)
+        object.__setattr__(self, "__fields__", tuple(key for key in fields if key in parent_values))
+
+        for key in self.__fields__:
+            object.__setattr__(self, key, parent_values[key])
+
+    def __getattr__(self, attr):
+        if attr in super().__getattribute__("__metadata__"):
+            raise PrunedVariableAccess(attr)
+
+        return super().__getattr__(attr)
+
+    def __setattr__(self, key, val):
+        if key in self.__metadata__ and key not in self.__fields__:
+            raise PrunedVariableAccess(key)
+
+        return super().__setattr__(key, val)
+
+    def with_values(self, values):
+        """Returns a copy that additionally holds the given variables"""
+        new_variables = PrunedVariables(self, self.__fields__)
+        object.__setattr__(new_variables, "__fields__", self.__fields__ + tuple(values))
+
+        for key, val in values.items():
+            object.__setattr__(new_variables, key, val)
+
+        return new_variables
+
+    def update(self, other=None, **new_fields):
+        if hasattr(other, "_fields"):
+            keys = other._fields
+        elif isinstance(other, StrictContainer):
+            keys = other.fields()
+        elif other is not None:
+            keys = other.keys()
+        else:
+            keys = new_fields.keys()
+
+        for key in keys:
+            if key in self.__metadata__ and key not in self.__fields__:
+                raise PrunedVariableAccess(key)
+
+        return super().update(other, **new_fields)
+
+
+class VariableRecorder:
+    """Collects the names of all variables that are accessed through a :class:`RecordingVariables` object"""
+
+    def __init__(self):
+        self.accessed = set()
+
+
+class RecordingVariables(VerosVariables):
+    """Variables that record which of them are read or written (to prune the inputs of kernels)"""
+
+    def __init__(self, parent_variables, recorder):
+        for attr in ("__dimensions__", "__metadata__", "__locked__", "__fields__"):
+            object.__setattr__(self, attr, getattr(parent_variables, attr))
+
+        object.__setattr__(self, "__recorder__", recorder)
+
+        for key in self.__fields__:
+            object.__setattr__(self, key, getattr(parent_variables, key))
+
+    def __getattribute__(self, attr):
+        if not attr.startswith("_"):
+            object.__getattribute__(self, "__recorder__").accessed.add(attr)
+
+        return super().__getattribute__(attr)
+
+    def __setattr__(self, key, val):
+        if not key.startswith("_"):
+            self.__recorder__.accessed.add(key)
+
+        return super().__setattr__(key, val)
+
 
 class DistSafeVariableWrapper(VerosVariables):
     def __init__(self, parent_state, local_variables):
@@ -462,8 +619,7 @@ def veros_state_pytree_flatten(state):
     aux_data = tuple((k, v) for k, v in vars(state).items() if k != "_variables")
 
     # ensure that functions are re-traced when settings change
-    with state.settings.unlock():
-        pseudo_hash = hash(tuple(state.settings.items()))
+    pseudo_hash = state.settings.get_hash()
 
     return ([state.variables], (aux_data, pseudo_hash))
 
@@ -511,6 +667,51 @@ def veros_variables_pytree_unflatten(aux_data, leaves):
     return variables
 
 
+def pruned_variables_pytree_flatten(variables):
+    aux_attrs = ("__dimensions__", "__metadata__", "__locked__")
+    leaves = list(variables.values())
+    aux_data = (tuple(variables.fields()), tuple((attr, getattr(variables, attr)) for attr in aux_attrs))
+    return (leaves, aux_data)
+
+
+def pruned_variables_pytree_unflatten(aux_data, leaves):
+    keys, aux_attrs = aux_data
+
+    # by-pass __init__ and set attributes manually
+    variables = PrunedVariables.__new__(PrunedVariables)
+
+    for key, val in aux_attrs:
+        object.__setattr__(variables, key, val)
+
+    object.__setattr__(variables, "__fields__", keys)
+
+    with variables.unlock():
+        for key, val in zip(keys, leaves):
+            setattr(variables, key, val)
+
+    return variables
+
+
+def recording_variables_pytree_flatten(variables):
+    aux_attrs = ("__dimensions__", "__metadata__", "__locked__", "__fields__", "__recorder__")
+    leaves = [object.__getattribute__(variables, key) for key in object.__getattribute__(variables, "__fields__")]
+    aux_data = tuple((attr, object.__getattribute__(variables, attr)) for attr in aux_attrs)
+    return (leaves, aux_data)
+
+
+def recording_variables_pytree_unflatten(aux_data, leaves):
+    # by-pass __init__ and set attributes manually
+    variables = RecordingVariables.__new__(RecordingVariables)
+
+    for key, val in aux_data:
+        object.__setattr__(variables, key, val)
+
+    for key, val in zip(variables.__fields__, leaves):
+        object.__setattr__(variables, key, val)
+
+    return variables
+
+
 def dist_safe_wrapper_pytree_flatten(variables):
     aux_attrs = (
         "__dimensions__",
@@ -0,0 +1,202 @@
+"""Tiled execution of stencil kernels with the NumPy backend.
+
+The local domain is split into x-y tiles with the same 2-cell overlap as the subdomains of
+distributed runs. Kernels that are correct in distributed runs without exchanging the overlap
+internally give identical results when evaluated tile by tile. Tiles are small enough for their
+temporaries to stay in cache, and they are evaluated concurrently (NumPy releases the GIL).
+"""
+
+import functools
+import contextlib
+
+from veros import runtime_settings
+from veros.routines import CURRENT_CONTEXT, RoutineStack
+from veros.distributed import get_block_slices, SCATTERED_DIMENSIONS
+from veros.variables import get_shape
+
+XY_GRID = ("xt", "yt")
+
+
+def use_tiling():
+    return runtime_settings.backend == "numpy" and runtime_settings.tile_size > 0
+
+
+def in_tile():
+    """Whether the current thread is evaluating a kernel on a single tile"""
+    return getattr(CURRENT_CONTEXT, "in_tile", False)
+
+
+def _split_evenly(n, tile_size):
+    num_tiles = max(1, -(-n // tile_size))
+    bounds = [n * i // num_tiles for i in range(num_tiles + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def get_tiles(nx, ny, tile_size):
+    """Returns (start, size, is_first, is_last) of tiles of roughly tile_size x tile_size cells covering the domain"""
+    xbounds = _split_evenly(nx, tile_size)
+    ybounds = _split_evenly(ny, tile_size)
+
+    tiles = []
+    for iy, (ylower, yupper) in enumerate(ybounds):
+        for ix, (xlower, xupper) in enumerate(xbounds):
+            tiles.append(
+                (
+                    (xlower, ylower),
+                    (xupper - xlower, yupper - ylower),
+                    (ix == 0, iy == 0),
+                    (ix + 1 == len(xbounds), iy + 1 == len(ybounds)),
+                )
+            )
+
+    return tiles
+
+
+def _get_read_slice(dims, tile):
+    # every tile reads its interior plus the full overlap
+    start, size, _, _ = tile
+    return get_block_slices(dims, start, size, (True, True), (True, True), include_overlap=True)[0]
+
+
+def _is_xy_array(arr, xy_shape):
+    shape = getattr(arr, "shape", ())
+    return len(shape) >= 2 and tuple(shape[:2]) == xy_shape
+
+
+class _TileVariables:
+    """View of the state variables restricted to one tile. Variables set by kernels are only stored locally."""
+
+    def __init__(self, variables, var_meta, tile):
+        object.__setattr__(self, "_variables", variables)
+        object.__setattr__(self, "_var_meta", var_meta)
+        object.__setattr__(self, "_tile", tile)
+
+    def __getattr__(self, key):
+        val = getattr(self._variables, key)
+        meta = self._var_meta.get(key)
+
+        if meta is not None and meta.dims and hasattr(val, "shape"):
+            val = val[_get_read_slice(meta.dims, self._tile)]
+
+        self.__dict__[key] = val
+        return val
+
+    def __setattr__(self, key, val):
+        self.__dict__[key] = val
+
+
+class _TileState:
+    def __init__(self, state, tile):
+        _, size, _, _ = tile
+
+        dimensions = dict(state.dimensions)
+        for dims, tile_dim_size in zip(SCATTERED_DIMENSIONS, size):
+            for dim in dims:
+                if dim in dimensions:
+                    dimensions[dim] = tile_dim_size
+
+        self.settings = state.settings
+        self.var_meta = state.var_meta
+        self.dimensions = dimensions
+        self.variables = _TileVariables(state.variables, state.var_meta, tile)
+
+
+@contextlib.contextmanager
+def _tile_context():
+    last_dist_safe = getattr(CURRENT_CONTEXT, "is_dist_safe", True)
+
+    if not hasattr(CURRENT_CONTEXT, "routine_stack"):
+        # fresh worker thread
+        CURRENT_CONTEXT.routine_stack = RoutineStack()
+        CURRENT_CONTEXT.mpi4jax_token = None
+
+    # tiles are local by construction, and dimensions in the tile state are not split between processes
+    CURRENT_CONTEXT.is_dist_safe = False
+    CURRENT_CONTEXT.in_tile = True
+    try:
+        yield
+    finally:
+        CURRENT_CONTEXT.is_dist_safe = last_dist_safe
+        CURRENT_CONTEXT.in_tile = False
+
+
+def _merge_tiles(key, values, tiles, var_meta, xy_shape):
+    import numpy as np
+
+    meta = var_meta.get(key) if key is not None else None
+
+    if meta is not None and meta.dims:
+        dims = meta.dims
+    elif all(_is_xy_array(val, tuple(s + 4 for s in tile[1])) for val, tile in zip(values, tiles)):
+        dims = XY_GRID
+    else:
+        # not gridded, so identical in all tiles
+        return values[0]
+
+    first_val = values[0]
+    out = np.empty(xy_shape + first_val.shape[2:], dtype=first_val.dtype)
+
+    for val, (start, size, is_first, is_last) in zip(values, tiles):
+        global_slice, local_slice = get_block_slices(dims, start, size, is_first, is_last, include_overlap=True)
+        out[global_slice] = val[local_slice]
+
+    out.flags.writeable = False
+    return out
+
+
+def run_tiled(kernel, state, *args, **kwargs):
+    """Evaluates a kernel on every tile of the local domain and assembles the results"""
+    from veros.core.operators import get_thread_pool
+
+    nx, ny = get_shape(state.dimensions, XY_GRID, include_ghosts=False)
+    xy_shape = (nx + 4, ny + 4)
+    tiles = get_tiles(nx, ny, runtime_settings.tile_size)
+
+    def run_tile(tile):
+        read_slice = _get_read_slice(XY_GRID, tile)
+        tile_args = [arg[read_slice] if _is_xy_array(arg, xy_shape) else arg for arg in args]
+        tile_kwargs = {key: val[read_slice] if _is_xy_array(val, xy_shape) else val for key, val in kwargs.items()}
+
+        with _tile_context():
+            return kernel(_TileState(state, tile), *tile_args, **tile_kwargs)
+
+    thread_pool = get_thread_pool()
+    if thread_pool is None or len(tiles) < 2:
+        results = [run_tile(tile) for tile in tiles]
+    else:
+        results = list(thread_pool.map(run_tile, tiles))
+
+    first_result = results[0]
+
+    if hasattr(first_result, "_fields"):
+        # KernelOutput
+        merged = {
+            key: _merge_tiles(key, [getattr(res, key) for res in results], tiles, state.var_meta, xy_shape)
+            for key in first_result._fields
+        }
+        return type(first_result)(**merged)
+
+    if isinstance(first_result, tuple):
+        return tuple(
+            _merge_tiles(None, [res[i] for res in results], tiles, state.var_meta, xy_shape)
+            for i in range(len(first_result))
+        )
+
+    return _merge_tiles(None, results, tiles, state.var_meta, xy_shape)
+
+
+def tiled(kernel):
+    """Evaluates the decorated kernel tile by tile if tiled execution is enabled.
+
+    Only use this for kernels that are correct in distributed runs without exchanging overlap,
+    and that do not compute global reductions.
+    """
+
+    @functools.wraps(kernel, assigned=("__module__", "__name__", "__qualname__", "__doc__"), updated=())
+    def tiled_kernel(state, *args, **kwargs):
+        if not use_tiling() or in_tile():
+            return kernel(state, *args, **kwargs)
+
+        return run_tiled(kernel, state, *args, **kwargs)
+
+    return tiled_kernel
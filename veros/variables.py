@@ -74,6 +74,8 @@ W_GRID = ("xt", "yt", "zw")
 ZETA_GRID = ("xu", "yu", "zt")
 TIMESTEPS = ("timesteps",)
 ISLE = ("isle",)
+WET_COLUMNS = ("wet_columns",)
+WET_COLUMNS_INTERIOR = ("wet_columns_interior",)
 TENSOR_COMP = ("tensor1", "tensor2")
 
 # those are written to netCDF output by default
@@ -92,6 +94,8 @@ DIM_TO_SHAPE_VAR = {
     "tensor1": 2,
     "tensor2": 2,
     "isle": 0,
+    "wet_columns": 0,
+    "wet_columns_interior": 0,
 }
 
 DEFAULT_MASKS = {
@@ -116,6 +120,39 @@ def _get_psi_mask(settings, vs):
     return vs.maskZ[:, :, -1] | ~vs.isle_boundary_mask
 
 
+# time-invariant stencil coefficients mask / (cos * spacing) (see core.utilities.grid_metric),
+# given as (mask, cos, spacing, axis) in order of priority for caching
+GRID_METRICS = {
+    "inv_dx_t": ("maskT", "cost", "dxt", 0),
+    "inv_dy_t": ("maskT", "cost", "dyt", 1),
+    "inv_dx_u": ("maskU", "cost", "dxu", 0),
+    "inv_dy_u": ("maskU", "cost", "dyt", 1),
+    "inv_dx_v": ("maskV", "cosu", "dxt", 0),
+    "inv_dy_v": ("maskV", "cosu", "dyu", 1),
+    "inv_dx_w": ("maskW", "cost", "dxt", 0),
+    "inv_dy_w": ("maskW", "cost", "dyt", 1),
+}
+
+
+def _is_cached_grid_metric(name):
+    """Whether the given grid metric and all metrics of higher priority fit into ``grid_metric_max_memory``"""
+
+    def is_cached(settings):
+        import numpy as onp
+        from veros.distributed import get_max_local_size
+
+        local_size = (get_max_local_size(settings.nx, 0) + 4) * (get_max_local_size(settings.ny, 1) + 4) * settings.nz
+        metric_memory = local_size * onp.dtype(runtime_settings.float_type).itemsize / 1024**2
+        return (list(GRID_METRICS).index(name) + 1) * metric_memory <= runtime_settings.grid_metric_max_memory
+
+    return is_cached
+
+
+def _uses_wet_columns(settings):
+    """Whether column-local kernels only operate on columns that contain water (see core.utilities.get_wet_columns)"""
+    return runtime_settings.compact_wet_columns and runtime_settings.backend == "numpy"
+
+
 def get_fill_value(dtype):
     import numpy as onp
 
@@ -127,21 +164,20 @@ def get_fill_value(dtype):
 
 def get_shape(dimensions, grid, include_ghosts=True, local=True):
     from veros.routines import CURRENT_CONTEXT
-    from veros.distributed import SCATTERED_DIMENSIONS
+    from veros.distributed import SCATTERED_DIMENSIONS, get_local_size
 
     if grid is None:
         return ()
 
-    px, py = runtime_settings.num_proc
     grid_shapes = dict(dimensions)
 
     if local and CURRENT_CONTEXT.is_dist_safe:
-        for pxi, dims in zip((px, py), SCATTERED_DIMENSIONS):
+        for axis, dims in enumerate(SCATTERED_DIMENSIONS):
             for dim in dims:
                 if dim not in grid_shapes:
                     continue
 
-                grid_shapes[dim] = grid_shapes[dim] // pxi
+                grid_shapes[dim] = get_local_size(grid_shapes[dim], axis)
 
     if include_ghosts:
         for d in GHOST_DIMENSIONS:
@@ -162,6 +198,26 @@ def get_shape(dimensions, grid, include_ghosts=True, local=True):
     return tuple(shape)
 
 
+def get_chunk_shape(dimensions, grid):
+    """Chunk shape of a variable in output files. Identical on all processes, even if subdomains differ in size."""
+    from veros.distributed import SCATTERED_DIMENSIONS, get_max_local_size
+
+    chunk_shape = []
+    for grid_dim in grid:
+        if grid_dim not in dimensions:
+            chunk_shape.append(1)
+            continue
+
+        size = dimensions[grid_dim]
+        for axis, dims in enumerate(SCATTERED_DIMENSIONS):
+            if grid_dim in dims:
+                size = get_max_local_size(size, axis)
+
+        chunk_shape.append(size)
+
+    return tuple(chunk_shape)
+
+
 def remove_ghosts(array, dims):
     if dims is None:
         # scalar
@@ -292,6 +348,88 @@ VARIABLES = {
         time_dependent=False,
         dtype="bool",
     ),
+    "inv_dx_t": Variable(
+        "Masked inverse zonal spacing (T)",
+        T_GRID,
+        "1/m",
+        "Zonal metric coefficient maskT / (cost * dxt) of T-cells",
+        time_dependent=False,
+        active=_is_cached_grid_metric("inv_dx_t"),
+    ),
+    "inv_dy_t": Variable(
+        "Masked inverse meridional spacing (T)",
+        T_GRID,
+        "1/m",
+        "Meridional metric coefficient maskT / (cost * dyt) of T-cells",
+        time_dependent=False,
+        active=_is_cached_grid_metric("inv_dy_t"),
+    ),
+    "inv_dx_u": Variable(
+        "Masked inverse zonal spacing (U)",
+        U_GRID,
+        "1/m",
+        "Zonal metric coefficient maskU / (cost * dxu) of U-cells",
+        time_dependent=False,
+        active=_is_cached_grid_metric("inv_dx_u"),
+    ),
+    "inv_dy_u": Variable(
+        "Masked inverse meridional spacing (U)",
+        U_GRID,
+        "1/m",
+        "Meridional metric coefficient maskU / (cost * dyt) of U-cells",
+        time_dependent=False,
+        active=_is_cached_grid_metric("inv_dy_u"),
+    ),
+    "inv_dx_v": Variable(
+        "Masked inverse zonal spacing (V)",
+        V_GRID,
+        "1/m",
+        "Zonal metric coefficient maskV / (cosu * dxt) of V-cells",
+        time_dependent=False,
+        active=_is_cached_grid_metric("inv_dx_v"),
+    ),
+    "inv_dy_v": Variable(
+        "Masked inverse meridional spacing (V)",
+        V_GRID,
+        "1/m",
+        "Meridional metric coefficient maskV / (cosu * dyu) of V-cells",
+        time_dependent=False,
+        active=_is_cached_grid_metric("inv_dy_v"),
+    ),
+    "inv_dx_w": Variable(
+        "Masked inverse zonal spacing (W)",
+        W_GRID,
+        "1/m",
+        "Zonal metric coefficient maskW / (cost * dxt) of W-cells",
+        time_dependent=False,
+        active=_is_cached_grid_metric("inv_dx_w"),
+    ),
+    "inv_dy_w": Variable(
+        "Masked inverse meridional spacing (W)",
+        W_GRID,
+        "1/m",
+        "Meridional metric coefficient maskW / (cost * dyt) of W-cells",
+        time_dependent=False,
+        active=_is_cached_grid_metric("inv_dy_w"),
+    ),
+    "wet_columns": Variable(
+        "Wet columns",
+        WET_COLUMNS,
+        "",
+        "Flat horizontal indices of all columns that contain water",
+        dtype="int32",
+        time_dependent=False,
+        active=_uses_wet_columns,
+    ),
+    "wet_columns_interior": Variable(
+        "Wet interior columns",
+        WET_COLUMNS_INTERIOR,
+        "",
+        "Flat horizontal indices of all columns that contain water, excluding the overlap",
+        dtype="int32",
+        time_dependent=False,
+        active=_uses_wet_columns,
+    ),
     "rho": Variable(
         "Density",
         T_GRID + TIMESTEPS,
@@ -928,6 +1066,34 @@ def manifest_metadata(var_meta, settings):
     return out
 
 
+def uses_contiguous_timesteps(grid):
+    """Whether arrays on the given grid store each time level as a separate contiguous block.
+
+    Such arrays are views with the time axis last, so ``arr[..., vs.tau]`` works as usual,
+    but reads contiguous memory instead of every third element.
+    """
+    return (
+        runtime_settings.contiguous_timesteps
+        and runtime_settings.backend == "numpy"
+        and grid is not None
+        and len(grid) > 1
+        and grid[-1] == TIMESTEPS[0]
+    )
+
+
+def has_contiguous_timesteps(arr):
+    return arr[..., 0].flags.c_contiguous and (arr.shape[-1] == 1 or arr.strides[-1] == arr[..., 0].nbytes)
+
+
+def to_contiguous_timesteps(arr):
+    """Copies an array into a buffer in which each time level (last axis) is contiguous"""
+    import numpy as onp
+
+    out = onp.moveaxis(onp.empty((arr.shape[-1], *arr.shape[:-1]), dtype=arr.dtype), 0, -1)
+    out[...] = arr
+    return out
+
+
 def allocate(dimensions, grid, dtype=None, include_ghosts=True, local=True, fill=0):
     from veros.core.operators import numpy as npx
 
@@ -935,7 +1101,12 @@ def allocate(dimensions, grid, dtype=None, include_ghosts=True, local=True, fill
         dtype = runtime_settings.float_type
 
     shape = get_shape(dimensions, grid, include_ghosts=include_ghosts, local=local)
-    out = npx.full(shape, fill, dtype=dtype)
+
+    if uses_contiguous_timesteps(grid):
+        # time levels first in memory, last in indexing
+        out = npx.moveaxis(npx.full((shape[-1], *shape[:-1]), fill, dtype=dtype), 0, -1)
+    else:
+        out = npx.full(shape, fill, dtype=dtype)
 
     if runtime_settings.backend == "numpy":
         out.flags.writeable = False
@@ -4,7 +4,7 @@ import abc
 from veros import settings, time, signals, distributed, progress, runtime_settings as rs, logger
 from veros.state import get_default_state
 from veros.plugins import load_plugin
-from veros.routines import veros_routine, is_veros_routine
+from veros.routines import veros_routine, veros_kernel, is_veros_routine
 from veros.timer import timer_context
 
 
@@ -41,6 +41,8 @@ class VerosSetup(metaclass=abc.ABCMeta):
 
         self._plugin_interfaces = tuple(load_plugin(p) for p in self.__veros_plugins__)
         self._setup_done = False
+        self._fused_step_kernel = None
+        self._fused_steps_kernel = None
 
         self.state = get_default_state(plugin_interfaces=self._plugin_interfaces)
 
@@ -167,7 +169,7 @@ class VerosSetup(metaclass=abc.ABCMeta):
             raise RuntimeError("setup() method has to be called before running the model")
 
     def setup(self):
-        from veros import diagnostics, restart
+        from veros import diagnostics, restart, decomposition
         from veros.core import numerics, external, isoneutral
 
         setup_funcs = (
@@ -216,6 +218,7 @@ class VerosSetup(metaclass=abc.ABCMeta):
 
             self.set_topography(self.state)
             numerics.calc_topo(self.state)
+            decomposition.log_load_balance(self.state)
 
             self.set_initial_conditions(self.state)
             numerics.calc_initial_conditions(self.state)
@@ -233,12 +236,16 @@ class VerosSetup(metaclass=abc.ABCMeta):
             self.set_forcing(self.state)
             isoneutral.check_isoneutral_slope_crit(self.state)
 
+            # the setup is validated, so assignments during the run do not need to be checked
+            if not rs.check_variable_assignments:
+                self.state.variables.enable_trusted_mode()
+
         self._setup_done = True
 
     @veros_routine
     def step(self, state):
         from veros import diagnostics, restart
-        from veros.core import idemix, eke, tke, momentum, thermodynamics, advection, utilities, isoneutral, numerics
+        from veros.core import isoneutral, numerics
 
         self._ensure_setup_done()
 
@@ -249,53 +256,7 @@ class VerosSetup(metaclass=abc.ABCMeta):
             restart.write_restart(state)
 
         with state.timers["main"]:
-            with state.timers["forcing"]:
-                self.set_forcing(state)
-
-            if state.settings.enable_idemix:
-                with state.timers["idemix"]:
-                    idemix.set_idemix_parameter(state)
-
-            with state.timers["eke"]:
-                eke.set_eke_diffusivities(state)
-
-            with state.timers["tke"]:
-                tke.set_tke_diffusivities(state)
-
-            with state.timers["momentum"]:
-                momentum.momentum(state)
-
-            with state.timers["thermodynamics"]:
-                thermodynamics.thermodynamics(state)
-
-            if settings.enable_eke or settings.enable_tke or settings.enable_idemix:
-                with state.timers["advection"]:
-                    advection.calculate_velocity_on_wgrid(state)
-
-            with state.timers["eke"]:
-                if state.settings.enable_eke:
-                    eke.integrate_eke(state)
-
-            with state.timers["idemix"]:
-                if state.settings.enable_idemix:
-                    idemix.integrate_idemix(state)
-
-            with state.timers["tke"]:
-                if state.settings.enable_tke:
-                    tke.integrate_tke(state)
-
-            with state.timers["boundary_exchange"]:
-                vs.u = utilities.enforce_boundaries(vs.u, settings.enable_cyclic_x)
-                vs.v = utilities.enforce_boundaries(vs.v, settings.enable_cyclic_x)
-                if settings.enable_tke:
-                    vs.tke = utilities.enforce_boundaries(vs.tke, settings.enable_cyclic_x)
-                if settings.enable_eke:
-                    vs.eke = utilities.enforce_boundaries(vs.eke, settings.enable_cyclic_x)
-                if settings.enable_idemix:
-                    vs.E_iw = utilities.enforce_boundaries(vs.E_iw, settings.enable_cyclic_x)
-
-            with state.timers["momentum"]:
-                momentum.vertical_velocity(state)
+            self._main_step(state)
 
         with state.timers["plugins"]:
             for plugin in self._plugin_interfaces:
@@ -321,7 +282,199 @@ class VerosSetup(metaclass=abc.ABCMeta):
         # permutate time indices
         vs.taum1, vs.tau, vs.taup1 = vs.tau, vs.taup1, vs.taum1
 
-    def run(self, show_progress_bar=None):
+    def _main_step(self, state):
+        if rs.fused_step and rs.backend == "jax" and self._fused_step_kernel is not False:
+            self._fused_step(state)
+        else:
+            self._step_core(state)
+
+    def _step_core(self, state):
+        from veros.core import idemix, eke, tke, momentum, thermodynamics, advection, utilities
+
+        vs = state.variables
+        settings = state.settings
+
+        with state.timers["forcing"]:
+            self.set_forcing(state)
+
+        if state.settings.enable_idemix:
+            with state.timers["idemix"]:
+                idemix.set_idemix_parameter(state)
+
+        with state.timers["eke"]:
+            eke.set_eke_diffusivities(state)
+
+        with state.timers["tke"]:
+            tke.set_tke_diffusivities(state)
+
+        with state.timers["momentum"]:
+            momentum.momentum(state)
+
+        with state.timers["thermodynamics"]:
+            thermodynamics.thermodynamics(state)
+
+        if settings.enable_eke or settings.enable_tke or settings.enable_idemix:
+            with state.timers["advection"]:
+                advection.calculate_velocity_on_wgrid(state)
+
+        with state.timers["eke"]:
+            if state.settings.enable_eke:
+                eke.integrate_eke(state)
+
+        with state.timers["idemix"]:
+            if state.settings.enable_idemix:
+                idemix.integrate_idemix(state)
+
+        with state.timers["tke"]:
+            if state.settings.enable_tke:
+                tke.integrate_tke(state)
+
+        with state.timers["boundary_exchange"]:
+            exchange_vars = ["u", "v"]
+            if settings.enable_tke:
+                exchange_vars.append("tke")
+            if settings.enable_eke:
+                exchange_vars.append("eke")
+            if settings.enable_idemix:
+                exchange_vars.append("E_iw")
+
+            # all exchanged variables are replaced by the results
+            exchanged = utilities.enforce_boundaries_many(
+                tuple(getattr(vs, var) for var in exchange_vars), settings.enable_cyclic_x, inplace=True
+            )
+            for var, val in zip(exchange_vars, exchanged):
+                setattr(vs, var, val)
+
+        with state.timers["momentum"]:
+            momentum.vertical_velocity(state)
+
+    def _fused_step(self, state):
+        """Trace forcing, dynamics, thermodynamics, closures and boundary exchange of a time step
+        into a single compiled function (JAX only).
+
+        JAX re-compiles the step whenever the model settings change. If the step cannot be traced
+        (e.g. because :meth:`set_forcing` or the linear solver require concrete values), we fall back
+        to the regular execution path for the rest of the run.
+        """
+        if self._fused_step_kernel is None:
+
+            @veros_kernel
+            def fused_step(state):
+                self._step_core(state)
+                return state.variables
+
+            self._fused_step_kernel = fused_step
+
+        new_variables = self._call_traced(self._fused_step_kernel, state)
+
+        if new_variables is None:
+            self._fused_step_kernel = False
+            self._step_core(state)
+            return
+
+        state.variables.update(new_variables)
+
+    def _quiet_step(self, state):
+        """Advance the model by one time step, without writing restarts, computing diagnostics,
+        or checking for divergence."""
+        vs = state.variables
+        settings = state.settings
+
+        with state.timers["main"]:
+            self._main_step(state)
+
+        with state.timers["plugins"]:
+            for plugin in self._plugin_interfaces:
+                with state.timers[plugin.name]:
+                    plugin.run_entrypoint(state)
+
+        vs.itt = vs.itt + 1
+        vs.time = vs.time + settings.dt_tracer
+
+        self.after_timestep(state)
+
+        vs.taum1, vs.tau, vs.taup1 = vs.tau, vs.taup1, vs.taum1
+
+    @veros_routine
+    def _quiet_steps(self, state, num_steps):
+        """Perform several quiet time steps, in a single compiled loop if possible (JAX only)."""
+        if rs.backend == "jax" and self._fused_steps_kernel is not False:
+            if self._fused_steps_kernel is None:
+                from veros.core.operators import for_loop
+
+                @veros_kernel
+                def fused_steps(state, num_steps):
+                    def loop_body(_, state):
+                        self._quiet_step(state)
+                        return state
+
+                    return for_loop(0, num_steps, loop_body, state).variables
+
+                self._fused_steps_kernel = fused_steps
+
+            new_variables = self._call_traced(self._fused_steps_kernel, state, num_steps)
+
+            if new_variables is not None:
+                state.variables.update(new_variables)
+                return
+
+            self._fused_steps_kernel = False
+
+        for _ in range(num_steps):
+            self._quiet_step(state)
+
+    def _call_traced(self, kernel, *args):
+        """Call a kernel tracing model code, return None if tracing fails."""
+        import jax
+        from veros.routines import CURRENT_CONTEXT
+
+        tracing_errors = (
+            jax.errors.ConcretizationTypeError,
+            jax.errors.TracerArrayConversionError,
+            jax.errors.TracerIntegerConversionError,
+        )
+
+        mpi4jax_token = CURRENT_CONTEXT.mpi4jax_token
+
+        try:
+            return kernel(*args)
+        except tracing_errors as exc:
+            CURRENT_CONTEXT.mpi4jax_token = mpi4jax_token
+            logger.warning(
+                f"Could not trace {kernel.__name__} into a single function, falling back to regular execution "
+                f"({type(exc).__name__})"
+            )
+            return None
+
+    def _steps_until_sync(self, state, max_steps, end_time):
+        """Number of time steps (at most max_steps) until diagnostics, restarts,
+        or the end of the integration need the model state on the host."""
+        import numpy as onp
+
+        vs = state.variables
+        settings = state.settings
+
+        frequencies = [settings.restart_frequency]
+        for diagnostic in state.diagnostics.values():
+            frequencies.extend([diagnostic.sampling_frequency, diagnostic.output_frequency])
+
+        frequencies = [f for f in frequencies if f]
+
+        # mimic time stepping exactly to get the same rounding as in the model
+        current_time = onp.asarray(vs.time)
+
+        for num_steps in range(1, max_steps):
+            current_time = current_time + settings.dt_tracer
+
+            if current_time >= end_time:
+                return num_steps
+
+            if any(current_time % f < settings.dt_tracer for f in frequencies):
+                return num_steps
+
+        return max_steps
+
+    def run(self, show_progress_bar=None, steps_per_call=1):
         """Main routine of the simulation.
 
         Note:
@@ -330,6 +483,10 @@ class VerosSetup(metaclass=abc.ABCMeta):
         Arguments:
             show_progress_bar (:obj:`bool`, optional): Whether to show fancy progress bar via tqdm.
                 By default, only show if stdout is a terminal and Veros is running on a single process.
+            steps_per_call (:obj:`int`, optional): Maximum number of time steps to advance between
+                host synchronizations. Time steps that do not require diagnostics or restart output
+                are grouped into blocks (compiled into a single loop when using JAX). Divergence checks
+                and progress bar updates only happen at the end of each block. Default: 1.
 
         """
         from veros import restart
@@ -352,12 +509,23 @@ class VerosSetup(metaclass=abc.ABCMeta):
         try:
             with signals.signals_to_exception(), pbar:
                 while vs.time - start_time < settings.runlen:
+                    if steps_per_call > 1:
+                        num_steps = self._steps_until_sync(self.state, steps_per_call, start_time + settings.runlen)
+                    else:
+                        num_steps = 1
+
+                    if num_steps > 1:
+                        with self.state.timers["diagnostics"]:
+                            restart.write_restart(self.state)
+
+                        self._quiet_steps(self.state, num_steps - 1)
+
                     self.step(self.state)
 
                     if not timer_context.active:
                         timer_context.active = True
 
-                    pbar.advance_time(settings.dt_tracer)
+                    pbar.advance_time(num_steps * settings.dt_tracer, iterations=num_steps)
 
         except:  # noqa: E722
             logger.critical(f"Stopping integration at iteration {vs.itt}")
@@ -368,6 +536,7 @@ class VerosSetup(metaclass=abc.ABCMeta):
 
         finally:
             restart.write_restart(self.state, force=True)
+            restart.wait_for_restarts()
             self._timing_summary()
 
     def _timing_summary(self):